@@ -3,8 +3,10 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter, SimpleRouter
 
 from pomodorr.auth.auth_views import custom_obtain_jwt_token, custom_refresh_jwt_token, custom_verify_jwt_token
+from pomodorr.exports.api import ExportViewSet
 from pomodorr.frames.api import DateFrameListView
-from pomodorr.projects.api import ProjectViewSet, PriorityViewSet, TaskViewSet, SubTaskViewSet
+from pomodorr.imports.api import ImportJobViewSet
+from pomodorr.projects.api import ProjectViewSet, PriorityViewSet, TaskViewSet, SubTaskViewSet, SearchViewSet
 
 app_name = "api"
 
@@ -18,6 +20,9 @@ router.register(r'projects', ProjectViewSet, basename='project')
 router.register(r'tasks', TaskViewSet, basename='task')
 router.register(r'sub_tasks', SubTaskViewSet, basename='sub_task')
 router.register(r'date_frames', DateFrameListView, basename='date_frame')
+router.register(r'search', SearchViewSet, basename='search')
+router.register(r'export', ExportViewSet, basename='export')
+router.register(r'import', ImportJobViewSet, basename='import')
 
 urlpatterns = router.urls
 
@@ -22,9 +22,18 @@ app.conf.broker_transport_options = {
 
 app.conf.task_queues = (
     Queue('users_tasks', routing_key='pomodorr.users.#', queue_arguments={'x-max-priority': 0}),
-    Queue('frames_tasks', routing_key='pomodorr.frames.#', queue_arguments={'x-max-priority': 10})
+    Queue('frames_tasks', routing_key='pomodorr.frames.#', queue_arguments={'x-max-priority': 10}),
+    Queue('projects_tasks', routing_key='pomodorr.projects.#', queue_arguments={'x-max-priority': 0}),
+    Queue('imports_tasks', routing_key='pomodorr.imports.#', queue_arguments={'x-max-priority': 0})
 )
 
+app.conf.task_routes = {
+    'pomodorr.users.*': {'queue': 'users_tasks'},
+    'pomodorr.frames.*': {'queue': 'frames_tasks'},
+    'pomodorr.projects.*': {'queue': 'projects_tasks'},
+    'pomodorr.imports.*': {'queue': 'imports_tasks'}
+}
+
 app.conf.beat_schedule = {
     'clean-unfinished-date-frames-every-midnight': {
         'task': 'pomodorr.frames.clean_obsolete_date_frames',
@@ -36,9 +45,42 @@ app.conf.beat_schedule = {
             'queue': 'frames_tasks'
         }
     },
-    'unblock-ready-to-unblock-users-every-30-seconds': {
+    # Creates the upcoming monthly partitions of the date frames and detaches the expired ones, once partitioned
+    'maintain-date-frame-partitions-every-day': {
+        'task': 'pomodorr.frames.maintain_date_frame_partitions',
+        'schedule': crontab(
+            hour=1,
+            minute=0
+        ),
+        'options': {
+            'queue': 'frames_tasks'
+        }
+    },
+    'compact-cold-date-frames-every-day': {
+        'task': 'pomodorr.frames.compact_cold_date_frames',
+        'schedule': crontab(
+            hour=2,
+            minute=0
+        ),
+        'options': {
+            'queue': 'frames_tasks'
+        }
+    },
+    # Soft deleted projects and tasks are kept for the retention period only
+    'purge-expired-removed-items-every-day': {
+        'task': 'pomodorr.projects.purge_expired_removed_items',
+        'schedule': crontab(
+            hour=3,
+            minute=0
+        ),
+        'options': {
+            'queue': 'projects_tasks'
+        }
+    },
+    # Users get unblocked by the tasks scheduled when blocking them, this only catches the ones whose task got lost
+    'unblock-ready-to-unblock-users-every-hour': {
         'task': 'pomodorr.users.unblock_users',
-        'schedule': timedelta(seconds=30),
+        'schedule': timedelta(hours=1),
         'options': {
             'queue': 'users_tasks'
         }
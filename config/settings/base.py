@@ -44,7 +44,6 @@ LOCALE_PATHS = [ROOT_DIR.path("locale")]
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
 DATABASES = {"default": env.db("DATABASE_URL")}
-DATABASES["default"]["ATOMIC_REQUESTS"] = True
 
 # CACHES
 # ------------------------------------------------------------------------------
@@ -118,7 +117,9 @@ LOCAL_APPS = [
     "pomodorr.users.apps.UsersConfig",
     "pomodorr.user_settings.apps.UserSettingsConfig",
     "pomodorr.projects.apps.ProjectsConfig",
-    "pomodorr.frames.apps.FramesConfig"
+    "pomodorr.frames.apps.FramesConfig",
+    "pomodorr.exports.apps.ExportsConfig",
+    "pomodorr.imports.apps.ImportsConfig"
 ]
 
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
@@ -176,6 +177,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "pomodorr.tools.middlewares.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.common.BrokenLinkEmailsMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -432,3 +434,64 @@ SWAGGER_SETTINGS = {
 # APP Specific Settings
 
 DATE_FRAME_ERROR_MARGIN = timedelta(minutes=1)
+
+# Distance between two consecutive user_defined_ordering keys assigned during rebalancing. Moving an item picks the
+# midpoint between its new neighbours, so a single position can absorb log2(gap) moves before a rebalance is needed.
+USER_DEFINED_ORDERING_GAP = env.int('USER_DEFINED_ORDERING_GAP', default=1024)
+USER_DEFINED_ORDERING_BATCH_SIZE = env.int('USER_DEFINED_ORDERING_BATCH_SIZE', default=500)
+
+SEARCH_PHRASE_MIN_LENGTH = 3
+SEARCH_RESULTS_LIMIT = env.int('SEARCH_RESULTS_LIMIT', default=20)
+# Number of per user inverted indexes kept in memory by each process when the database has no trigram indexes
+SEARCH_INDEX_MAX_USERS = env.int('SEARCH_INDEX_MAX_USERS', default=100)
+
+# How long the timer settings of users (and the owners of projects) resolved for the tasks stay cached
+TIMER_SETTINGS_CACHE_TIMEOUT = env.int('TIMER_SETTINGS_CACHE_TIMEOUT', default=60 * 60)
+
+# Aliases of the DATABASES which are read replicas of the default one, see pomodorr.tools.routers.ReplicaRouter
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ['pomodorr.tools.routers.ReplicaRouter']
+# How long a user's requests keep reading from the primary database after the user has written to it
+REPLICA_STICKINESS_TIMEOUT = env.int('REPLICA_STICKINESS_TIMEOUT', default=5)
+
+# Default workspace created for every new standard user. The projects refer to their priorities by name, "settings"
+# holds the non default values of the user's settings.
+ONBOARDING_TEMPLATE = {
+    'settings': {},
+    'priorities': [{'name': 'Normal'}],
+    'projects': [{'name': 'Inbox', 'priority': 'Normal'}],
+}
+
+# Square renditions of the avatars generated in the background, keyed by their file extensions in the URLs
+AVATAR_RENDITION_SIZES = [40, 96, 256]
+AVATAR_RENDITION_FORMATS = {'webp': 'WEBP', 'jpeg': 'JPEG'}
+AVATAR_RENDITION_QUALITY = env.int('AVATAR_RENDITION_QUALITY', default=85)
+
+# Number of records fetched at once while streaming the exports
+EXPORT_CHUNK_SIZE = env.int('EXPORT_CHUNK_SIZE', default=2000)
+
+# Number of rows of the imported files validated and inserted at once
+IMPORT_BATCH_SIZE = env.int('IMPORT_BATCH_SIZE', default=1000)
+IMPORT_MAX_REPORTED_ERRORS = 100
+IMPORT_TASK_TIME_LIMIT = env.int('IMPORT_TASK_TIME_LIMIT', default=60 * 60)
+
+# Monthly partitions of the date frames created in advance and the number of past months whose partitions stay
+# attached, None keeps all of them. They apply only once the table is partitioned with partition_date_frames.
+DATE_FRAME_PARTITIONS_AHEAD = env.int('DATE_FRAME_PARTITIONS_AHEAD', default=3)
+DATE_FRAME_PARTITIONS_RETENTION_MONTHS = env.int('DATE_FRAME_PARTITIONS_RETENTION_MONTHS', default=None)
+
+# Finished date frames started this many days ago get folded into per task, per day summaries and archived
+DATE_FRAME_COMPACTION_HORIZON_DAYS = env.int('DATE_FRAME_COMPACTION_HORIZON_DAYS', default=180)
+DATE_FRAME_COMPACTION_BATCH_SIZE = env.int('DATE_FRAME_COMPACTION_BATCH_SIZE', default=5000)
+
+# Obsolete date frames get deleted in batches, with a pause (in seconds) between them to let other writes through
+OBSOLETE_DATE_FRAMES_BATCH_SIZE = env.int('OBSOLETE_DATE_FRAMES_BATCH_SIZE', default=1000)
+OBSOLETE_DATE_FRAMES_BATCH_SLEEP = env.float('OBSOLETE_DATE_FRAMES_BATCH_SLEEP', default=0.1)
+
+# Hard deleted projects, tasks and users get their dependent rows purged in chunks of this size
+PURGE_BATCH_SIZE = env.int('PURGE_BATCH_SIZE', default=5000)
+PURGE_TASK_TIME_LIMIT = env.int('PURGE_TASK_TIME_LIMIT', default=60 * 60)
+
+# Soft deleted projects and tasks get hard deleted this many days after their removal, a batch of them at once
+REMOVED_ITEMS_RETENTION_DAYS = env.int('REMOVED_ITEMS_RETENTION_DAYS', default=30)
+REMOVED_ITEMS_PURGE_BATCH_SIZE = env.int('REMOVED_ITEMS_PURGE_BATCH_SIZE', default=100)
@@ -19,8 +19,29 @@ ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=["pomodorr.tk"])
 # DATABASES
 # ------------------------------------------------------------------------------
 DATABASES["default"] = env.db("DATABASE_URL")  # noqa F405
-DATABASES["default"]["ATOMIC_REQUESTS"] = True  # noqa F405
-DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)  # noqa F405
+# Connections are handed back to the pool (instead of being closed) once they're older than CONN_MAX_AGE, so that
+# executor threads idling between requests don't hold on to them
+DATABASES["default"]["ENGINE"] = "pomodorr.tools.postgresql_pool"  # noqa F405
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=0)  # noqa F405
+DATABASES["default"]["POOL"] = {  # noqa F405
+    "MAX_SIZE": env.int("DATABASE_POOL_MAX_SIZE", default=20),
+    "TIMEOUT": env.int("DATABASE_POOL_TIMEOUT", default=10),
+    "MAX_IDLE_TIME": env.int("DATABASE_POOL_MAX_IDLE_TIME", default=300),
+    # Seconds between the logged usage statistics of each process' pool
+    "STATS_INTERVAL": env.int("DATABASE_POOL_STATS_INTERVAL", default=60),
+}
+
+# Read replicas of the default database, the reads of the API requests get spread across them
+DATABASE_REPLICAS = []
+for index, replica_url in enumerate(env.list("DATABASE_REPLICA_URLS", default=[])):
+    DATABASE_REPLICAS.append(f"replica_{index}")
+    DATABASES[f"replica_{index}"] = {  # noqa F405
+        **env.db_url_config(replica_url),
+        "ENGINE": DATABASES["default"]["ENGINE"],  # noqa F405
+        "CONN_MAX_AGE": DATABASES["default"]["CONN_MAX_AGE"],  # noqa F405
+        "POOL": DATABASES["default"]["POOL"],  # noqa F405
+        "TEST": {"MIRROR": "default"},
+    }
 
 # SECURITY
 # ------------------------------------------------------------------------------
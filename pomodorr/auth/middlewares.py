@@ -3,7 +3,6 @@ from http import cookies
 from channels.auth import AuthMiddlewareStack
 from channels.db import database_sync_to_async
 from django.contrib.auth.models import AnonymousUser
-from django.db import close_old_connections
 
 from pomodorr.auth.auth_classes import CustomJWTWebTokenAuthentication
 
@@ -36,9 +35,7 @@ class JsonTokenAuthMiddlewareInstance(CustomJWTWebTokenAuthentication):
 
     async def __call__(self, receive, send):
         try:
-            # Close old database connections to prevent usage of timed out connections
-            await database_sync_to_async(close_old_connections)()
-
+            # database_sync_to_async closes the old database connections of the executor thread by itself
             self.scope['user'], jwt_value = await database_sync_to_async(
                 JsonWebTokenAuthenticationFromScope().authenticate)(self.scope)
         except Exception as e:
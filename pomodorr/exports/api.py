@@ -0,0 +1,38 @@
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.viewsets import ViewSet
+
+from pomodorr.exports.renderers import CSVRenderer, NDJSONRenderer
+from pomodorr.exports.services import EXPORTS, export_csv, export_ndjson
+
+
+class ExportViewSet(ViewSet):
+    permission_classes = (IsAuthenticated,)
+    renderer_classes = (NDJSONRenderer, CSVRenderer)
+    lookup_field = 'kind'
+    lookup_value_regex = '|'.join(EXPORTS)
+
+    def list(self, request):
+        """
+        Streams all of the user's projects, tasks, sub tasks and date frames as JSON lines, each of them holding the
+        type of the record.
+        """
+        if request.accepted_renderer.format == CSVRenderer.format:
+            raise ValidationError({'format': 'CSV exports contain a single kind of records, pick one of: '
+                                             f'{", ".join(EXPORTS)}.'})
+
+        return StreamingHttpResponse(export_ndjson(user=request.user), content_type=NDJSONRenderer.media_type)
+
+    def retrieve(self, request, kind=None):
+        """
+        Streams a single kind of the user's records, as JSON lines or CSV (with ?format=csv).
+        """
+        if request.accepted_renderer.format == CSVRenderer.format:
+            response = StreamingHttpResponse(export_csv(user=request.user, kind=kind),
+                                             content_type=CSVRenderer.media_type)
+            response['Content-Disposition'] = f'attachment; filename="{kind}.csv"'
+            return response
+
+        return StreamingHttpResponse(export_ndjson(user=request.user, kinds=[kind]),
+                                     content_type=NDJSONRenderer.media_type)
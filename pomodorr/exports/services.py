@@ -0,0 +1,96 @@
+import csv
+import json
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Tuple
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+from pomodorr.frames.selectors.date_frame_selector import (
+    get_all_date_frames_for_user, get_date_frame_summaries_for_user
+)
+from pomodorr.projects.selectors.project_selector import get_active_projects_for_user
+from pomodorr.projects.selectors.sub_task_selector import get_all_sub_tasks_for_user
+from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks_for_user
+
+
+class Export(NamedTuple):
+    record_type: str
+    selector: Callable
+    fields: Tuple[str, ...]
+
+
+EXPORTS = OrderedDict([
+    ('projects', Export('project', get_active_projects_for_user, (
+        'id', 'name', 'priority_id', 'user_defined_ordering', 'created_at'))),
+    ('tasks', Export('task', get_all_non_removed_tasks_for_user, (
+        'id', 'name', 'project_id', 'status', 'priority_id', 'user_defined_ordering', 'pomodoro_number',
+        'pomodoro_length', 'break_length', 'due_date', 'reminder_date', 'repeat_duration', 'note', 'created_at'))),
+    ('sub_tasks', Export('sub_task', get_all_sub_tasks_for_user, (
+        'id', 'name', 'task_id', 'is_completed', 'created_at'))),
+    ('date_frames', Export('date_frame', get_all_date_frames_for_user, (
+        'id', 'task_id', 'frame_type', 'start', 'end', 'duration', 'created', 'modified'))),
+    #  The compaction replaces the cold date frames with their daily summaries, so they are exported along with them
+    ('date_frame_summaries', Export('date_frame_summary', get_date_frame_summaries_for_user, (
+        'id', 'task_id', 'frame_type', 'date', 'start', 'end', 'duration', 'frames_number', 'created', 'modified'))),
+])
+
+_json_encoder = DjangoJSONEncoder()
+
+
+class Echo:
+    #  Lets the csv writer return the written rows instead of buffering them
+    def write(self, value: str) -> str:
+        return value
+
+
+def get_export_querysets(user: AbstractUser, kinds: Iterable[str]) -> List[Tuple[str, QuerySet]]:
+    """
+    Returns the querysets of the exported kinds of the user's records. Their database gets picked right away, because
+    the records are fetched while the response is streamed, after the request has been routed already.
+    """
+    querysets = []
+
+    for kind in kinds:
+        queryset = EXPORTS[kind].selector(user=user).values(*EXPORTS[kind].fields)
+        querysets.append((kind, queryset.using(queryset.db)))
+
+    return querysets
+
+
+def iterate_records(queryset: QuerySet) -> Iterator[dict]:
+    return queryset.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+
+
+def format_csv_value(value) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, (str, int)):
+        return str(value)
+    return _json_encoder.default(value)
+
+
+def export_ndjson(user: AbstractUser, kinds: Iterable[str] = tuple(EXPORTS)) -> Iterator[str]:
+    querysets = get_export_querysets(user=user, kinds=kinds)
+
+    def render() -> Iterator[str]:
+        for kind, queryset in querysets:
+            for record in iterate_records(queryset=queryset):
+                yield json.dumps({'type': EXPORTS[kind].record_type, **record}, cls=DjangoJSONEncoder) + '\n'
+
+    return render()
+
+
+def export_csv(user: AbstractUser, kind: str) -> Iterator[str]:
+    [(kind, queryset)] = get_export_querysets(user=user, kinds=[kind])
+    fields = EXPORTS[kind].fields
+
+    def render() -> Iterator[str]:
+        writer = csv.writer(Echo())
+        yield writer.writerow(fields)
+        for record in iterate_records(queryset=queryset):
+            yield writer.writerow([format_csv_value(record[field]) for field in fields])
+
+    return render()
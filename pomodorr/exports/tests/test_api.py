@@ -0,0 +1,56 @@
+import csv
+import json
+
+import pytest
+from rest_framework import status
+from rest_framework.test import force_authenticate
+
+from pomodorr.exports.api import ExportViewSet
+
+pytestmark = pytest.mark.django_db
+
+
+class TestExportViewSet:
+    base_url = 'api/export/'
+
+    def get_response(self, request_factory, user, kind=None, **query_params):
+        if kind is None:
+            view = ExportViewSet.as_view({'get': 'list'})
+            request = request_factory.get(self.base_url, query_params)
+        else:
+            view = ExportViewSet.as_view({'get': 'retrieve'})
+            request = request_factory.get(f'{self.base_url}{kind}/', query_params)
+
+        force_authenticate(request=request, user=user)
+        return view(request, kind=kind) if kind is not None else view(request)
+
+    def test_export_all_records_as_ndjson(self, request_factory, active_user, sub_task_instance,
+                                          date_frame_create_batch, date_frame_for_random_task):
+        response = self.get_response(request_factory=request_factory, user=active_user)
+        records = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert [record['type'] for record in records] == ['project'] * 2 + ['task', 'sub_task'] + ['date_frame'] * 5
+        assert {record['task_id'] for record in records if record['type'] == 'date_frame'} == {
+            str(sub_task_instance.task_id)}
+
+    def test_export_single_kind_as_csv(self, request_factory, active_user, date_frame_create_batch):
+        response = self.get_response(request_factory=request_factory, user=active_user, kind='date_frames',
+                                     format='csv')
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Disposition'] == 'attachment; filename="date_frames.csv"'
+        assert len(rows) == 5
+        assert {row['id'] for row in rows} == {str(date_frame.id) for date_frame in date_frame_create_batch}
+
+    def test_export_all_records_as_csv_is_rejected(self, request_factory, active_user):
+        response = self.get_response(request_factory=request_factory, user=active_user, format='csv')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_requires_authentication(self, request_factory):
+        response = ExportViewSet.as_view({'get': 'list'})(request_factory.get(self.base_url))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,44 @@
+import json
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from pomodorr.exports.services import export_csv, export_ndjson, format_csv_value
+from pomodorr.frames.services.compaction_service import compact_date_frames
+
+pytestmark = pytest.mark.django_db
+
+
+def test_export_ndjson_fetches_records_in_chunks(active_user, date_frame_create_batch, settings,
+                                                 django_assert_num_queries):
+    settings.EXPORT_CHUNK_SIZE = 2
+    records = export_ndjson(user=active_user, kinds=['date_frames'])
+
+    with django_assert_num_queries(1):  # SQLite fetches the chunks from a single cursor
+        assert len(list(records)) == 5
+
+
+def test_export_ndjson_includes_compacted_date_frames(active_user, date_frame_create_batch):
+    compact_date_frames(horizon=timezone.now() + timedelta(days=365))
+    records = [json.loads(record) for record in export_ndjson(user=active_user)]
+
+    summaries = [record for record in records if record['type'] == 'date_frame_summary']
+    assert [record for record in records if record['type'] == 'date_frame'] == []
+    assert sum(summary['frames_number'] for summary in summaries) == len(date_frame_create_batch)
+
+
+def test_export_csv_writes_header(active_user, project_instance, settings):
+    rows = list(export_csv(user=active_user, kind='projects'))
+
+    assert rows[0] == 'id,name,priority_id,user_defined_ordering,created_at\r\n'
+    assert len(rows) == 3  # The header, the project and the Inbox, onboarded after a whole gap
+    assert rows[1].startswith(f'{project_instance.id},{project_instance.name},')
+    inbox_row = rows[2].split(',')
+    assert (inbox_row[1], inbox_row[3]) == ('Inbox', str(settings.USER_DEFINED_ORDERING_GAP))
+
+
+def test_format_csv_value():
+    assert format_csv_value(None) == ''
+    assert format_csv_value(3) == '3'
+    assert format_csv_value(timedelta(minutes=25)) == 'P0DT00H25M00S'
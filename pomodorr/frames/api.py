@@ -1,25 +1,63 @@
+from django.db.models import BooleanField, Value
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from rest_framework.mixins import ListModelMixin
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from pomodorr.frames.filtersets import DataFrameIsFinishedFilter
-from pomodorr.frames.selectors.date_frame_selector import get_all_date_frames_for_user
-from pomodorr.frames.serializers import DateFrameSerializer
+from pomodorr.frames.models import DateFrame
+from pomodorr.frames.selectors.date_frame_selector import (
+    get_all_date_frames_for_user, get_date_frame_summaries_for_user
+)
+from pomodorr.frames.serializers import DateFrameSerializer, DateFrameSummarySerializer
 from pomodorr.tools.permissions import IsDateFrameOwner
+from pomodorr.tools.filters import FlexFieldsProjectionFilter
+
+MERGED_FIELDS = ('id', 'created', 'duration', 'is_finished')
 
 
 class DateFrameListView(GenericViewSet, ListModelMixin):
     permission_classes = (IsAuthenticated, IsDateFrameOwner)
     serializer_class = DateFrameSerializer
-    filter_backends = [OrderingFilter, DjangoFilterBackend]
+    filter_backends = [OrderingFilter, DjangoFilterBackend, FlexFieldsProjectionFilter]
     ordering_fields = ['created', 'duration', 'is_finished']
     filterset_class = DataFrameIsFinishedFilter
 
-
     def get_queryset(self):
         return get_all_date_frames_for_user(user=self.request.user)
 
     def get_serializer_context(self):
         return dict(request=self.request)
+
+    def list(self, request, *args, **kwargs):
+        """
+        Lists the user's date frames, followed or preceded (depending on the ordering) by the summaries of the ones
+        compacted away. The summaries are represented like date frames, along with the number of folded date frames.
+        """
+        date_frames = self.filter_queryset(self.get_queryset())
+        summaries = self.filterset_class(data=request.query_params, request=request,
+                                         queryset=get_date_frame_summaries_for_user(user=request.user)).qs
+        if not summaries.exists():
+            return super(DateFrameListView, self).list(request, *args, **kwargs)
+
+        ordering = OrderingFilter().get_ordering(request=request, queryset=date_frames, view=self) or \
+            DateFrame._meta.ordering
+        merged_records = date_frames.order_by().values(*MERGED_FIELDS).annotate(
+            is_summary=Value(False, output_field=BooleanField())).union(
+            summaries.order_by().values(*MERGED_FIELDS).annotate(is_summary=Value(True, output_field=BooleanField())),
+            all=True).order_by(*ordering, 'id')
+
+        page = self.paginate_queryset(merged_records)
+        records = list(page if page is not None else merged_records)
+        date_frames_by_id = date_frames.in_bulk([record['id'] for record in records if not record['is_summary']])
+        summaries_by_id = summaries.in_bulk([record['id'] for record in records if record['is_summary']])
+
+        context = self.get_serializer_context()
+        data = [
+            DateFrameSummarySerializer(instance=summaries_by_id[record['id']], context=context).data
+            if record['is_summary'] else self.get_serializer(instance=date_frames_by_id[record['id']]).data
+            for record in records
+        ]
+        return self.get_paginated_response(data) if page is not None else Response(data)
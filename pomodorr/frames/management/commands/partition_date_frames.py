@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from pomodorr.frames.services.partition_service import (
+    is_date_frame_table_partitioned, manage_date_frame_partitions, partition_date_frame_table
+)
+
+
+class Command(BaseCommand):
+    help = 'Partitions the date frame table by month on PostgreSQL, the following months get created in the background.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='Database to partition the table in.')
+
+    def handle(self, *args, **options):
+        using = options['database']
+        if connections[using].vendor != 'postgresql':
+            raise CommandError('Partitioning of the date frame table is supported on PostgreSQL only.')
+
+        if is_date_frame_table_partitioned(using=using):
+            self.stdout.write('The date frame table is already partitioned.')
+        else:
+            partition_date_frame_table(using=using)
+            self.stdout.write(self.style.SUCCESS('Partitioned the date frame table by month.'))
+
+        created_partitions, detached_partitions = manage_date_frame_partitions(using=using)
+        for partition_name in created_partitions:
+            self.stdout.write(f'Created partition {partition_name}.')
+        for partition_name in detached_partitions:
+            self.stdout.write(f'Detached partition {partition_name}.')
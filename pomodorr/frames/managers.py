@@ -14,14 +14,14 @@ class DateFrameManager(models.Manager):
 
 class PomodoroManager(DateFrameManager):
     def get_queryset(self):
-        return super(PomodoroManager, self).get_queryset().filter(type=0)
+        return super(PomodoroManager, self).get_queryset().filter(frame_type=0)
 
 
 class BreakManager(DateFrameManager):
     def get_queryset(self):
-        return super(BreakManager, self).get_queryset().filter(type=1)
+        return super(BreakManager, self).get_queryset().filter(frame_type=1)
 
 
 class PauseManager(DateFrameManager):
     def get_queryset(self):
-        return super(PauseManager, self).get_queryset().filter(type=2)
+        return super(PauseManager, self).get_queryset().filter(frame_type=2)
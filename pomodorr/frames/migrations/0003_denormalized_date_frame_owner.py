@@ -0,0 +1,45 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_date_frame_owners(apps, schema_editor):
+    Task = apps.get_model('projects', 'Task')
+    DateFrame = apps.get_model('frames', 'DateFrame')
+
+    DateFrame._base_manager.update(
+        user_id=Subquery(Task._base_manager.filter(id=OuterRef('task_id')).values('user_id')[:1]))
+
+
+def fire_deferred_constraint_checks(apps, schema_editor):
+    #  The backfill leaves pending checks of the deferrable foreign key, PostgreSQL refuses to alter the table until
+    #  they have fired
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('projects', '0005_denormalized_task_owner'),
+        ('frames', '0002_auto_20200430_1539'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dateframe',
+            name='user',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='date_frames', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(fill_date_frame_owners, migrations.RunPython.noop),
+        migrations.RunPython(fire_deferred_constraint_checks, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='dateframe',
+            name='user',
+            field=models.ForeignKey(blank=True, editable=False, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='date_frames', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.0.7 on 2026-10-19 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frames', '0003_denormalized_date_frame_owner'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dateframe',
+            index=models.Index(fields=['task', 'created'], name='date_frame_task_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dateframe',
+            index=models.Index(condition=models.Q(end__isnull=True), fields=['task'], name='date_frame_task_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dateframe',
+            index=models.Index(fields=['user', 'created'], name='date_frame_user_created_idx'),
+        ),
+    ]
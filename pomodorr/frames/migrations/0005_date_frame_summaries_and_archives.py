@@ -0,0 +1,66 @@
+# Generated by Django 3.0.7 on 2026-10-19 08:44
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import pomodorr.frames.models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_selector_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('frames', '0004_selector_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DateFrameSummary',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date', models.DateField(verbose_name='date')),
+                ('start', models.DateTimeField(verbose_name='start')),
+                ('end', models.DateTimeField(verbose_name='end')),
+                ('duration', models.DurationField(verbose_name='duration')),
+                ('frame_type', models.SmallIntegerField(choices=[(0, 'pomodoro'), (1, 'break'), (2, 'pause')])),
+                ('frames_number', models.PositiveIntegerField(verbose_name='frames number')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='frame_summaries', to='projects.Task')),
+                ('user', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='date_frame_summaries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Date frame summary',
+                'verbose_name_plural': 'Date frame summaries',
+                'ordering': ('created',),
+            },
+        ),
+        migrations.CreateModel(
+            name='DateFrameArchive',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('file', models.FileField(upload_to=pomodorr.frames.models.date_frame_archive_path, verbose_name='file')),
+                ('frames_number', models.PositiveIntegerField(verbose_name='frames number')),
+                ('start', models.DateTimeField(verbose_name='start')),
+                ('end', models.DateTimeField(verbose_name='end')),
+                ('user', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='date_frame_archives', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('created',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='dateframesummary',
+            index=models.Index(fields=['user', 'created'], name='date_frame_summary_user_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='dateframesummary',
+            constraint=models.UniqueConstraint(fields=('task', 'frame_type', 'date'), name='unique_date_frame_summary'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.0.7 on 2026-10-19 08:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frames', '0005_date_frame_summaries_and_archives'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dateframe',
+            index=models.Index(condition=models.Q(end__isnull=True), fields=['start'], name='date_frame_open_start_idx'),
+        ),
+    ]
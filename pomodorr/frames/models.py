@@ -4,10 +4,12 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.files import storage
 from django.db import models
 from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from model_utils import FieldTracker
 from model_utils.models import TimeFramedModel, TimeStampedModel
 
 from pomodorr.frames.exceptions import DateFrameException as DFE
@@ -33,8 +35,12 @@ class DateFrame(TimeStampedModel):
     frame_type = models.SmallIntegerField(blank=False, null=False, choices=TYPE_CHOICES)
     task = models.ForeignKey(to='projects.Task', null=False, blank=False, on_delete=models.CASCADE,
                              related_name='frames')
+    #  Denormalized owner of the task, so that the date frames can be filtered by their owners without any joins
+    user = models.ForeignKey(to='users.User', null=False, blank=True, editable=False, on_delete=models.CASCADE,
+                             related_name='date_frames')
 
     objects = DateFrameManager()
+    tracker = FieldTracker(fields=['task_id'])
 
     def __str__(self):
         return f'{self.get_frame_type_display()}: {"finished" if self.start and self.end else "started"}'
@@ -45,14 +51,49 @@ class DateFrame(TimeStampedModel):
         verbose_name_plural = _('Date frames')
         indexes = [
             models.Index(fields=['start', 'end'], condition=Q(start__isnull=False) & Q(end__isnull=False),
-                         name='start_end_idx')
+                         name='start_end_idx'),
+            models.Index(fields=['task', 'created'], name='date_frame_task_created_idx'),
+            models.Index(fields=['task'], condition=Q(end__isnull=True), name='date_frame_task_open_idx'),
+            models.Index(fields=['start'], condition=Q(end__isnull=True), name='date_frame_open_start_idx'),
+            models.Index(fields=['user', 'created'], name='date_frame_user_created_idx')
         ]
 
     def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
-        self.clean_fields()
-        self.full_clean()
+        if self.task_id is not None and (self.user_id is None or self.tracker.has_changed('task_id')):
+            self.user_id = self.task.user_id
+            if update_fields is not None:
+                update_fields = {*update_fields, 'user'}
+
+        if update_fields is not None:
+            update_fields = self.clean_updated_fields(update_fields=update_fields)
+        else:
+            #  Inserted rows get fresh primary keys, a duplicate one would be rejected by the database anyway
+            self.full_clean(validate_unique=not force_insert)
         return super(DateFrame, self).save(force_insert, force_update, using, update_fields)
 
+    def clean_updated_fields(self, update_fields) -> set:
+        """
+        Validates only the given fields and runs only the checks depending on them, instead of the whole full_clean.
+
+        :return: set of fields that should be written, including the ones recalculated on the way
+        """
+        update_fields = set(update_fields) | {'modified'}
+        self.clean_fields(exclude=[field.name for field in self._meta.concrete_fields
+                                   if field.name not in update_fields])
+
+        if update_fields & {'start', 'end'} and self.start and self.end:
+            self.duration = self.normalized_duration
+            update_fields.add('duration')
+            self.check_start_greater_than_end()
+
+        #  Completed tasks don't accept any changes of their date frames
+        self.check_task_is_already_completed()
+
+        if update_fields & {'start', 'end', 'frame_type', 'task'}:
+            self.check_date_frame_duration_fits_error_margin()
+
+        return update_fields
+
     def clean(self):
         if self.start and self.end:
             self.duration = self.normalized_duration
@@ -71,12 +112,13 @@ class DateFrame(TimeStampedModel):
             raise ValidationError({'start': DFE.messages[DFE.start_greater_than_end]}, code=DFE.start_greater_than_end)
 
     def check_task_is_already_completed(self):
-        if self.task and self.task.status == self.task.__class__.status_completed:
+        if self.task_id is not None and self.task.status == self.task.__class__.status_completed:
             raise ValidationError({'__all__': DFE.messages[DFE.task_already_completed]},
                                   code=DFE.task_already_completed)
 
     def check_date_frame_duration_fits_error_margin(self):
-        if self.start and self.end and self.frame_type in {self.pomodoro_type, self.break_type}:
+        if self.start and self.end and self.task_id is not None and \
+                self.frame_type in {self.pomodoro_type, self.break_type}:
             duration_difference = self.duration - self.normalized_date_frame_length
             if self.frame_type == self.pomodoro_type:
                 if duration_difference > settings.DATE_FRAME_ERROR_MARGIN:
@@ -129,3 +171,56 @@ class Pause(DateFrame):
 
     class Meta:
         proxy = True
+
+
+def date_frame_archive_path(instance, filename):
+    return "date_frame_archives/{0}/{1}".format(instance.user_id, storage.get_valid_filename(filename))
+
+
+class DateFrameSummary(TimeStampedModel):
+    """
+    Finished date frames of a task and a type started on the same day, folded together once they are older than the
+    compaction horizon. "created" is the one of the earliest folded date frame, "start" and "end" span all of them.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    date = models.DateField(_('date'))
+    start = models.DateTimeField(_('start'))
+    end = models.DateTimeField(_('end'))
+    duration = models.DurationField(_('duration'))
+    frame_type = models.SmallIntegerField(choices=DateFrame.TYPE_CHOICES)
+    frames_number = models.PositiveIntegerField(_('frames number'))
+    task = models.ForeignKey(to='projects.Task', null=False, blank=False, on_delete=models.CASCADE,
+                             related_name='frame_summaries')
+    user = models.ForeignKey(to='users.User', null=False, blank=False, editable=False, on_delete=models.CASCADE,
+                             related_name='date_frame_summaries')
+
+    class Meta:
+        ordering = ('created',)
+        verbose_name = _('Date frame summary')
+        verbose_name_plural = _('Date frame summaries')
+        constraints = [
+            models.UniqueConstraint(fields=['task', 'frame_type', 'date'], name='unique_date_frame_summary')
+        ]
+        indexes = [
+            models.Index(fields=['user', 'created'], name='date_frame_summary_user_idx')
+        ]
+
+    def __str__(self):
+        return f'{self.get_frame_type_display()}: {self.frames_number} on {self.date}'
+
+
+class DateFrameArchive(TimeStampedModel):
+    #  Compressed JSON Lines file with the raw date frames removed by a single compaction
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    file = models.FileField(_('file'), upload_to=date_frame_archive_path)
+    frames_number = models.PositiveIntegerField(_('frames number'))
+    start = models.DateTimeField(_('start'))
+    end = models.DateTimeField(_('end'))
+    user = models.ForeignKey(to='users.User', null=False, blank=False, editable=False, on_delete=models.CASCADE,
+                             related_name='date_frame_archives')
+
+    class Meta:
+        ordering = ('created',)
+
+    def __str__(self):
+        return f'{self.frames_number} date frames of {self.user_id}'
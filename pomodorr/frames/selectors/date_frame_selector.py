@@ -2,7 +2,8 @@ from datetime import datetime
 from uuid import UUID
 
 from django.contrib.auth.base_user import AbstractBaseUser
-from django.db.models import Q
+from django.db.models import IntegerField, Q, Value
+from django.utils import timezone
 
 from pomodorr.frames import models
 from pomodorr.tools.utils import get_time_delta
@@ -13,11 +14,11 @@ def get_all_date_frames(**kwargs):
 
 
 def get_all_date_frames_for_user(user: AbstractBaseUser, **kwargs):
-    return models.DateFrame.objects.filter(task__project__user=user, **kwargs)
+    return models.DateFrame.objects.filter(user=user, **kwargs)
 
 
 def get_finished_date_frames_for_user(user: AbstractBaseUser, **kwargs):
-    return models.DateFrame.objects.filter(is_finished=True, task__project__user=user, **kwargs)
+    return models.DateFrame.objects.filter(is_finished=True, user=user, **kwargs)
 
 
 def get_finished_date_frames_for_task(task, **kwargs):
@@ -38,8 +39,8 @@ def get_breaks_inside_date_frame(date_frame_object, end=None):
     if end is None:
         return models.DateFrame.objects.none()
 
-    return models.DateFrame.objects.filter(task=date_frame_object.task, start__gt=date_frame_object.start, end__lt=end,
-                                           frame_type=models.DateFrame.break_type)
+    return models.DateFrame.objects.filter(task_id=date_frame_object.task_id, start__gt=date_frame_object.start,
+                                           end__lt=end, frame_type=models.DateFrame.break_type)
 
 
 def get_pauses_inside_date_frame(date_frame_object, end=None):
@@ -48,8 +49,12 @@ def get_pauses_inside_date_frame(date_frame_object, end=None):
     if end is None:
         return models.DateFrame.objects.none()
 
-    return models.DateFrame.objects.filter(start__gt=date_frame_object.start, end__lt=end,
-                                           frame_type=models.DateFrame.pause_type)
+    return models.DateFrame.objects.filter(task_id=date_frame_object.task_id, start__gt=date_frame_object.start,
+                                           end__lt=end, frame_type=models.DateFrame.pause_type)
+
+
+def get_date_frames_in_progress(**kwargs):
+    return models.DateFrame.objects.filter(end__isnull=True, **kwargs)
 
 
 def get_latest_date_frame_in_progress_for_task(task_id: UUID, **kwargs):
@@ -58,7 +63,7 @@ def get_latest_date_frame_in_progress_for_task(task_id: UUID, **kwargs):
 
 
 def get_colliding_date_frame_for_task(task_id: UUID, date: datetime, excluded_id: UUID = None):
-    colliding_date_frame = models.DateFrame.objects.filter(
+    colliding_date_frame = models.DateFrame.objects.select_related('task').filter(
         Q(task__id=task_id) & (
             (Q(start__lt=date) & Q(end__isnull=True)) |
             (Q(start__lt=date) & Q(end__gt=date))
@@ -69,6 +74,24 @@ def get_colliding_date_frame_for_task(task_id: UUID, date: datetime, excluded_id
         return colliding_date_frame
 
 
-def get_obsolete_date_frames():
-    #  Returns date frames that have been created at least one week ago
-    return models.DateFrame.objects.filter(is_finished=False, start__date__lt=get_time_delta({'days': 7}, ahead=False))
+def get_obsolete_date_frames(**kwargs):
+    #  Returns date frames in progress started before the day a week ago, the lookups are served by the partial
+    #  date_frame_open_start_idx index instead of evaluating the annotations and the dates of all rows
+    week_ago = timezone.localtime(get_time_delta({'days': 7}, ahead=False))
+    return models.DateFrame.objects.filter(
+        end__isnull=True, start__lt=week_ago.replace(hour=0, minute=0, second=0, microsecond=0), **kwargs)
+
+
+def get_compactable_date_frames(horizon: datetime, **kwargs):
+    #  Finished date frames started before the compaction horizon, which get folded into the summaries
+    return models.DateFrame.objects.filter(start__lt=horizon, end__isnull=False, **kwargs)
+
+
+def get_date_frame_summaries_for_user(user: AbstractBaseUser, **kwargs):
+    #  The summaries only hold finished date frames, the annotation lets them be filtered along with the date frames
+    return models.DateFrameSummary.objects.filter(user=user, **kwargs).annotate(
+        is_finished=Value(1, output_field=IntegerField()))
+
+
+def get_date_frame_summaries_for_tasks(user_id: UUID, task_ids, dates, **kwargs):
+    return models.DateFrameSummary.objects.filter(user_id=user_id, task_id__in=task_ids, date__in=dates, **kwargs)
@@ -1,14 +1,25 @@
+from rest_flex_fields.serializers import FlexFieldsSerializerMixin
 from rest_framework.serializers import ModelSerializer
 
-from pomodorr.frames.models import DateFrame
+from pomodorr.frames.models import DateFrame, DateFrameSummary
 
 
-class DateFrameSerializer(ModelSerializer):
+class DateFrameSerializer(FlexFieldsSerializerMixin, ModelSerializer):
     class Meta:
         model = DateFrame
         fields = ('id', 'created', 'modified', 'start', 'end', 'duration', 'frame_type')
+        expandable_fields = {
+            'task': ('pomodorr.projects.serializers.TaskSerializer', {'fields': ['id', 'name', 'status']})
+        }
 
     def to_representation(self, instance):
         data = super(DateFrameSerializer, self).to_representation(instance=instance)
-        data['frame_type'] = instance.get_frame_type_display()
+        if 'frame_type' in data:
+            data['frame_type'] = instance.get_frame_type_display()
         return data
+
+
+class DateFrameSummarySerializer(DateFrameSerializer):
+    class Meta(DateFrameSerializer.Meta):
+        model = DateFrameSummary
+        fields = (*DateFrameSerializer.Meta.fields, 'frames_number')
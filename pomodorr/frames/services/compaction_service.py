@@ -0,0 +1,124 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from pomodorr.frames.models import DateFrame, DateFrameArchive, DateFrameSummary
+from pomodorr.frames.selectors.date_frame_selector import (
+    get_compactable_date_frames, get_date_frame_summaries_for_tasks
+)
+from pomodorr.tools.routers import pin_owners_to_primary
+
+ARCHIVED_FIELDS = ('id', 'task_id', 'frame_type', 'start', 'end', 'duration', 'created', 'modified')
+SUMMARY_UPDATE_FIELDS = ('start', 'end', 'duration', 'frames_number', 'created', 'modified')
+
+
+def get_compaction_horizon() -> datetime:
+    return timezone.now() - timedelta(days=settings.DATE_FRAME_COMPACTION_HORIZON_DAYS)
+
+
+def summarize_date_frames(user_id: UUID, date_frames: List[dict]) -> Dict[Tuple, DateFrameSummary]:
+    #  Summaries keyed by the task, the type and the day the date frames have started on
+    summaries = {}
+
+    for date_frame in date_frames:
+        key = (date_frame['task_id'], date_frame['frame_type'], timezone.localdate(date_frame['start']))
+        duration = date_frame['duration'] if date_frame['duration'] is not None else \
+            date_frame['end'] - date_frame['start']
+
+        if key in summaries:
+            merge_summaries(summary=summaries[key], start=date_frame['start'], end=date_frame['end'],
+                            duration=duration, frames_number=1, created=date_frame['created'])
+        else:
+            summaries[key] = DateFrameSummary(
+                user_id=user_id, task_id=key[0], frame_type=key[1], date=key[2], start=date_frame['start'],
+                end=date_frame['end'], duration=duration, frames_number=1, created=date_frame['created'])
+
+    return summaries
+
+
+def merge_summaries(summary: DateFrameSummary, start: datetime, end: datetime, duration: timedelta,
+                    frames_number: int, created: datetime) -> None:
+    summary.start = min(summary.start, start)
+    summary.end = max(summary.end, end)
+    summary.duration += duration
+    summary.frames_number += frames_number
+    summary.created = min(summary.created, created)
+
+
+def save_summaries(user_id: UUID, summaries: Dict[Tuple, DateFrameSummary]) -> None:
+    """
+    Stores the new summaries, the ones of the days which have already been compacted (date frames started long ago
+    can still be added later on) get merged into the existing rows.
+    """
+    existing_summaries = {
+        (summary.task_id, summary.frame_type, summary.date): summary
+        for summary in get_date_frame_summaries_for_tasks(
+            user_id=user_id, task_ids={key[0] for key in summaries}, dates={key[2] for key in summaries})
+    }
+    new_summaries, updated_summaries = [], []
+    now = timezone.now()
+
+    for key, summary in summaries.items():
+        if key in existing_summaries:
+            existing_summary = existing_summaries[key]
+            merge_summaries(summary=existing_summary, start=summary.start, end=summary.end, duration=summary.duration,
+                            frames_number=summary.frames_number, created=summary.created)
+            existing_summary.modified = now
+            updated_summaries.append(existing_summary)
+        else:
+            summary.modified = now
+            new_summaries.append(summary)
+
+    DateFrameSummary.objects.bulk_create(new_summaries)
+    DateFrameSummary.objects.bulk_update(updated_summaries, fields=SUMMARY_UPDATE_FIELDS)
+
+
+def archive_date_frames(user_id: UUID, date_frames: List[dict]) -> DateFrameArchive:
+    content = ''.join(json.dumps(date_frame, cls=DjangoJSONEncoder) + '\n' for date_frame in date_frames)
+    archive = DateFrameArchive(user_id=user_id, frames_number=len(date_frames),
+                               start=min(date_frame['start'] for date_frame in date_frames),
+                               end=max(date_frame['end'] for date_frame in date_frames))
+    #  The file gets stored by the default storage, which is S3 in production
+    archive.file.save(f'{archive.id}.jsonl.gz', ContentFile(gzip.compress(content.encode())), save=False)
+    archive.save()
+    return archive
+
+
+def compact_date_frames_for_user(user_id: UUID, horizon: datetime = None, batch_size: int = None) -> int:
+    """
+    Folds the user's finished date frames started before the horizon into the per task, per day summaries and moves
+    the raw rows into compressed archive files, batch by batch. Returns the number of compacted date frames.
+    """
+    horizon = horizon if horizon is not None else get_compaction_horizon()
+    batch_size = batch_size or settings.DATE_FRAME_COMPACTION_BATCH_SIZE
+    compacted = 0
+
+    while True:
+        with transaction.atomic():
+            date_frames = list(get_compactable_date_frames(horizon=horizon, user_id=user_id).select_for_update(
+            ).order_by('start', 'id').values(*ARCHIVED_FIELDS)[:batch_size])
+            if not date_frames:
+                if compacted:
+                    pin_owners_to_primary(user_ids=[user_id])
+                return compacted
+
+            archive_date_frames(user_id=user_id, date_frames=date_frames)
+            save_summaries(user_id=user_id, summaries=summarize_date_frames(user_id=user_id, date_frames=date_frames))
+            DateFrame.objects.filter(id__in=[date_frame['id'] for date_frame in date_frames]).delete()
+
+        compacted += len(date_frames)
+
+
+def compact_date_frames(horizon: datetime = None) -> int:
+    horizon = horizon if horizon is not None else get_compaction_horizon()
+    user_ids = get_compactable_date_frames(horizon=horizon).order_by().values_list('user_id', flat=True).distinct()
+
+    return sum(compact_date_frames_for_user(user_id=user_id, horizon=horizon) for user_id in list(user_ids))
@@ -1,16 +1,43 @@
+import time
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
 from pomodorr.frames.models import DateFrame
 from pomodorr.frames.selectors.date_frame_selector import (
-    get_colliding_date_frame_for_task, get_latest_date_frame_in_progress_for_task)
+    get_colliding_date_frame_for_task, get_latest_date_frame_in_progress_for_task, get_date_frames_in_progress,
+    get_obsolete_date_frames)
 from pomodorr.projects.signals.dispatchers import notify_force_finish
-
-
-def force_finish_date_frame(task_id: UUID = None, date_frame: DateFrame = None, notify: bool = True) -> DateFrame:
+from pomodorr.tools.routers import pin_owners_to_primary
+
+
+def close_date_frame(date_frame: DateFrame, end: datetime) -> bool:
+    """
+    Finishes the date frame with a conditional UPDATE, which only matches the row while it is still in progress.
+    Concurrent finishes cannot overwrite each other, only the one which has actually finished the date frame gets
+    True returned, the other ones leave the row untouched.
+    """
+    date_frame.end = end
+    date_frame.modified = timezone.now()
+    update_fields = date_frame.clean_updated_fields(update_fields=['end'])
+
+    updated_rows = get_date_frames_in_progress(id=date_frame.id).update(
+        **{field: getattr(date_frame, field) for field in update_fields})
+    if updated_rows:
+        pin_owners_to_primary(user_ids=[date_frame.user_id])
+    return updated_rows == 1
+
+
+def force_finish_date_frame(task_id: UUID = None, date_frame: DateFrame = None,
+                            notify: bool = True) -> Optional[DateFrame]:
+    """
+    Finishes the given date frame, or the latest one in progress of the task, at its estimated end at the latest.
+    Returns None when there is no date frame in progress, or when another finish has won the race for it.
+    """
     end = timezone.now()
 
     with transaction.atomic():
@@ -18,11 +45,8 @@ def force_finish_date_frame(task_id: UUID = None, date_frame: DateFrame = None,
             date_frame = get_latest_date_frame_in_progress_for_task(task_id=task_id)
 
         if date_frame is not None:
-            if end > date_frame.estimated_date_frame_end:
-                date_frame.end = date_frame.estimated_date_frame_end
-            else:
-                date_frame.end = end
-            date_frame.save()
+            if not close_date_frame(date_frame=date_frame, end=min(end, date_frame.estimated_date_frame_end)):
+                return None
 
             if date_frame.frame_type == DateFrame.pause_type:
                 finish_related_pomodoro(date_frame=date_frame)
@@ -37,7 +61,7 @@ def finish_colliding_date_frame(task_id: UUID, date: datetime, excluded_id: UUID
     colliding_date_frame = get_colliding_date_frame_for_task(task_id=task_id, date=date, excluded_id=excluded_id)
 
     if colliding_date_frame is not None and colliding_date_frame.end is None:
-        finish_date_frame(date_frame_id=colliding_date_frame.id)
+        close_date_frame(date_frame=colliding_date_frame, end=date)
 
 
 def finish_date_frame(date_frame_id: UUID) -> DateFrame:
@@ -45,15 +69,19 @@ def finish_date_frame(date_frame_id: UUID) -> DateFrame:
 
     with transaction.atomic():
         try:
-            date_frame = DateFrame.objects.get(id=date_frame_id)
+            date_frame = DateFrame.objects.select_related('task').get(id=date_frame_id)
         except DateFrame.DoesNotExist:
             raise
         else:
+            if date_frame.end is not None:
+                return date_frame
+
             if date_frame.frame_type in [DateFrame.pomodoro_type, DateFrame.break_type]:
-                finish_colliding_date_frame(task_id=date_frame.task.id, date=end, excluded_id=date_frame_id)
+                finish_colliding_date_frame(task_id=date_frame.task_id, date=end, excluded_id=date_frame_id)
 
-            date_frame.end = end
-            date_frame.save()
+            if not close_date_frame(date_frame=date_frame, end=end):
+                #  Somebody else has finished it in the meantime, their end is the one that counts
+                date_frame.refresh_from_db()
             return date_frame
 
 
@@ -68,7 +96,7 @@ def finish_related_pomodoro(date_frame: DateFrame) -> None:
     except DateFrame.DoesNotExist:
         pass
     else:
-        finish_date_frame(date_frame_id=previous_date_frame.id)
+        close_date_frame(date_frame=previous_date_frame, end=timezone.now())
 
 
 def start_date_frame(task_id: UUID, frame_type: int) -> DateFrame:
@@ -78,9 +106,33 @@ def start_date_frame(task_id: UUID, frame_type: int) -> DateFrame:
         if frame_type in [DateFrame.pomodoro_type, DateFrame.break_type]:
             finish_colliding_date_frame(task_id=task_id, date=start)
 
-        new_date_frame = DateFrame.objects.create(
+        new_date_frame = DateFrame(
             start=start,
             frame_type=frame_type,
             task_id=task_id
         )
+        new_date_frame.save(force_insert=True)
         return new_date_frame
+
+
+def delete_obsolete_date_frames(batch_size: int = None, sleep: float = None) -> int:
+    """
+    Deletes the obsolete date frames in batches of ids, each one being a short statement of its own, pausing between
+    them so that the table isn't locked for the whole cleanup. Returns the number of deleted date frames.
+    """
+    batch_size = batch_size or settings.OBSOLETE_DATE_FRAMES_BATCH_SIZE
+    sleep = sleep if sleep is not None else settings.OBSOLETE_DATE_FRAMES_BATCH_SLEEP
+    deleted = 0
+    user_ids = set()
+
+    while True:
+        date_frame_rows = list(get_obsolete_date_frames().order_by().values_list('id', 'user_id')[:batch_size])
+        date_frame_ids = [date_frame_id for date_frame_id, user_id in date_frame_rows]
+        if date_frame_ids:
+            #  Nothing depends on the date frames, so the collector deletes them without fetching the rows
+            deleted += DateFrame.objects.filter(id__in=date_frame_ids).delete()[0]
+            user_ids.update(user_id for date_frame_id, user_id in date_frame_rows)
+        if len(date_frame_ids) < batch_size:
+            pin_owners_to_primary(user_ids=user_ids)
+            return deleted
+        time.sleep(sleep)
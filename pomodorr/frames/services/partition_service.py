@@ -0,0 +1,184 @@
+import re
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from pomodorr.frames.models import DateFrame
+
+DATE_FRAME_TABLE = DateFrame._meta.db_table
+MONTHLY_PARTITION_NAME = DATE_FRAME_TABLE + '_y{year}m{month:02d}'
+DEFAULT_PARTITION_NAME = f'{DATE_FRAME_TABLE}_default'
+LEGACY_PARTITION_NAME = f'{DATE_FRAME_TABLE}_legacy'
+
+PARTITION_UPPER_BOUND_PATTERN = re.compile(r"TO \('([^']+)'\)")
+
+
+def add_months(month: date, months: int) -> date:
+    month_index = month.year * 12 + month.month - 1 + months
+    return date(year=month_index // 12, month=month_index % 12 + 1, day=1)
+
+
+def get_month_start(moment: datetime) -> date:
+    moment = timezone.localtime(moment, timezone=timezone.utc)
+    return date(year=moment.year, month=moment.month, day=1)
+
+
+def get_month_bound(month: date) -> datetime:
+    #  The partition bounds are always in UTC, so that they don't depend on the time zone of the connection
+    return datetime(year=month.year, month=month.month, day=1, tzinfo=timezone.utc)
+
+
+def get_partition_name(month: date) -> str:
+    return MONTHLY_PARTITION_NAME.format(year=month.year, month=month.month)
+
+
+def is_date_frame_table_partitioned(using: str = DEFAULT_DB_ALIAS) -> bool:
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass)',
+                       [DATE_FRAME_TABLE])
+        return cursor.fetchone()[0]
+
+
+def get_partition_upper_bounds(using: str = DEFAULT_DB_ALIAS) -> Dict[str, Optional[datetime]]:
+    """
+    Returns the partitions attached to the date frame table mapped to the exclusive upper bounds of their ranges,
+    the default partition has no bound.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) FROM pg_inherits '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid WHERE pg_inherits.inhparent = %s::regclass',
+            [DATE_FRAME_TABLE])
+        partitions = cursor.fetchall()
+
+    upper_bounds = {}
+    for name, bound in partitions:
+        match = PARTITION_UPPER_BOUND_PATTERN.search(bound)
+        upper_bounds[name] = parse_datetime(match.group(1)) if match is not None else None
+    return upper_bounds
+
+
+def create_date_frame_partitions(months_ahead: int = None, using: str = DEFAULT_DB_ALIAS) -> List[str]:
+    """
+    Creates the monthly partitions from the current month up to the given number of months ahead, skipping the months
+    which are already covered by the existing partitions. Returns the names of the created partitions.
+    """
+    months_ahead = months_ahead if months_ahead is not None else settings.DATE_FRAME_PARTITIONS_AHEAD
+    upper_bounds = get_partition_upper_bounds(using=using)
+    covered_until = max(filter(None, upper_bounds.values()), default=None)
+    current_month = get_month_start(timezone.now())
+    created_partitions = []
+
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        for offset in range(months_ahead + 1):
+            month = add_months(current_month, offset)
+            if covered_until is not None and get_month_bound(month) < covered_until:
+                continue
+
+            partition_name = get_partition_name(month)
+            cursor.execute(
+                f'CREATE TABLE {connection.ops.quote_name(partition_name)} PARTITION OF '
+                f'{connection.ops.quote_name(DATE_FRAME_TABLE)} FOR VALUES FROM (%s) TO (%s)',
+                [get_month_bound(month), get_month_bound(add_months(month, 1))])
+            created_partitions.append(partition_name)
+
+    return created_partitions
+
+
+def detach_date_frame_partitions(retention_months: int = None, using: str = DEFAULT_DB_ALIAS) -> List[str]:
+    """
+    Detaches the partitions holding only the date frames started before the retention period, months ago from the
+    current month. The detached tables are kept in the database, so that they can be archived or dropped separately.
+    """
+    retention_months = retention_months if retention_months is not None else \
+        settings.DATE_FRAME_PARTITIONS_RETENTION_MONTHS
+    if retention_months is None:
+        return []
+
+    cutoff = get_month_bound(add_months(get_month_start(timezone.now()), -retention_months))
+    detached_partitions = []
+
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        for partition_name, upper_bound in sorted(get_partition_upper_bounds(using=using).items()):
+            if upper_bound is None or upper_bound > cutoff:
+                continue
+
+            cursor.execute(f'ALTER TABLE {connection.ops.quote_name(DATE_FRAME_TABLE)} '
+                           f'DETACH PARTITION {connection.ops.quote_name(partition_name)}')
+            detached_partitions.append(partition_name)
+
+    return detached_partitions
+
+
+def get_foreign_keys() -> List[Tuple[str, str, str]]:
+    return [(field.column, field.remote_field.model._meta.db_table, field.target_field.column)
+            for field in DateFrame._meta.concrete_fields if field.is_relation]
+
+
+def partition_date_frame_table(using: str = DEFAULT_DB_ALIAS) -> None:
+    """
+    Turns the date frame table into a table partitioned by month on "start" (PostgreSQL 12 or later). The existing
+    rows aren't copied, the old table becomes the partition of everything up to the end of the current month (or of
+    the latest started date frame), create_date_frame_partitions adds the following months. A default partition
+    catches the date frames outside of the created ranges.
+
+    The primary key of a partitioned table has to contain the partition key, so it becomes (id, start). The ids are
+    random UUIDs and Django keeps referring to the date frames by their ids only.
+    """
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    table, legacy_table = quote_name(DATE_FRAME_TABLE), quote_name(LEGACY_PARTITION_NAME)
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.execute(f'LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE')
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT MAX(start) FROM {table}')
+            latest_start = cursor.fetchone()[0]
+            cursor.execute("SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'",
+                           [DATE_FRAME_TABLE])
+            primary_key_name = cursor.fetchone()[0]
+            cursor.execute("SELECT indexname FROM pg_indexes WHERE tablename = %s AND indexname != %s",
+                           [DATE_FRAME_TABLE, primary_key_name])
+            index_names = [row[0] for row in cursor.fetchall()]
+
+        #  Index names are unique within the schema, the old ones make room for the indexes of the partitioned table
+        schema_editor.execute(f'ALTER TABLE {table} RENAME TO {legacy_table}')
+        schema_editor.execute(f'ALTER TABLE {legacy_table} DROP CONSTRAINT {quote_name(primary_key_name)}')
+        for index_name in index_names:
+            legacy_index_name = quote_name(f'{index_name[:56]}_legacy')
+            schema_editor.execute(f'ALTER INDEX {quote_name(index_name)} RENAME TO {legacy_index_name}')
+
+        schema_editor.execute(f'CREATE TABLE {table} (LIKE {legacy_table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+                              f'PARTITION BY RANGE ({quote_name("start")})')
+        schema_editor.execute(f'ALTER TABLE {table} ADD PRIMARY KEY ({quote_name("id")}, {quote_name("start")})')
+        for column, to_table, to_column in get_foreign_keys():
+            schema_editor.execute(
+                f'ALTER TABLE {table} ADD CONSTRAINT {quote_name(f"{DATE_FRAME_TABLE}_{column}_fk")} '
+                f'FOREIGN KEY ({quote_name(column)}) REFERENCES {quote_name(to_table)} ({quote_name(to_column)}) '
+                f'DEFERRABLE INITIALLY DEFERRED')
+            schema_editor.execute(f'CREATE INDEX {quote_name(f"{DATE_FRAME_TABLE}_{column}_idx")} '
+                                  f'ON {table} ({quote_name(column)})')
+        for index in DateFrame._meta.indexes:
+            schema_editor.add_index(model=DateFrame, index=index)
+
+        next_month = add_months(get_month_start(max(filter(None, [latest_start, timezone.now()]))), 1)
+        schema_editor.execute(
+            f'ALTER TABLE {table} ATTACH PARTITION {legacy_table} FOR VALUES FROM (MINVALUE) TO (%s)',
+            [get_month_bound(next_month)])
+        schema_editor.execute(f'CREATE TABLE {quote_name(DEFAULT_PARTITION_NAME)} PARTITION OF {table} DEFAULT')
+
+
+def manage_date_frame_partitions(using: str = DEFAULT_DB_ALIAS) -> Tuple[List[str], List[str]]:
+    if not is_date_frame_table_partitioned(using=using):
+        return [], []
+    return create_date_frame_partitions(using=using), detach_date_frame_partitions(using=using)
@@ -1,7 +1,26 @@
+import logging
+
 from config import celery_app
-from pomodorr.frames.selectors.date_frame_selector import get_obsolete_date_frames
+from pomodorr.frames.services.compaction_service import compact_date_frames
+from pomodorr.frames.services.date_frame_service import delete_obsolete_date_frames
+from pomodorr.frames.services.partition_service import manage_date_frame_partitions
+
+logger = logging.getLogger(__name__)
 
 
 @celery_app.task(name='pomodorr.frames.clean_obsolete_date_frames')
-def clean_obsolete_date_frames() -> None:
-    get_obsolete_date_frames().delete()
+def clean_obsolete_date_frames() -> int:
+    deleted = delete_obsolete_date_frames()
+    logger.info('Deleted %s obsolete date frames', deleted)
+    return deleted
+
+
+@celery_app.task(name='pomodorr.frames.maintain_date_frame_partitions')
+def maintain_date_frame_partitions() -> None:
+    #  Does nothing unless the date frame table has been partitioned with the partition_date_frames command
+    manage_date_frame_partitions()
+
+
+@celery_app.task(name='pomodorr.frames.compact_cold_date_frames')
+def compact_cold_date_frames() -> None:
+    compact_date_frames()
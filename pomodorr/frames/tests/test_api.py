@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import pytest
 from django.utils import timezone
 from django.utils.http import urlencode
@@ -5,6 +7,7 @@ from rest_framework import status
 from rest_framework.test import force_authenticate
 
 from pomodorr.frames.api import DateFrameListView
+from pomodorr.frames.models import DateFrame, DateFrameSummary
 from pomodorr.frames.selectors.date_frame_selector import get_all_date_frames_for_user
 
 pytestmark = pytest.mark.django_db
@@ -104,3 +107,38 @@ class TestDateFrameListView:
         ))
 
         assert response_result_ids == default_filtered_orm_fetched_data_frames
+
+    @pytest.mark.parametrize('ordering, summary_position', [('created', 0), ('-created', -1)])
+    def test_get_date_frame_list_merged_with_summaries(self, ordering, summary_position, date_frame_create_batch,
+                                                       active_user, task_instance, request_factory):
+        yesterday = timezone.now() - timedelta(days=1)
+        summary = DateFrameSummary.objects.create(
+            task=task_instance, user=active_user, frame_type=DateFrame.pomodoro_type, date=yesterday.date(),
+            start=yesterday, end=yesterday + timedelta(hours=2), duration=timedelta(minutes=75), frames_number=3,
+            created=yesterday)
+        view = self.view_class.as_view({'get': 'list'})
+        request = request_factory.get(f'{self.base_url}?{urlencode(query={"ordering": ordering})}')
+        force_authenticate(request=request, user=active_user)
+        response = view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 6
+        assert response.data['results'][summary_position]['id'] == str(summary.id)
+        assert response.data['results'][summary_position]['frames_number'] == 3
+        assert response.data['results'][summary_position]['frame_type'] == 'pomodoro'
+        assert {record['id'] for record in response.data['results']} - {str(summary.id)} == {
+            str(date_frame.id) for date_frame in date_frame_create_batch}
+
+    def test_get_date_frame_list_filters_summaries(self, date_frame_create_batch, active_user, task_instance,
+                                                   request_factory):
+        DateFrameSummary.objects.create(
+            task=task_instance, user=active_user, frame_type=DateFrame.break_type, date=timezone.now().date(),
+            start=timezone.now(), end=timezone.now(), duration=timedelta(minutes=5), frames_number=1)
+        view = self.view_class.as_view({'get': 'list'})
+        request = request_factory.get(f'{self.base_url}?{urlencode(query={"frame_type": DateFrame.pomodoro_type})}')
+        force_authenticate(request=request, user=active_user)
+        response = view(request)
+
+        assert response.data['count'] == get_all_date_frames_for_user(
+            user=active_user, frame_type=DateFrame.pomodoro_type).count()
+        assert all('frames_number' not in record for record in response.data['results'])
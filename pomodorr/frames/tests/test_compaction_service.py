@@ -0,0 +1,66 @@
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from pomodorr.frames.models import DateFrame, DateFrameArchive, DateFrameSummary
+from pomodorr.frames.services.compaction_service import compact_date_frames, compact_date_frames_for_user
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def cold_date_frames(task_instance):
+    day = timezone.now().replace(hour=8, minute=0, second=0, microsecond=0) - timedelta(days=200)
+    pomodoro_length = timedelta(minutes=25)
+
+    return DateFrame.objects.bulk_create([
+        DateFrame(task=task_instance, user_id=task_instance.user_id, frame_type=DateFrame.pomodoro_type,
+                  start=day + index * timedelta(hours=1), end=day + index * timedelta(hours=1) + pomodoro_length,
+                  duration=pomodoro_length)
+        for index in range(3)
+    ] + [
+        DateFrame(task=task_instance, user_id=task_instance.user_id, frame_type=DateFrame.break_type,
+                  start=day + pomodoro_length, end=day + pomodoro_length + timedelta(minutes=5),
+                  duration=timedelta(minutes=5)),
+        DateFrame(task=task_instance, user_id=task_instance.user_id, frame_type=DateFrame.pomodoro_type,
+                  start=day - timedelta(days=1), end=day - timedelta(days=1) + pomodoro_length,
+                  duration=pomodoro_length)
+    ])
+
+
+class TestCompactDateFrames:
+    def test_compact_date_frames_into_daily_summaries(self, active_user, task_instance, cold_date_frames,
+                                                      date_frame_create_batch):
+        compacted = compact_date_frames()
+
+        summaries = list(DateFrameSummary.objects.filter(task=task_instance).order_by('date', 'frame_type').values_list(
+            'frame_type', 'frames_number', 'duration'))
+        assert compacted == 5
+        assert summaries == [
+            (DateFrame.pomodoro_type, 1, timedelta(minutes=25)),
+            (DateFrame.pomodoro_type, 3, timedelta(minutes=75)),
+            (DateFrame.break_type, 1, timedelta(minutes=5))
+        ]
+        assert set(DateFrame.objects.values_list('id', flat=True)) == {
+            date_frame.id for date_frame in date_frame_create_batch}
+
+    def test_compact_date_frames_archives_raw_rows(self, active_user, cold_date_frames):
+        compact_date_frames_for_user(user_id=active_user.id, batch_size=2)
+
+        archives = list(DateFrameArchive.objects.filter(user=active_user).order_by('start'))
+        with archives[0].file.open('rb') as file:
+            archived_rows = [json.loads(line) for line in gzip.decompress(file.read()).decode().splitlines()]
+
+        assert [archive.frames_number for archive in archives] == [2, 2, 1]
+        assert {row['id'] for row in archived_rows} == {str(cold_date_frames[4].id), str(cold_date_frames[0].id)}
+
+    def test_compact_date_frames_merges_summaries_of_compacted_days(self, active_user, cold_date_frames):
+        compact_date_frames_for_user(user_id=active_user.id, batch_size=3)
+
+        summary = DateFrameSummary.objects.get(frame_type=DateFrame.pomodoro_type, frames_number=3)
+        assert summary.start == cold_date_frames[0].start
+        assert summary.end == cold_date_frames[2].end
+        assert DateFrameSummary.objects.count() == 3
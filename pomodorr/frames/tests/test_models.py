@@ -2,6 +2,7 @@ import pytest
 from django.core.exceptions import ValidationError
 
 from pomodorr.frames.exceptions import DateFrameException
+from pomodorr.tools.utils import get_time_delta
 
 pytestmark = pytest.mark.django_db()
 
@@ -12,6 +13,7 @@ class TestDateFrame:
 
         assert date_frame is not None
         assert date_frame.task == task_instance
+        assert date_frame.user_id == task_instance.user_id
 
     @pytest.mark.parametrize(
         'invalid_field_key, invalid_field_value, expected_exception',
@@ -44,3 +46,31 @@ class TestDateFrame:
             date_frame_model.objects.create(task=completed_task_instance, **date_frame_data)
 
         assert exc.value.messages[0] == DateFrameException.messages[DateFrameException.task_already_completed]
+
+    def test_save_date_frame_with_update_fields_writes_only_updated_fields(self, date_frame_model,
+                                                                           date_frame_in_progress):
+        date_frame_model.objects.filter(id=date_frame_in_progress.id).update(frame_type=date_frame_model.pause_type)
+        date_frame_in_progress.end = date_frame_in_progress.start
+
+        date_frame_in_progress.save(update_fields=['end'])
+        date_frame_in_progress.refresh_from_db()
+
+        assert date_frame_in_progress.end == date_frame_in_progress.start
+        assert date_frame_in_progress.duration is not None
+        assert date_frame_in_progress.frame_type == date_frame_model.pause_type
+
+    def test_save_date_frame_with_update_fields_validates_updated_fields(self, date_frame_in_progress):
+        date_frame_in_progress.end = get_time_delta({'minutes': 5}, ahead=False)
+
+        with pytest.raises(ValidationError) as exc:
+            date_frame_in_progress.save(update_fields=['end'])
+
+        assert exc.value.messages[0] == DateFrameException.messages[DateFrameException.start_greater_than_end]
+
+    def test_date_frame_moved_to_task_of_another_user_changes_owner(self, date_frame_instance,
+                                                                    task_instance_for_random_project):
+        date_frame_instance.task = task_instance_for_random_project
+        date_frame_instance.save(update_fields=['task'])
+
+        date_frame_instance.refresh_from_db()
+        assert date_frame_instance.user_id == task_instance_for_random_project.user_id
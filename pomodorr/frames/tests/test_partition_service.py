@@ -0,0 +1,89 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from pomodorr.frames.services.partition_service import (
+    add_months, create_date_frame_partitions, detach_date_frame_partitions, get_month_start, get_partition_name,
+    manage_date_frame_partitions
+)
+
+NOW = datetime(2020, 6, 15, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def database_mock():
+    connections_mock = MagicMock()
+    connections_mock.__getitem__.return_value.ops.quote_name = lambda name: f'"{name}"'
+    cursor_mock = connections_mock.__getitem__.return_value.cursor.return_value.__enter__.return_value
+
+    with patch('pomodorr.frames.services.partition_service.connections', connections_mock), \
+            patch('pomodorr.frames.services.partition_service.timezone.now', return_value=NOW):
+        yield cursor_mock
+
+
+def get_executed_statements(cursor_mock):
+    return [call[0][0] for call in cursor_mock.execute.call_args_list]
+
+
+@pytest.mark.parametrize('month, months, expected', [
+    (date(2020, 6, 1), 1, date(2020, 7, 1)),
+    (date(2020, 11, 1), 3, date(2021, 2, 1)),
+    (date(2020, 1, 1), -1, date(2019, 12, 1)),
+    (date(2020, 6, 1), -18, date(2018, 12, 1)),
+])
+def test_add_months(month, months, expected):
+    assert add_months(month, months) == expected
+
+
+def test_get_month_start_and_partition_name():
+    assert get_month_start(NOW) == date(2020, 6, 1)
+    assert get_partition_name(date(2020, 6, 1)) == 'frames_dateframe_y2020m06'
+
+
+def test_create_date_frame_partitions_skips_covered_months(database_mock):
+    upper_bounds = {'frames_dateframe_legacy': datetime(2020, 7, 1, tzinfo=timezone.utc),
+                    'frames_dateframe_default': None}
+
+    with patch('pomodorr.frames.services.partition_service.get_partition_upper_bounds', return_value=upper_bounds):
+        created_partitions = create_date_frame_partitions(months_ahead=2)
+
+    assert created_partitions == ['frames_dateframe_y2020m07', 'frames_dateframe_y2020m08']
+    assert database_mock.execute.call_args_list[0][0][1] == [datetime(2020, 7, 1, tzinfo=timezone.utc),
+                                                             datetime(2020, 8, 1, tzinfo=timezone.utc)]
+
+
+def test_detach_date_frame_partitions_detaches_expired_ones(database_mock):
+    upper_bounds = {'frames_dateframe_legacy': datetime(2019, 3, 1, tzinfo=timezone.utc),
+                    'frames_dateframe_y2019m03': datetime(2019, 4, 1, tzinfo=timezone.utc),
+                    'frames_dateframe_y2019m04': datetime(2019, 5, 1, tzinfo=timezone.utc),
+                    'frames_dateframe_default': None}
+
+    with patch('pomodorr.frames.services.partition_service.get_partition_upper_bounds', return_value=upper_bounds):
+        detached_partitions = detach_date_frame_partitions(retention_months=14)
+
+    assert detached_partitions == ['frames_dateframe_legacy', 'frames_dateframe_y2019m03']
+    assert get_executed_statements(database_mock) == [
+        'ALTER TABLE "frames_dateframe" DETACH PARTITION "frames_dateframe_legacy"',
+        'ALTER TABLE "frames_dateframe" DETACH PARTITION "frames_dateframe_y2019m03"'
+    ]
+
+
+def test_detach_date_frame_partitions_keeps_everything_by_default(database_mock, settings):
+    settings.DATE_FRAME_PARTITIONS_RETENTION_MONTHS = None
+
+    assert detach_date_frame_partitions() == []
+    database_mock.execute.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_managing_partitions_of_not_partitioned_table():
+    assert manage_date_frame_partitions() == ([], [])
+
+
+@pytest.mark.django_db
+def test_partition_date_frames_command_requires_postgresql():
+    with pytest.raises(CommandError):
+        call_command('partition_date_frames')
@@ -2,17 +2,28 @@ import pytest
 from django.utils import timezone
 from django.utils.http import urlencode
 
+from pomodorr.frames.services.date_frame_service import finish_date_frame
+
 pytestmark = pytest.mark.django_db
 
 
 class TestDateFrameViewSetQueries:
+    #  The count and the page of the date frames, preceded by the check for the summaries of the compacted ones
     base_url = '/api/date_frames/'
 
     def test_date_frame_list_view(self, client, django_assert_num_queries, active_user, date_frame_create_batch):
         client.force_authenticate(user=active_user)
-        with django_assert_num_queries(2):
+        with django_assert_num_queries(3):
             client.get(self.base_url)
 
+    def test_date_frame_list_view_with_expanded_task(self, client, django_assert_num_queries, active_user,
+                                                     date_frame_create_batch):
+        client.force_authenticate(user=active_user)
+        with django_assert_num_queries(3):
+            response = client.get(f'{self.base_url}?{urlencode(query={"expand": "task", "fields": "id,start,task"})}')
+
+        assert response.data['results'][0]['task']['id'] == str(date_frame_create_batch[0].task.id)
+
     @pytest.mark.parametrize(
         'filter_lookup',
         [
@@ -34,5 +45,13 @@ class TestDateFrameViewSetQueries:
                                          date_frame_create_batch):
         url = f'{self.base_url}?{urlencode(query=filter_lookup)}'
         client.force_authenticate(user=active_user)
-        with django_assert_max_num_queries(2):
+        with django_assert_max_num_queries(3):
             client.get(url)
+
+
+class TestDateFrameServiceQueries:
+    def test_finish_break_date_frame(self, django_assert_num_queries, break_in_progress):
+        #  The savepoint and its release, fetching the date frame with its task, looking for colliding date frames
+        #  and the update itself
+        with django_assert_num_queries(5):
+            finish_date_frame(date_frame_id=break_in_progress.id)
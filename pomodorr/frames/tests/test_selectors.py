@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+import factory
 import pytest
 from pytest_lazyfixture import lazy_fixture
 
@@ -9,6 +10,7 @@ from pomodorr.frames.selectors.date_frame_selector import (
     get_colliding_date_frame_for_task, get_finished_date_frames_for_user, get_finished_date_frames_for_task,
     get_obsolete_date_frames
 )
+from pomodorr.frames.tests.factories import InnerDateFrameFactory
 from pomodorr.tools.utils import get_time_delta
 
 pytestmark = pytest.mark.django_db
@@ -85,6 +87,18 @@ class TestDateFrame:
         assert all(date_frame.start > pomodoro_in_progress_with_pauses.start for date_frame in selector_method_result)
         assert all(date_frame.end < finish_date for date_frame in selector_method_result)
 
+    def test_get_pauses_inside_date_frame_skips_pauses_of_other_tasks(self, pomodoro_in_progress_with_pauses,
+                                                                      task_instance_for_random_project):
+        factory.create(klass=InnerDateFrameFactory, task=task_instance_for_random_project, frame_type=2,
+                       start=get_time_delta({'minutes': 11}), end=get_time_delta({'minutes': 12}))
+
+        selector_method_result = get_pauses_inside_date_frame(
+            date_frame_object=pomodoro_in_progress_with_pauses, end=get_time_delta({'minutes': 25}))
+
+        assert selector_method_result.count() == 2
+        assert all(date_frame.task_id == pomodoro_in_progress_with_pauses.task_id
+                   for date_frame in selector_method_result)
+
     @pytest.mark.parametrize(
         'tested_date_frame',
         [
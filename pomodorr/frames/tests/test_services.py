@@ -9,8 +9,11 @@ from django.core.exceptions import ValidationError
 from pytest_lazyfixture import lazy_fixture
 
 from pomodorr.frames.exceptions import DateFrameException
+from pomodorr.frames.models import DateFrame
 from pomodorr.frames.selectors.date_frame_selector import get_breaks_inside_date_frame, get_pauses_inside_date_frame
-from pomodorr.frames.services.date_frame_service import start_date_frame, finish_date_frame, force_finish_date_frame
+from pomodorr.frames.services.date_frame_service import (
+    start_date_frame, finish_date_frame, force_finish_date_frame, close_date_frame, delete_obsolete_date_frames
+)
 from pomodorr.tools.utils import get_time_delta
 
 pytestmark = pytest.mark.django_db()
@@ -267,3 +270,42 @@ class TestFinishDateFrame:
         assert pause.end is not None
         assert pomodoro.end is not None
         assert pause.end < pomodoro.end
+
+    def test_finish_already_finished_date_frame_keeps_its_end(self, pomodoro_in_progress):
+        first_finish = finish_date_frame(date_frame_id=pomodoro_in_progress.id)
+
+        second_finish = finish_date_frame(date_frame_id=pomodoro_in_progress.id)
+
+        assert second_finish.end == first_finish.end
+
+    def test_close_date_frame_finished_concurrently(self, pomodoro_in_progress):
+        stale_date_frame = DateFrame.objects.get(id=pomodoro_in_progress.id)
+        first_end = get_time_delta({'minutes': 1})
+        assert close_date_frame(date_frame=pomodoro_in_progress, end=first_end) is True
+
+        assert close_date_frame(date_frame=stale_date_frame, end=get_time_delta({'minutes': 2})) is False
+        pomodoro_in_progress.refresh_from_db()
+        assert pomodoro_in_progress.end == first_end
+
+    def test_force_finish_date_frame_finished_concurrently(self, pomodoro_in_progress):
+        stale_date_frame = DateFrame.objects.get(id=pomodoro_in_progress.id)
+        finish_date_frame(date_frame_id=pomodoro_in_progress.id)
+
+        assert force_finish_date_frame(date_frame=stale_date_frame, notify=False) is None
+
+
+class TestDeleteObsoleteDateFrames:
+    def test_delete_obsolete_date_frames_in_batches(self, obsolete_date_frames, date_frame_in_progress,
+                                                    django_assert_num_queries):
+        #  Fetching the ids and deleting them for each of the batches
+        with patch('pomodorr.frames.services.date_frame_service.time.sleep') as sleep_mock, \
+                django_assert_num_queries(4):
+            deleted = delete_obsolete_date_frames(batch_size=2, sleep=0.5)
+
+        assert deleted == 3
+        sleep_mock.assert_called_once_with(0.5)
+        assert list(DateFrame.objects.values_list('id', flat=True)) == [date_frame_in_progress.id]
+
+    def test_delete_obsolete_date_frames_without_any(self, date_frame_in_progress):
+        assert delete_obsolete_date_frames() == 0
+        assert DateFrame.objects.exists()
@@ -1,13 +1,25 @@
 import pytest
+from django.db.models import Sum
 
-from pomodorr.frames.models import DateFrame
-from pomodorr.frames.tasks import clean_obsolete_date_frames
+from pomodorr.frames.models import DateFrame, DateFrameSummary
+from pomodorr.frames.tasks import clean_obsolete_date_frames, compact_cold_date_frames
 
 
 @pytest.mark.django_db
 def test_clean_obsolete_date_frames(obsolete_date_frames):
     assert DateFrame.objects.exists()
 
-    clean_obsolete_date_frames.apply()
+    result = clean_obsolete_date_frames.apply()
 
+    assert result.get() == 3
     assert DateFrame.objects.exists() is False
+
+
+@pytest.mark.django_db
+def test_compact_cold_date_frames(date_frame_create_batch, settings):
+    settings.DATE_FRAME_COMPACTION_HORIZON_DAYS = -365
+
+    compact_cold_date_frames.apply()
+
+    assert DateFrame.objects.exists() is False
+    assert DateFrameSummary.objects.aggregate(frames_number=Sum('frames_number'))['frames_number'] == 5
@@ -0,0 +1,30 @@
+from rest_framework import status
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from pomodorr.imports.selectors import get_import_jobs_for_user
+from pomodorr.imports.serializers import ImportJobSerializer
+from pomodorr.imports.services import create_import_job
+
+
+class ImportJobViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
+    permission_classes = (IsAuthenticated,)
+    serializer_class = ImportJobSerializer
+    parser_classes = (MultiPartParser, FormParser)
+
+    def get_queryset(self):
+        return get_import_jobs_for_user(user=self.request.user)
+
+    def create(self, request):
+        """
+        Uploads a CSV or JSON Lines file with projects, tasks and date frames (each row having its "type"), which gets
+        imported in the background. The returned job reports the progress of the import.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        job = create_import_job(user=request.user, **serializer.validated_data)
+        return Response(self.get_serializer(instance=job).data, status=status.HTTP_202_ACCEPTED)
@@ -0,0 +1,22 @@
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+
+class ImportException(ValidationError):
+    unknown_record_type = 'unknown_record_type'
+    malformed_row = 'malformed_row'
+    unknown_file_format = 'unknown_file_format'
+    start_greater_than_end = 'start_greater_than_end'
+    overlapping_date_frame = 'overlapping_date_frame'
+
+    messages = {
+        unknown_record_type: _('The record type must be one of: project, task, date_frame.'),
+        malformed_row: _('The row must be a valid JSON object.'),
+        unknown_file_format: _('The file must be either a CSV or a JSON Lines file.'),
+        start_greater_than_end: _('Start date must be lower than end date.'),
+        overlapping_date_frame: _('The date frame overlaps another date frame of the task.'),
+    }
+
+    def __init__(self, message, code=None, params=None):
+        self.code = code
+        super().__init__(message, code, params)
@@ -0,0 +1,43 @@
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from pomodorr.imports.models import ImportJob
+from pomodorr.imports.services import count_rows, import_history, read_rows
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Imports projects, tasks and date frames of a user from a CSV or JSON Lines file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('email', help='Email of the user the history gets imported for.')
+        parser.add_argument('path', help='File with the rows, each of them has a "type": project, task or date_frame.')
+        parser.add_argument('--format', choices=(ImportJob.format_csv, ImportJob.format_ndjson), default=None,
+                            help='Format of the file, guessed from its extension by default.')
+        parser.add_argument('--batch-size', type=int, default=None, help='Number of rows imported at once.')
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options['email']).first()
+        if user is None:
+            raise CommandError(f'There is no user with the email {options["email"]}.')
+
+        extension = os.path.splitext(options['path'])[1].lstrip('.').lower()
+        file_format = options['format'] or ImportJob.EXTENSION_FORMATS.get(extension)
+        if file_format is None:
+            raise CommandError('Unknown format of the file, pass it with --format.')
+
+        with open(options['path'], 'rb') as file:
+            total_rows = count_rows(file=file, file_format=file_format)
+
+            def report_progress(processed, imported, errors):
+                self.stdout.write(f'Processed {processed} of {total_rows} rows, imported {imported}.')
+
+            processed, imported, errors = import_history(user=user, rows=read_rows(file=file, file_format=file_format),
+                                                         batch_size=options['batch_size'], on_progress=report_progress)
+
+        for error in errors:
+            self.stderr.write(f'Row {error["row"]}: {error["errors"]}')
+        self.stdout.write(self.style.SUCCESS(f'Imported {imported} of {processed} rows.'))
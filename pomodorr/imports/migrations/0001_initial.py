@@ -0,0 +1,44 @@
+# Generated by Django 3.0.7 on 2026-10-19 08:38
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import pomodorr.imports.models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportJob',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('file', models.FileField(upload_to=pomodorr.imports.models.import_upload_path, verbose_name='file')),
+                ('file_format', models.CharField(choices=[('csv', 'CSV'), ('ndjson', 'JSON Lines')], max_length=8, verbose_name='file format')),
+                ('status', models.SmallIntegerField(choices=[(0, 'pending'), (1, 'running'), (2, 'finished'), (3, 'failed')], default=0, verbose_name='status')),
+                ('total_rows', models.PositiveIntegerField(blank=True, null=True, verbose_name='total rows')),
+                ('processed_rows', models.PositiveIntegerField(default=0, verbose_name='processed rows')),
+                ('imported_rows', models.PositiveIntegerField(default=0, verbose_name='imported rows')),
+                ('errors', models.TextField(blank=True, verbose_name='errors')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='import_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('-created',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='importjob',
+            index=models.Index(fields=['user', 'created'], name='import_job_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+import uuid
+
+from django.core.files import storage
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from model_utils.models import TimeStampedModel
+
+
+def import_upload_path(instance, filename):
+    return "imports/{0}/{1}".format(instance.user_id, storage.get_valid_filename(filename))
+
+
+class ImportJob(TimeStampedModel):
+    status_pending = 0
+    status_running = 1
+    status_finished = 2
+    status_failed = 3
+
+    STATUS_CHOICES = [
+        (status_pending, _('pending')),
+        (status_running, _('running')),
+        (status_finished, _('finished')),
+        (status_failed, _('failed'))
+    ]
+
+    format_csv = 'csv'
+    format_ndjson = 'ndjson'
+
+    FORMAT_CHOICES = [
+        (format_csv, _('CSV')),
+        (format_ndjson, _('JSON Lines'))
+    ]
+
+    EXTENSION_FORMATS = {'csv': format_csv, 'jsonl': format_ndjson, 'ndjson': format_ndjson}
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(to='users.User', null=False, blank=False, on_delete=models.CASCADE,
+                             related_name='import_jobs')
+    file = models.FileField(_('file'), upload_to=import_upload_path)
+    file_format = models.CharField(_('file format'), max_length=8, choices=FORMAT_CHOICES)
+    status = models.SmallIntegerField(_('status'), choices=STATUS_CHOICES, default=status_pending)
+    total_rows = models.PositiveIntegerField(_('total rows'), null=True, blank=True)
+    processed_rows = models.PositiveIntegerField(_('processed rows'), default=0)
+    imported_rows = models.PositiveIntegerField(_('imported rows'), default=0)
+    #  JSON list of the rejected rows' numbers and validation errors, capped at IMPORT_MAX_REPORTED_ERRORS
+    errors = models.TextField(_('errors'), blank=True)
+
+    class Meta:
+        ordering = ('-created',)
+        indexes = [
+            models.Index(fields=['user', 'created'], name='import_job_user_created_idx')
+        ]
+
+    def __str__(self):
+        return f'{self.user_id} import {self.get_status_display()}'
@@ -0,0 +1,7 @@
+from django.contrib.auth.models import AbstractUser
+
+from pomodorr.imports.models import ImportJob
+
+
+def get_import_jobs_for_user(user: AbstractUser, **kwargs):
+    return ImportJob.objects.filter(user=user, **kwargs)
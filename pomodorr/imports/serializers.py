@@ -0,0 +1,72 @@
+import json
+import os
+
+from rest_framework import serializers
+
+from pomodorr.frames.models import DateFrame
+from pomodorr.imports.exceptions import ImportException
+from pomodorr.imports.models import ImportJob
+from pomodorr.projects.models import Task
+
+TASK_STATUSES = {'active': Task.status_active, 'completed': Task.status_completed}
+DATE_FRAME_TYPES = {'pomodoro': DateFrame.pomodoro_type, 'break': DateFrame.break_type, 'pause': DateFrame.pause_type}
+
+
+class ProjectRowSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=128)
+
+
+class TaskRowSerializer(serializers.Serializer):
+    project = serializers.CharField(max_length=128)
+    name = serializers.CharField(max_length=128)
+    status = serializers.ChoiceField(choices=list(TASK_STATUSES), default='active')
+    note = serializers.CharField(required=False, default='')
+
+    def validate_status(self, value):
+        return TASK_STATUSES[value]
+
+
+class DateFrameRowSerializer(serializers.Serializer):
+    project = serializers.CharField(max_length=128)
+    task = serializers.CharField(max_length=128)
+    frame_type = serializers.ChoiceField(choices=list(DATE_FRAME_TYPES), default='pomodoro')
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
+    def validate_frame_type(self, value):
+        return DATE_FRAME_TYPES[value]
+
+    def validate(self, data):
+        if data['start'] >= data['end']:
+            raise serializers.ValidationError(ImportException.messages[ImportException.start_greater_than_end],
+                                              code=ImportException.start_greater_than_end)
+        return data
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    file_format = serializers.ChoiceField(choices=ImportJob.FORMAT_CHOICES, required=False)
+
+    class Meta:
+        model = ImportJob
+        fields = ('id', 'file', 'file_format', 'status', 'total_rows', 'processed_rows', 'imported_rows', 'errors',
+                  'created', 'modified')
+        read_only_fields = ('status', 'total_rows', 'processed_rows', 'imported_rows', 'errors')
+        extra_kwargs = {
+            'file': {'write_only': True}
+        }
+
+    def validate(self, data):
+        if 'file_format' not in data:
+            extension = os.path.splitext(data['file'].name)[1].lstrip('.').lower()
+            data['file_format'] = ImportJob.EXTENSION_FORMATS.get(extension)
+
+        if data['file_format'] is None:
+            raise serializers.ValidationError({'file_format': ImportException.messages[
+                ImportException.unknown_file_format]}, code=ImportException.unknown_file_format)
+        return data
+
+    def to_representation(self, instance):
+        data = super(ImportJobSerializer, self).to_representation(instance=instance)
+        data['status'] = instance.get_status_display()
+        data['errors'] = json.loads(instance.errors) if instance.errors else []
+        return data
@@ -0,0 +1,279 @@
+import csv
+import io
+import json
+import math
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Set, Tuple
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from pomodorr.frames.models import DateFrame
+from pomodorr.imports.exceptions import ImportException
+from pomodorr.imports.models import ImportJob
+from pomodorr.imports.serializers import DateFrameRowSerializer, ProjectRowSerializer, TaskRowSerializer
+from pomodorr.projects.models import Project, Task
+from pomodorr.projects.selectors.project_selector import get_active_projects_for_user
+from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks, get_all_non_removed_tasks_for_user
+from pomodorr.projects.services.search_service import invalidate_search_index
+from pomodorr.tools.routers import pin_owners_to_primary
+
+ROW_SERIALIZERS = {
+    'project': ProjectRowSerializer,
+    'task': TaskRowSerializer,
+    'date_frame': DateFrameRowSerializer
+}
+
+
+def parse_json_line(line: str):
+    #  A malformed line is passed on as it is, validate_rows rejects it like any other row which isn't an object
+    try:
+        return json.loads(line)
+    except ValueError:
+        return line
+
+
+def read_rows(file: IO[bytes], file_format: str) -> Iterator[dict]:
+    text_file = io.TextIOWrapper(file, encoding='utf-8', newline='')
+
+    if file_format == ImportJob.format_csv:
+        yield from csv.DictReader(text_file)
+    else:
+        yield from (parse_json_line(line) for line in text_file if line.strip())
+
+
+def count_rows(file: IO[bytes], file_format: str) -> int:
+    rows = sum(1 for line in file if line.strip())
+    file.seek(0)
+    #  The header of a CSV file isn't a row
+    return max(rows - 1, 0) if file_format == ImportJob.format_csv else rows
+
+
+def validate_rows(rows: List[Tuple[int, dict]]) -> Tuple[List[Tuple[int, str, dict]], List[dict]]:
+    valid_rows, errors = [], []
+
+    for row_number, row in rows:
+        if not isinstance(row, dict):
+            errors.append({'row': row_number, 'errors': {'non_field_errors': [
+                ImportException.messages[ImportException.malformed_row]]}})
+            continue
+
+        #  Empty CSV cells stand for missing values, so that the defaults of the fields apply
+        row = {key: value for key, value in row.items() if value not in ('', None)}
+        serializer_class = ROW_SERIALIZERS.get(row.get('type'))
+
+        if serializer_class is None:
+            errors.append({'row': row_number, 'errors': {'type': [
+                ImportException.messages[ImportException.unknown_record_type]]}})
+            continue
+
+        serializer = serializer_class(data=row)
+        if serializer.is_valid():
+            valid_rows.append((row_number, row['type'], serializer.validated_data))
+        else:
+            errors.append({'row': row_number, 'errors': serializer.errors})
+
+    return valid_rows, errors
+
+
+def get_or_create_projects(user: AbstractUser, names: Set[str], project_ids: Dict[str, str]) -> None:
+    names = names - project_ids.keys()
+    if not names:
+        return
+
+    project_ids.update(get_active_projects_for_user(user=user).filter(name__in=names).values_list('name', 'id'))
+    #  The new projects go after the user's current ones, spaced the same way as the rebalanced ordering keys
+    last_key = get_active_projects_for_user(user=user).aggregate(
+        last_key=Max('user_defined_ordering'))['last_key'] or 0
+    new_projects = [
+        Project(user=user, name=name, user_defined_ordering=last_key + (index + 1) * settings.USER_DEFINED_ORDERING_GAP)
+        for index, name in enumerate(sorted(names - project_ids.keys()))
+    ]
+    Project.objects.bulk_create(new_projects)
+    project_ids.update((project.name, project.id) for project in new_projects)
+
+
+def get_or_create_tasks(user: AbstractUser, task_rows: Dict[Tuple[str, str], dict], project_ids: Dict[str, str],
+                        task_ids: Dict[Tuple[str, str], str]) -> None:
+    #  The tasks are identified by the names of their projects and their own names, the rows hold the new tasks' fields
+    keys = task_rows.keys() - task_ids.keys()
+    if not keys:
+        return
+
+    project_names = {project_ids[project_name]: project_name for project_name, name in keys}
+    existing_tasks = get_all_non_removed_tasks_for_user(user=user).filter(
+        project_id__in=project_names, name__in={name for project_name, name in keys}).values_list(
+        'project_id', 'name', 'id')
+    task_ids.update(((project_names[project_id], name), task_id) for project_id, name, task_id in existing_tasks)
+
+    #  The new tasks go after the current ones of their projects, spaced the same way as the rebalanced ordering keys
+    last_keys = dict(get_all_non_removed_tasks(project_id__in=project_names).order_by().values('project_id').annotate(
+        last_key=Max('user_defined_ordering')).values_list('project_id', 'last_key'))
+    new_tasks = []
+    for project_name, name in sorted(keys - task_ids.keys()):
+        project_id = project_ids[project_name]
+        last_keys[project_id] = (last_keys.get(project_id) or 0) + settings.USER_DEFINED_ORDERING_GAP
+        new_tasks.append(Task(
+            user=user, project_id=project_id, name=name, user_defined_ordering=last_keys[project_id],
+            status=task_rows[(project_name, name)].get('status', Task.status_active),
+            note=task_rows[(project_name, name)].get('note', '')))
+    Task.objects.bulk_create(new_tasks)
+    task_ids.update(((project_names[task.project_id], task.name), task.id) for task in new_tasks)
+
+
+def get_existing_date_frames(frame_rows: List[Tuple[int, dict]],
+                             task_ids: Dict[Tuple[str, str], str]) -> Dict[str, Tuple[list, list]]:
+    """
+    Fetches the date frames of the tasks within the time ranges spanned by the rows, with a single query. Returns the
+    starts of the frames of each task in order, along with the latest end reached by the frames up to each start.
+    """
+    time_ranges = {}
+    for _, row in frame_rows:
+        task_id = task_ids[(row['project'], row['task'])]
+        start, end = time_ranges.get(task_id, (row['start'], row['end']))
+        time_ranges[task_id] = (min(start, row['start']), max(end, row['end']))
+    if not time_ranges:
+        return {}
+
+    colliding = Q()
+    for task_id, (start, end) in time_ranges.items():
+        colliding |= Q(task_id=task_id, start__lt=end) & (Q(end__gt=start) | Q(end__isnull=True))
+
+    existing_frames = {}
+    for task_id, start, end in DateFrame.objects.filter(colliding).order_by('task_id', 'start').values_list(
+            'task_id', 'start', 'end'):
+        starts, latest_ends = existing_frames.setdefault(task_id, ([], []))
+        #  The frames in progress reach indefinitely far
+        end = end or datetime.max.replace(tzinfo=timezone.utc)
+        starts.append(start)
+        latest_ends.append(max(latest_ends[-1], end) if latest_ends else end)
+    return existing_frames
+
+
+def overlaps_existing_date_frame(existing_frames: Tuple[list, list], start: datetime, end: datetime) -> bool:
+    #  Of the frames starting before the end, the one reaching the farthest has to end before the start
+    starts, latest_ends = existing_frames
+    index = bisect_left(starts, end)
+    return index > 0 and latest_ends[index - 1] > start
+
+
+def build_date_frames(user: AbstractUser, frame_rows: List[Tuple[int, dict]], task_ids: Dict[Tuple[str, str], str],
+                      previous_frames: Dict[str, Tuple[datetime, datetime]]) -> Tuple[List[DateFrame], List[dict]]:
+    """
+    Computes the durations of the date frames in a single pass over the rows sorted by their tasks and starts, which
+    also rejects the date frames overlapping the previous imported ones of their tasks or their existing ones.
+    """
+    date_frames, errors = [], []
+    existing_frames = get_existing_date_frames(frame_rows=frame_rows, task_ids=task_ids)
+
+    for row_number, row in sorted(frame_rows, key=lambda numbered_row: (
+            numbered_row[1]['project'], numbered_row[1]['task'], numbered_row[1]['start'])):
+        task_id = task_ids[(row['project'], row['task'])]
+        previous_frame = previous_frames.get(task_id)
+        overlaps_previous_date_frame = previous_frame is not None and previous_frame[0] < row['end'] and \
+            row['start'] < previous_frame[1]
+
+        if overlaps_previous_date_frame or overlaps_existing_date_frame(
+                existing_frames=existing_frames.get(task_id, ([], [])), start=row['start'], end=row['end']):
+            errors.append({'row': row_number, 'errors': {'start': [
+                ImportException.messages[ImportException.overlapping_date_frame]]}})
+            continue
+
+        previous_frames[task_id] = (row['start'], row['end'])
+        #  Truncated to whole minutes, the same way DateFrame.normalized_duration does for the tracked date frames
+        duration = timedelta(minutes=math.trunc((row['end'] - row['start']).total_seconds() / 60))
+        date_frames.append(DateFrame(user=user, task_id=task_id, frame_type=row['frame_type'], start=row['start'],
+                                     end=row['end'], duration=duration))
+
+    return date_frames, errors
+
+
+def import_batch(user: AbstractUser, rows: List[Tuple[int, dict]], project_ids: Dict[str, str],
+                 task_ids: Dict[Tuple[str, str], str],
+                 previous_frames: Dict[str, Tuple[datetime, datetime]]) -> Tuple[int, List[dict]]:
+    valid_rows, errors = validate_rows(rows=rows)
+
+    project_names = {row['name'] if row_type == 'project' else row['project'] for _, row_type, row in valid_rows}
+    task_rows = {}
+    frame_rows = []
+    for row_number, row_type, row in valid_rows:
+        if row_type == 'task':
+            task_rows[(row['project'], row['name'])] = row
+        elif row_type == 'date_frame':
+            task_rows.setdefault((row['project'], row['task']), {})
+            frame_rows.append((row_number, row))
+
+    with transaction.atomic():
+        get_or_create_projects(user=user, names=project_names, project_ids=project_ids)
+        get_or_create_tasks(user=user, task_rows=task_rows, project_ids=project_ids, task_ids=task_ids)
+        date_frames, frame_errors = build_date_frames(user=user, frame_rows=frame_rows, task_ids=task_ids,
+                                                      previous_frames=previous_frames)
+        DateFrame.objects.bulk_create(date_frames)
+
+    return len(valid_rows) - len(frame_errors), errors + frame_errors
+
+
+def import_history(user: AbstractUser, rows: Iterable[dict], batch_size: int = None,
+                   on_progress: Callable[[int, int, List[dict]], None] = None) -> Tuple[int, int, List[dict]]:
+    """
+    Imports the user's projects, tasks and date frames from the rows, validating and inserting them batch by batch.
+    The rows refer to the projects and the tasks by their names, the missing ones get created. Invalid rows are
+    skipped, the numbers of processed and imported rows are returned along with the errors of the skipped ones.
+    """
+    batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+    numbered_rows = enumerate(rows, start=1)
+    project_ids, task_ids, previous_frames = {}, {}, {}
+    processed = imported = 0
+    errors = []
+
+    batch = list(islice(numbered_rows, batch_size))
+    while batch:
+        imported_in_batch, batch_errors = import_batch(user=user, rows=batch, project_ids=project_ids,
+                                                       task_ids=task_ids, previous_frames=previous_frames)
+        processed += len(batch)
+        imported += imported_in_batch
+        errors.extend(batch_errors[:settings.IMPORT_MAX_REPORTED_ERRORS - len(errors)])
+
+        if on_progress is not None:
+            on_progress(processed, imported, errors)
+        batch = list(islice(numbered_rows, batch_size))
+
+    #  The bulk inserts skip the signal handlers keeping the search index up to date, and give the router no owner
+    invalidate_search_index(user_id=user.id)
+    pin_owners_to_primary(user_ids=[user.id])
+    return processed, imported, errors
+
+
+def run_import_job(job: ImportJob) -> None:
+    ImportJob.objects.filter(id=job.id).update(status=ImportJob.status_running, modified=timezone.now())
+
+    def report_progress(processed: int, imported: int, errors: List[dict]) -> None:
+        ImportJob.objects.filter(id=job.id).update(processed_rows=processed, imported_rows=imported,
+                                                   errors=json.dumps(errors, cls=DjangoJSONEncoder),
+                                                   modified=timezone.now())
+
+    try:
+        with job.file.open('rb') as file:
+            total_rows = count_rows(file=file, file_format=job.file_format)
+            ImportJob.objects.filter(id=job.id).update(total_rows=total_rows)
+            import_history(user=job.user, rows=read_rows(file=file, file_format=job.file_format),
+                           on_progress=report_progress)
+    except Exception:
+        ImportJob.objects.filter(id=job.id).update(status=ImportJob.status_failed, modified=timezone.now())
+        raise
+
+    ImportJob.objects.filter(id=job.id).update(status=ImportJob.status_finished, modified=timezone.now())
+
+
+def create_import_job(user: AbstractUser, file, file_format: str) -> ImportJob:
+    from pomodorr.imports.tasks import process_import_job
+
+    job = ImportJob.objects.create(user=user, file=file, file_format=file_format)
+    transaction.on_commit(lambda: process_import_job.delay(job_id=str(job.id)))
+    return job
@@ -0,0 +1,13 @@
+from django.conf import settings
+
+from config import celery_app
+from pomodorr.imports.models import ImportJob
+from pomodorr.imports.services import run_import_job
+
+
+@celery_app.task(name='pomodorr.imports.process_import_job', time_limit=settings.IMPORT_TASK_TIME_LIMIT,
+                 soft_time_limit=settings.IMPORT_TASK_TIME_LIMIT - 60)
+def process_import_job(job_id: str) -> None:
+    job = ImportJob.objects.select_related('user').filter(id=job_id, status=ImportJob.status_pending).first()
+    if job is not None:
+        run_import_job(job=job)
@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import force_authenticate
+
+from pomodorr.imports.api import ImportJobViewSet
+from pomodorr.imports.exceptions import ImportException
+from pomodorr.imports.models import ImportJob
+from pomodorr.imports.tasks import process_import_job
+from pomodorr.projects.models import Project
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def process_import_job_mock():
+    with patch('pomodorr.imports.services.transaction.on_commit', side_effect=lambda callback: callback()), \
+            patch('pomodorr.imports.tasks.process_import_job.delay') as delay_mock:
+        yield delay_mock
+
+
+class TestImportJobViewSet:
+    base_url = 'api/import/'
+
+    def upload(self, request_factory, user, file):
+        view = ImportJobViewSet.as_view({'post': 'create'})
+        request = request_factory.post(self.base_url, data={'file': file}, format='multipart')
+        force_authenticate(request=request, user=user)
+        return view(request)
+
+    def test_upload_schedules_import_job(self, request_factory, active_user, process_import_job_mock):
+        file = SimpleUploadedFile('history.csv', b'type,project,name\nproject,,Imported\n')
+
+        response = self.upload(request_factory=request_factory, user=active_user, file=file)
+
+        job = ImportJob.objects.get(user=active_user)
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data['status'] == 'pending'
+        assert job.file_format == ImportJob.format_csv
+        process_import_job_mock.assert_called_once_with(job_id=str(job.id))
+
+        process_import_job(job_id=str(job.id))
+
+        job.refresh_from_db()
+        assert (job.get_status_display(), job.total_rows, job.processed_rows, job.imported_rows) == (
+            'finished', 1, 1, 1)
+        assert Project.objects.filter(user=active_user, name='Imported').exists()
+
+    def test_upload_with_unknown_format_is_rejected(self, request_factory, active_user, process_import_job_mock):
+        file = SimpleUploadedFile('history.xlsx', b'type,name')
+
+        response = self.upload(request_factory=request_factory, user=active_user, file=file)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['file_format'] == [ImportException.messages[ImportException.unknown_file_format]]
+        process_import_job_mock.assert_not_called()
+
+    def test_list_returns_own_jobs(self, request_factory, active_user, admin_user, process_import_job_mock):
+        for user in (active_user, admin_user):
+            self.upload(request_factory=request_factory, user=user,
+                        file=SimpleUploadedFile('history.jsonl', b'{"type": "project", "name": "Imported"}\n'))
+        view = ImportJobViewSet.as_view({'get': 'list'})
+        request = request_factory.get(self.base_url)
+        force_authenticate(request=request, user=active_user)
+
+        response = view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [job['id'] for job in response.data['results']] == [
+            str(job_id) for job_id in ImportJob.objects.filter(user=active_user).values_list('id', flat=True)]
@@ -0,0 +1,42 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from pomodorr.projects.models import Task
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def history_csv_file(tmpdir):
+    history_file = tmpdir.join('history.csv')
+    history_file.write('type,project,name,task,start,end\n'
+                       'task,Imported,Task,,,\n'
+                       'date_frame,Imported,,Task,2020-06-01T10:00:00Z,2020-06-01T10:25:00Z\n'
+                       'date_frame,Imported,,Task,2020-06-01T10:30:00Z,2020-06-01T10:20:00Z\n')
+    return str(history_file)
+
+
+class TestImportHistoryCommand:
+    def test_import_history(self, active_user, history_csv_file):
+        output, errors = StringIO(), StringIO()
+
+        call_command('import_history', active_user.email, history_csv_file, '--batch-size=2', stdout=output,
+                     stderr=errors)
+
+        assert Task.objects.get(user=active_user, name='Task').frames.count() == 1
+        assert 'Processed 2 of 3 rows' in output.getvalue()
+        assert 'Imported 2 of 3 rows.' in output.getvalue()
+        assert 'Row 3' in errors.getvalue()
+
+    def test_import_history_for_unknown_user(self, history_csv_file):
+        with pytest.raises(CommandError):
+            call_command('import_history', 'unknown@pomodorr.tk', history_csv_file)
+
+    def test_import_history_with_unknown_format(self, active_user, tmpdir):
+        history_file = tmpdir.join('history.txt')
+        history_file.write('')
+
+        with pytest.raises(CommandError):
+            call_command('import_history', active_user.email, str(history_file))
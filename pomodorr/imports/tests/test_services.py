@@ -0,0 +1,152 @@
+import io
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.files.base import ContentFile
+from django.utils import timezone
+
+from pomodorr.frames.models import DateFrame
+from pomodorr.imports.exceptions import ImportException
+from pomodorr.imports.models import ImportJob
+from pomodorr.imports.services import count_rows, import_history, read_rows, run_import_job
+from pomodorr.projects.models import Project, Task
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def history_rows(project_instance, task_instance):
+    start = timezone.now() - timedelta(days=1)
+    return [
+        {'type': 'project', 'name': 'Imported'},
+        {'type': 'task', 'project': 'Imported', 'name': 'Done', 'status': 'completed', 'note': 'From the old app'},
+        {'type': 'date_frame', 'project': 'Imported', 'task': 'Done', 'start': (start + timedelta(hours=1)).isoformat(),
+         'end': (start + timedelta(hours=2)).isoformat()},
+        {'type': 'date_frame', 'project': 'Imported', 'task': 'Done', 'frame_type': 'break',
+         'start': start.isoformat(), 'end': (start + timedelta(minutes=5)).isoformat()},
+        {'type': 'date_frame', 'project': project_instance.name, 'task': task_instance.name,
+         'start': start.isoformat(), 'end': (start + timedelta(minutes=25, seconds=59)).isoformat()},
+    ]
+
+
+class TestImportHistory:
+    def test_import_history_creates_records(self, active_user, project_instance, task_instance, history_rows):
+        processed, imported, errors = import_history(user=active_user, rows=history_rows, batch_size=2)
+
+        imported_project = Project.objects.get(user=active_user, name='Imported')
+        imported_task = Task.objects.get(project=imported_project, name='Done')
+        assert (processed, imported, errors) == (5, 5, [])
+        assert imported_task.status == Task.status_completed
+        assert imported_task.note == 'From the old app'
+        assert sorted(DateFrame.objects.filter(task=imported_task).values_list('duration', flat=True)) == [
+            timedelta(minutes=5), timedelta(hours=1)]
+        assert DateFrame.objects.get(task=task_instance).duration == timedelta(minutes=25)
+        assert Project.objects.filter(user=active_user, name=project_instance.name).count() == 1
+
+    def test_import_history_places_new_records_last(self, active_user, project_instance, task_instance, history_rows,
+                                                    settings):
+        history_rows.append({'type': 'task', 'project': project_instance.name, 'name': 'Imported task'})
+
+        import_history(user=active_user, rows=history_rows)
+
+        last_project_key = max(Project.objects.filter(user=active_user).exclude(name='Imported').values_list(
+            'user_defined_ordering', flat=True))
+        assert Project.objects.get(user=active_user, name='Imported').user_defined_ordering == \
+            last_project_key + settings.USER_DEFINED_ORDERING_GAP
+        assert Task.objects.get(project=project_instance, name='Imported task').user_defined_ordering == \
+            task_instance.user_defined_ordering + settings.USER_DEFINED_ORDERING_GAP
+        assert Task.objects.get(name='Done').user_defined_ordering == settings.USER_DEFINED_ORDERING_GAP
+
+    def test_import_history_reports_invalid_rows(self, active_user):
+        start = timezone.now()
+        rows = [
+            {'type': 'unknown'},
+            {'type': 'task', 'project': 'Imported'},
+            {'type': 'date_frame', 'project': 'Imported', 'task': 'Task', 'start': start.isoformat(),
+             'end': (start - timedelta(minutes=1)).isoformat()},
+            {'type': 'date_frame', 'project': 'Imported', 'task': 'Task', 'start': start.isoformat(),
+             'end': (start + timedelta(minutes=25)).isoformat()},
+            {'type': 'date_frame', 'project': 'Imported', 'task': 'Task',
+             'start': (start + timedelta(minutes=20)).isoformat(), 'end': (start + timedelta(minutes=30)).isoformat()},
+        ]
+
+        processed, imported, errors = import_history(user=active_user, rows=rows)
+
+        assert (processed, imported) == (5, 1)
+        assert [error['row'] for error in errors] == [1, 2, 3, 5]
+        assert errors[0]['errors']['type'] == [ImportException.messages[ImportException.unknown_record_type]]
+        assert 'name' in errors[1]['errors']
+        assert errors[3]['errors']['start'] == [ImportException.messages[ImportException.overlapping_date_frame]]
+        assert DateFrame.objects.filter(user=active_user).count() == 1
+
+    def test_import_history_rejects_overlapping_date_frames_of_other_batches(self, active_user):
+        start = timezone.now()
+        rows = [
+            {'type': 'date_frame', 'project': 'Imported', 'task': 'Task', 'start': start.isoformat(),
+             'end': (start + timedelta(minutes=25)).isoformat()},
+            {'type': 'date_frame', 'project': 'Imported', 'task': 'Task',
+             'start': (start - timedelta(minutes=30)).isoformat(), 'end': (start - timedelta(minutes=5)).isoformat()},
+            {'type': 'date_frame', 'project': 'Imported', 'task': 'Task',
+             'start': (start + timedelta(minutes=20)).isoformat(), 'end': (start + timedelta(minutes=30)).isoformat()},
+        ]
+
+        processed, imported, errors = import_history(user=active_user, rows=rows, batch_size=1)
+
+        assert (processed, imported) == (3, 2)
+        assert [error['row'] for error in errors] == [3]
+
+    def test_import_history_rejects_date_frames_overlapping_existing_ones(self, active_user, history_rows):
+        import_history(user=active_user, rows=history_rows)
+
+        processed, imported, errors = import_history(user=active_user, rows=history_rows, batch_size=2)
+
+        assert (processed, imported) == (5, 2)
+        assert sorted(error['row'] for error in errors) == [3, 4, 5]
+        assert DateFrame.objects.filter(user=active_user).count() == 3
+
+    def test_import_history_reports_progress(self, active_user, history_rows):
+        progress = []
+
+        import_history(user=active_user, rows=history_rows, batch_size=2,
+                       on_progress=lambda processed, imported, errors: progress.append((processed, imported)))
+
+        assert progress == [(2, 2), (4, 4), (5, 5)]
+
+    def test_run_import_job_reports_malformed_rows(self, active_user):
+        job = ImportJob.objects.create(user=active_user, file_format=ImportJob.format_ndjson,
+                                       file=ContentFile(b'{"type": "project", "name": "Imported"}\n["Task"]\n',
+                                                        name='history.jsonl'))
+
+        run_import_job(job=job)
+
+        job.refresh_from_db()
+        assert (job.status, job.processed_rows, job.imported_rows) == (ImportJob.status_finished, 2, 1)
+        assert json.loads(job.errors) == [{'row': 2, 'errors': {'non_field_errors': [
+            ImportException.messages[ImportException.malformed_row]]}}]
+
+
+class TestReadRows:
+    def test_read_csv_rows(self):
+        file = io.BytesIO(b'type,project,name\nproject,,Imported\ntask,Imported,Task\n')
+
+        assert count_rows(file=file, file_format=ImportJob.format_csv) == 2
+        assert [row['name'] for row in read_rows(file=file, file_format=ImportJob.format_csv)] == ['Imported', 'Task']
+
+    def test_read_ndjson_rows(self):
+        rows = [{'type': 'project', 'name': 'Imported'}, {'type': 'task', 'project': 'Imported', 'name': 'Task'}]
+        file = io.BytesIO('\n'.join(json.dumps(row) for row in rows).encode() + b'\n\n')
+
+        assert count_rows(file=file, file_format=ImportJob.format_ndjson) == 2
+        assert list(read_rows(file=file, file_format=ImportJob.format_ndjson)) == rows
+
+    def test_read_malformed_ndjson_rows(self, active_user):
+        file = io.BytesIO(b'{"type": "project", "name": "Imported"}\n{"type": "project", \n[1, 2]\n3\n')
+
+        processed, imported, errors = import_history(
+            user=active_user, rows=read_rows(file=file, file_format=ImportJob.format_ndjson))
+
+        assert (processed, imported) == (4, 1)
+        assert [error['row'] for error in errors] == [2, 3, 4]
+        assert {message for error in errors for message in error['errors']['non_field_errors']} == {
+            ImportException.messages[ImportException.malformed_row]}
@@ -2,9 +2,8 @@ from django.contrib import admin
 from django.db import transaction
 
 from pomodorr.projects.models import Project, Task, SubTask, Priority
-from pomodorr.projects.selectors.project_selector import (
-    undo_delete_on_queryset, get_all_projects, hard_delete_on_queryset
-)
+from pomodorr.projects.selectors.project_selector import undo_delete_on_queryset, get_all_projects
+from pomodorr.projects.services.purge_service import schedule_projects_purge
 
 
 @admin.register(Project)
@@ -23,7 +22,7 @@ class ProjectAdmin(admin.ModelAdmin):
 
     def hard_delete(modeladmin, request, queryset):
         with transaction.atomic():
-            hard_delete_on_queryset(queryset=queryset)
+            schedule_projects_purge(projects=queryset)
 
     undo_delete.short_description = 'Undo deletion of selected projects'
     hard_delete.short_description = 'Delete objects entirely from database'
@@ -1,22 +1,30 @@
 from django_auto_prefetching import AutoPrefetchViewSetMixin
 from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.viewsets import ModelViewSet
+from rest_framework.response import Response
+from rest_framework.viewsets import ModelViewSet, ViewSet
 
 from pomodorr.projects.selectors.priority_selector import get_priorities_for_user
 from pomodorr.projects.selectors.project_selector import get_active_projects_for_user
 from pomodorr.projects.selectors.sub_task_selector import get_all_sub_tasks_for_user
 from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks_for_user
-from pomodorr.projects.serializers import ProjectSerializer, PrioritySerializer, TaskSerializer, SubTaskSerializer
+from pomodorr.projects.serializers import (
+    ProjectSerializer, PrioritySerializer, TaskSerializer, SubTaskSerializer, ProjectReorderSerializer,
+    TaskReorderSerializer, SearchQuerySerializer, SearchResultSerializer
+)
+from pomodorr.projects.services.search_service import search_for_user
 from pomodorr.tools.permissions import IsObjectOwner, IsTaskOwner, IsSubTaskOwner
+from pomodorr.tools.filters import FlexFieldsProjectionFilter
 
 
 class PriorityViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'put', 'delete']
     permission_classes = (IsAuthenticated, IsObjectOwner)
+    required_query_fields = ('user',)
     serializer_class = PrioritySerializer
-    filter_backends = [OrderingFilter, DjangoFilterBackend]
+    filter_backends = [OrderingFilter, DjangoFilterBackend, FlexFieldsProjectionFilter]
     ordering_fields = ['created_at', 'priority_level', 'name']
     filterset_fields = {
         'priority_level': ['exact', 'gt', 'gte', 'lt', 'lte'],
@@ -33,8 +41,9 @@ class PriorityViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
 class ProjectViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'put', 'delete']
     permission_classes = (IsAuthenticated, IsObjectOwner)
+    required_query_fields = ('user',)
     serializer_class = ProjectSerializer
-    filter_backends = [OrderingFilter, DjangoFilterBackend]
+    filter_backends = [OrderingFilter, DjangoFilterBackend, FlexFieldsProjectionFilter]
     ordering_fields = ['created_at', 'priority__priority_level', 'user_defined_ordering', 'name']
     filterset_fields = {
         'priority__priority_level': ['exact', 'gt', 'gte', 'lt', 'lte'],
@@ -47,12 +56,25 @@ class ProjectViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
     def get_serializer_context(self):
         return dict(request=self.request)
 
+    @action(detail=True, methods=['post'])
+    def reorder(self, request, pk=None):
+        """
+        Moves the project right after the one given as "previous", or to the top if "previous" is null.
+        Only the moved project gets a new user_defined_ordering value.
+        """
+        serializer = ProjectReorderSerializer(instance=self.get_object(), data=request.data,
+                                              context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
 
 class TaskViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'put', 'delete']
     permission_classes = (IsAuthenticated, IsTaskOwner)
+    required_query_fields = ('user',)
     serializer_class = TaskSerializer
-    filter_backends = [OrderingFilter, DjangoFilterBackend]
+    filter_backends = [OrderingFilter, DjangoFilterBackend, FlexFieldsProjectionFilter]
     ordering_fields = ['created_at', 'priority__priority_level', 'user_defined_ordering', 'name']
     filterset_fields = {
         'priority__priority_level': ['exact', 'gt', 'gte', 'lt', 'lte'],
@@ -66,12 +88,25 @@ class TaskViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
     def get_serializer_context(self):
         return dict(request=self.request)
 
+    @action(detail=True, methods=['post'])
+    def reorder(self, request, pk=None):
+        """
+        Moves the task right after the one given as "previous" within the same project, or to the top if "previous"
+        is null. Only the moved task gets a new user_defined_ordering value.
+        """
+        serializer = TaskReorderSerializer(instance=self.get_object(), data=request.data,
+                                           context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
 
 class SubTaskViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'put', 'delete']
     permission_classes = (IsAuthenticated, IsSubTaskOwner)
+    required_query_fields = ('user',)
     serializer_class = SubTaskSerializer
-    filter_backends = [OrderingFilter, DjangoFilterBackend]
+    filter_backends = [OrderingFilter, DjangoFilterBackend, FlexFieldsProjectionFilter]
     ordering_fields = ['created_at', 'name', 'is_completed']
     filterset_fields = {
         'name': ['exact', 'iexact', 'contains', 'icontains'],
@@ -84,3 +119,18 @@ class SubTaskViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
 
     def get_serializer_context(self):
         return dict(request=self.request)
+
+
+class SearchViewSet(ViewSet):
+    permission_classes = (IsAuthenticated,)
+
+    def list(self, request):
+        """
+        Returns the user's projects, tasks and sub tasks whose names (or notes in case of tasks) contain the phrase
+        passed as the "q" query parameter.
+        """
+        query_serializer = SearchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        results = search_for_user(user=request.user, phrase=query_serializer.validated_data['q'])
+        return Response(SearchResultSerializer(instance=results).data)
@@ -1,4 +1,6 @@
 from django.apps import AppConfig
+from django.db import connection
+from django.db.models.signals import post_save, post_delete
 from django.utils.translation import gettext_lazy as _
 
 
@@ -9,10 +11,19 @@ class ProjectsConfig(AppConfig):
     def ready(self):
         try:
             from pomodorr.projects.signals.dispatchers import notify_force_finish
-            from pomodorr.projects.signals.handlers import task_completed_notify_channel
+            from pomodorr.projects.signals.handlers import task_completed_notify_channel, search_indexed_object_changed
 
             notify_force_finish.connect(receiver=task_completed_notify_channel,
                                         dispatch_uid='pomodorr.projects.signals.task_completed_notify_channel')
 
+            if connection.vendor != 'postgresql':
+                #  Only the in-process search index fallback needs to be notified about the changes
+                for model_name in ('Project', 'Task', 'SubTask'):
+                    model = self.get_model(model_name)
+                    post_save.connect(receiver=search_indexed_object_changed, sender=model,
+                                      dispatch_uid=f'pomodorr.projects.signals.{model_name}_search_saved')
+                    post_delete.connect(receiver=search_indexed_object_changed, sender=model,
+                                        dispatch_uid=f'pomodorr.projects.signals.{model_name}_search_deleted')
+
         except ImportError:
             pass  # noqa F401
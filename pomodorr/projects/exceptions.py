@@ -13,10 +13,12 @@ class PriorityException(ValidationError):
 class ProjectException(ValidationError):
     project_duplicated = 'project_duplicated'
     priority_does_not_exist = 'priority_does_not_exist'
+    project_does_not_exist = 'project_does_not_exist'
 
     messages = {
         project_duplicated: _('Project name must be unique.'),
         priority_does_not_exist: _('The chosen priority does not exist.'),
+        project_does_not_exist: _('The chosen project does not exist.'),
     }
 
     def __init__(self, message, code=None, params=None):
@@ -30,6 +32,7 @@ class TaskException(ValidationError):
     task_duplicated = 'task_duplicated'
     priority_does_not_exist = 'priority_does_not_exist'
     project_does_not_exist = 'project_does_not_exist'
+    task_does_not_exist = 'task_does_not_exist'
     wrong_status = 'wrong_status'
     invalid_duration = 'invalid_duration'
     invalid_due_date = 'invalid_due_date'
@@ -40,6 +43,7 @@ class TaskException(ValidationError):
         already_active: _('The task is already active.'),
         priority_does_not_exist: _('The chosen priority does not exist.'),
         project_does_not_exist: _('The chosen project does not exist.'),
+        task_does_not_exist: _('The chosen task does not exist within the same project.'),
         wrong_status: _('Only active tasks can be created.'),
         invalid_duration: _('Repeat value has to be full days, weeks, months or years.'),
         invalid_due_date: _('Due date cannot be lesser than today.')
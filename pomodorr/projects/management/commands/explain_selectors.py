@@ -0,0 +1,78 @@
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from pomodorr.frames.models import DateFrame
+from pomodorr.projects.models import Priority, Project, SubTask, Task
+from pomodorr.tools.explain import analyze_tables, explain_selectors, has_sequential_scan
+
+User = get_user_model()
+
+
+def seed_database(users: int, projects: int, tasks: int, date_frames: int) -> None:
+    #  Every task gets its date frames in the past, with the latest one still in progress
+    now = timezone.now()
+    pomodoro_length = timedelta(minutes=25)
+    password = make_password(None)
+
+    seeded_users = User.objects.bulk_create([
+        User(username=f'seeded_{uuid.uuid4().hex}', email=f'{uuid.uuid4().hex}@seeded.pomodorr', password=password)
+        for _ in range(users)
+    ])
+    priorities = Priority.objects.bulk_create([Priority(name='Seeded', user=user) for user in seeded_users])
+    seeded_projects = Project.objects.bulk_create([
+        Project(name=f'Seeded project {index}', user=priority.user, priority=priority, user_defined_ordering=index)
+        for priority in priorities for index in range(projects)
+    ])
+    seeded_tasks = Task.objects.bulk_create([
+        Task(name=f'Seeded task {index}', project=project, user_id=project.user_id, priority=project.priority,
+             status=index % 2, user_defined_ordering=index, note='seeded')
+        for project in seeded_projects for index in range(tasks)
+    ])
+    SubTask.objects.bulk_create([
+        SubTask(name='Seeded sub task', task=task, user_id=task.user_id) for task in seeded_tasks
+    ])
+    DateFrame.objects.bulk_create([
+        DateFrame(task=task, user_id=task.user_id, frame_type=DateFrame.pomodoro_type,
+                  start=now - (index + 1) * 2 * pomodoro_length,
+                  end=now - (index + 1) * 2 * pomodoro_length + pomodoro_length if index else None,
+                  duration=pomodoro_length if index else None)
+        for task in seeded_tasks for index in range(date_frames)
+    ])
+
+
+class Command(BaseCommand):
+    help = 'Runs every selector against the database and reports their EXPLAIN plans.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed-users', type=int, default=0,
+                            help='Number of users to seed with data before explaining, the data is rolled back.')
+        parser.add_argument('--projects', type=int, default=5, help='Number of projects per seeded user.')
+        parser.add_argument('--tasks', type=int, default=20, help='Number of tasks per seeded project.')
+        parser.add_argument('--date-frames', type=int, default=10, help='Number of date frames per seeded task.')
+        parser.add_argument('--only-scans', action='store_true',
+                            help='Report only the selectors whose plans contain sequential scans.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options['seed_users']:
+                seed_database(users=options['seed_users'], projects=options['projects'], tasks=options['tasks'],
+                              date_frames=options['date_frames'])
+                analyze_tables()
+
+            for selector_name, sql, plan in explain_selectors():
+                if options['only_scans'] and not (sql is not None and has_sequential_scan(plan=plan)):
+                    continue
+
+                self.stdout.write(self.style.MIGRATE_HEADING(selector_name))
+                if sql is not None:
+                    self.stdout.write(sql)
+                self.stdout.write(self.style.WARNING(plan) if has_sequential_scan(plan=plan) else plan)
+                self.stdout.write('')
+
+            transaction.set_rollback(True)
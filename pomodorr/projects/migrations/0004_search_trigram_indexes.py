@@ -0,0 +1,38 @@
+from django.db import migrations
+
+TRIGRAM_INDEXES = (
+    ('projects_project', 'name', 'project_name_trgm_idx'),
+    ('projects_task', 'name', 'task_name_trgm_idx'),
+    ('projects_task', 'note', 'task_note_trgm_idx'),
+    ('projects_subtask', 'name', 'sub_task_name_trgm_idx'),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    #  The indexed expression matches the one PostgreSQL backend generates for "icontains" lookups
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, column, index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gin (UPPER({column}::text) gin_trgm_ops)')
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for table, column, index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_task_break_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,59 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_task_owners(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    Task = apps.get_model('projects', 'Task')
+    SubTask = apps.get_model('projects', 'SubTask')
+
+    Task._base_manager.update(
+        user_id=Subquery(Project._base_manager.filter(id=OuterRef('project_id')).values('user_id')[:1]))
+    SubTask._base_manager.update(
+        user_id=Subquery(Task._base_manager.filter(id=OuterRef('task_id')).values('user_id')[:1]))
+
+
+def fire_deferred_constraint_checks(apps, schema_editor):
+    #  The backfill leaves pending checks of the deferrable foreign key, PostgreSQL refuses to alter the table until
+    #  they have fired
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('projects', '0004_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='user',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='tasks', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='subtask',
+            name='user',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='sub_tasks', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(fill_task_owners, migrations.RunPython.noop),
+        migrations.RunPython(fire_deferred_constraint_checks, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='task',
+            name='user',
+            field=models.ForeignKey(blank=True, editable=False, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='tasks', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='subtask',
+            name='user',
+            field=models.ForeignKey(blank=True, editable=False, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='sub_tasks', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.0.7 on 2026-10-19 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_denormalized_task_owner'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='project',
+            options={'ordering': ('created_at', 'user_defined_ordering'), 'verbose_name_plural': 'Projects'},
+        ),
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ('created_at', 'user_defined_ordering'), 'verbose_name_plural': 'Tasks'},
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'created_at'], name='project_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'status', 'created_at'], name='task_user_status_created_idx'),
+        ),
+    ]
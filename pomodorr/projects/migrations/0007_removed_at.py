@@ -0,0 +1,51 @@
+# Generated by Django 3.0.7 on 2026-10-19 08:52
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def fill_removed_at(apps, schema_editor):
+    #  The items removed before the column existed start their retention period with the migration
+    now = timezone.now()
+    for model_name in ('Project', 'Task'):
+        model = apps.get_model('projects', model_name)
+        model._base_manager.filter(is_removed=True, removed_at__isnull=True).update(removed_at=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_selector_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='project',
+            managers=[
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='task',
+            managers=[
+            ],
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='removed_at',
+            field=models.DateTimeField(blank=True, default=None, editable=False, null=True, verbose_name='removed at'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='removed_at',
+            field=models.DateTimeField(blank=True, default=None, editable=False, null=True, verbose_name='removed at'),
+        ),
+        migrations.RunPython(fill_removed_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(is_removed=True), fields=['removed_at'], name='project_removed_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(is_removed=True), fields=['removed_at'], name='task_removed_at_idx'),
+        ),
+    ]
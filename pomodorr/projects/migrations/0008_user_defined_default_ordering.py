@@ -0,0 +1,29 @@
+# Generated by Django 3.0.7 on 2026-10-19 09:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_removed_at'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='project',
+            options={'ordering': ('user_defined_ordering', 'created_at'), 'verbose_name_plural': 'Projects'},
+        ),
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ('user_defined_ordering', 'created_at'), 'verbose_name_plural': 'Tasks'},
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='project_user_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'user_defined_ordering', 'created_at'], name='project_user_ordering_idx'),
+        ),
+    ]
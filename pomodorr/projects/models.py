@@ -7,15 +7,26 @@ from django.db import models
 from django.db.models import Q, DurationField
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from model_utils import FieldTracker
+from model_utils.managers import SoftDeletableManagerMixin
 from model_utils.models import SoftDeletableModel, TimeFramedModel
 
 
 class CustomSoftDeletableQueryset(models.QuerySet):
     def delete(self, soft=True):
         if soft:
-            self.update(is_removed=True)
+            from pomodorr.projects.services.search_service import (
+                get_search_index_owners, invalidate_search_indexes, is_search_index_used
+            )
+
+            user_ids = get_search_index_owners(queryset=self) if is_search_index_used() else set()
+            self.update(is_removed=True, removed_at=timezone.now())
+            invalidate_search_indexes(user_ids=user_ids)
         else:
-            super(CustomSoftDeletableQueryset, self).delete()
+            #  The dependent rows get deleted bottom up in chunks, instead of being loaded by the deletion collector
+            from pomodorr.projects.services.purge_service import purge_queryset
+
+            return purge_queryset(queryset=self)
 
 
 class CustomManagerMixin:
@@ -26,6 +37,31 @@ class CustomSoftDeletableManager(CustomManagerMixin, models.Manager):
     pass
 
 
+class CustomNonRemovedManager(CustomManagerMixin, SoftDeletableManagerMixin, models.Manager):
+    pass
+
+
+class CustomSoftDeletableModel(SoftDeletableModel):
+    #  Set when the object gets removed softly, the removed objects are purged once the retention period has passed
+    removed_at = models.DateTimeField(_('removed at'), blank=True, null=True, default=None, editable=False)
+
+    objects = CustomNonRemovedManager()
+    all_objects = CustomSoftDeletableManager()
+
+    class Meta:
+        abstract = True
+
+    def delete(self, using=None, soft=True, *args, **kwargs):
+        if soft:
+            self.removed_at = timezone.now()
+        return super(CustomSoftDeletableModel, self).delete(using=using, soft=soft, *args, **kwargs)
+
+
+def add_updated_owner(update_fields):
+    #  The re-derived owner has to be written along with the changed parent
+    return update_fields if update_fields is None else {*update_fields, 'user'}
+
+
 class Priority(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(blank=False, null=False, max_length=128)
@@ -46,7 +82,7 @@ class Priority(models.Model):
         return f'{self.priority_level} - {self.name}'
 
 
-class Project(SoftDeletableModel):
+class Project(CustomSoftDeletableModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(null=False, blank=False, max_length=128)
     priority = models.ForeignKey(to='projects.Priority', blank=True, null=True, on_delete=models.SET_NULL,
@@ -56,20 +92,37 @@ class Project(SoftDeletableModel):
                              related_name='projects')
     created_at = models.DateTimeField(_('created at'), default=timezone.now, editable=False)
 
-    all_objects = CustomSoftDeletableManager()
+    tracker = FieldTracker(fields=['user_id'])
 
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=['name', 'user'], name='unique_user_project', condition=Q(is_removed=False))
         ]
-        ordering = ('created_at', 'user_defined_ordering', '-priority__priority_level')
+        indexes = [
+            models.Index(fields=['user', 'user_defined_ordering', 'created_at'], name='project_user_ordering_idx'),
+            models.Index(fields=['removed_at'], condition=Q(is_removed=True), name='project_removed_at_idx')
+        ]
+        #  Ordering by the priority level would join the priorities to every query of the projects, the creation date
+        #  only breaks the ties of the user defined ordering, the same way ordering_service does
+        ordering = ('user_defined_ordering', 'created_at')
         verbose_name_plural = _('Projects')
 
     def __str__(self):
         return f'{self.name}'
 
+    def save(self, *args, **kwargs):
+        previous_owner_id = self.tracker.previous('user_id')
+        owner_changed = not self._state.adding and self.tracker.has_changed('user_id')
+        super(Project, self).save(*args, **kwargs)
+
+        if owner_changed:
+            from pomodorr.projects.services.task_service import change_tasks_owner
 
-class Task(SoftDeletableModel):
+            change_tasks_owner(tasks=Task.all_objects.filter(project_id=self.id), user_id=self.user_id,
+                               previous_user_id=previous_owner_id)
+
+
+class Task(CustomSoftDeletableModel):
     status_active = 0
     status_completed = 1
 
@@ -92,10 +145,13 @@ class Task(SoftDeletableModel):
     repeat_duration = models.DurationField(blank=True, null=True, default=None)
     project = models.ForeignKey(to='projects.Project', null=False, blank=False, on_delete=models.CASCADE,
                                 related_name='tasks')
+    #  Denormalized owner of the project, so that the tasks can be filtered by their owners without any joins
+    user = models.ForeignKey(to='users.User', null=False, blank=True, editable=False, on_delete=models.CASCADE,
+                             related_name='tasks')
     note = models.TextField(blank=True)
     created_at = models.DateTimeField(_('created at'), default=timezone.now, editable=False)
 
-    all_objects = CustomSoftDeletableManager()
+    tracker = FieldTracker(fields=['project_id', 'user_id'])
 
     class Meta:
         constraints = [
@@ -103,27 +159,45 @@ class Task(SoftDeletableModel):
                                     condition=Q(is_removed=False) & Q(status=0))
         ]
         indexes = [
-            models.Index(fields=['status'], name='index_status_active', condition=Q(status=0))
+            models.Index(fields=['status'], name='index_status_active', condition=Q(status=0)),
+            models.Index(fields=['user', 'status', 'created_at'], name='task_user_status_created_idx'),
+            models.Index(fields=['removed_at'], condition=Q(is_removed=True), name='task_removed_at_idx')
         ]
-        ordering = ('created_at', 'user_defined_ordering', '-priority__priority_level')
+        #  Ordering by the priority level would join the priorities to every query of the tasks, the creation date
+        #  only breaks the ties of the user defined ordering, the same way ordering_service does
+        ordering = ('user_defined_ordering', 'created_at')
         verbose_name_plural = _('Tasks')
 
     def __str__(self):
         return f'{self.name}'
 
+    def save(self, *args, **kwargs):
+        #  The owner follows the project, also when the task gets moved to the project of someone else
+        if self.project_id is not None and (self.user_id is None or self.tracker.has_changed('project_id')):
+            self.user_id = self.project.user_id
+            kwargs['update_fields'] = add_updated_owner(update_fields=kwargs.get('update_fields'))
+
+        previous_owner_id = self.tracker.previous('user_id')
+        owner_changed = not self._state.adding and self.tracker.has_changed('user_id')
+        super(Task, self).save(*args, **kwargs)
+
+        if owner_changed:
+            from pomodorr.projects.services.task_service import change_tasks_owner
+
+            change_tasks_owner(tasks=Task.all_objects.filter(id=self.id), user_id=self.user_id,
+                               previous_user_id=previous_owner_id)
+
     @property
     def normalized_pomodoro_length(self) -> Union[None, timedelta, DurationField]:
-        user_settings = self.project.user.settings
-        global_pomodoro_length = user_settings.pomodoro_length
+        from pomodorr.projects.services.task_service import get_task_timer_settings
 
-        return self.pomodoro_length if self.pomodoro_length is not None else global_pomodoro_length
+        return get_task_timer_settings(task=self)['pomodoro_length']
 
     @property
     def normalized_break_length(self) -> Union[None, timedelta, DurationField]:
-        user_settings = self.project.user.settings
-        global_break_length = user_settings.short_break_length
+        from pomodorr.projects.services.task_service import get_task_timer_settings
 
-        return self.break_length if self.break_length is not None else global_break_length
+        return get_task_timer_settings(task=self)['break_length']
 
 
 class SubTask(models.Model):
@@ -131,9 +205,14 @@ class SubTask(models.Model):
     name = models.CharField(blank=False, null=False, max_length=128)
     task = models.ForeignKey(to='projects.Task', null=False, blank=False, on_delete=models.CASCADE,
                              related_name='sub_tasks')
+    #  Denormalized owner of the task, so that the sub tasks can be filtered by their owners without any joins
+    user = models.ForeignKey(to='users.User', null=False, blank=True, editable=False, on_delete=models.CASCADE,
+                             related_name='sub_tasks')
     created_at = models.DateTimeField(_('created at'), default=timezone.now, editable=False)
     is_completed = models.BooleanField(default=False)
 
+    tracker = FieldTracker(fields=['task_id'])
+
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=['name', 'task'], name='unique_sub_task')
@@ -143,3 +222,9 @@ class SubTask(models.Model):
 
     def __str__(self):
         return f'{self.name}'
+
+    def save(self, *args, **kwargs):
+        if self.task_id is not None and (self.user_id is None or self.tracker.has_changed('task_id')):
+            self.user_id = self.task.user_id
+            kwargs['update_fields'] = add_updated_owner(update_fields=kwargs.get('update_fields'))
+        return super(SubTask, self).save(*args, **kwargs)
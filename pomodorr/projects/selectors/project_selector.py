@@ -27,9 +27,15 @@ def get_all_projects(**kwargs):
     return models.Project.all_objects.all(**kwargs)
 
 
-def hard_delete_on_queryset(queryset) -> None:
-    queryset.delete(soft=False)
+def hard_delete_on_queryset(queryset) -> int:
+    return queryset.delete(soft=False)
 
 
 def undo_delete_on_queryset(queryset) -> None:
-    queryset.update(is_removed=False)
+    from pomodorr.projects.services.search_service import (
+        get_search_index_owners, invalidate_search_indexes, is_search_index_used
+    )
+
+    user_ids = get_search_index_owners(queryset=queryset) if is_search_index_used() else set()
+    queryset.update(is_removed=False, removed_at=None)
+    invalidate_search_indexes(user_ids=user_ids)
@@ -0,0 +1,18 @@
+from django.contrib.auth.models import AbstractUser
+from django.db.models import Q
+
+from pomodorr.projects.selectors.project_selector import get_active_projects_for_user
+from pomodorr.projects.selectors.sub_task_selector import get_all_sub_tasks_for_user
+from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks
+
+
+def search_projects_for_user(user: AbstractUser, phrase: str):
+    return get_active_projects_for_user(user=user, name__icontains=phrase)
+
+
+def search_tasks_for_user(user: AbstractUser, phrase: str):
+    return get_all_non_removed_tasks(user=user).filter(Q(name__icontains=phrase) | Q(note__icontains=phrase))
+
+
+def search_sub_tasks_for_user(user: AbstractUser, phrase: str):
+    return get_all_sub_tasks_for_user(user=user, name__icontains=phrase)
@@ -24,21 +24,21 @@ def get_all_tasks(**kwargs):
 
 
 def get_active_tasks_for_user(user: AbstractUser, **kwargs):
-    return Task.objects.filter(status=0, project__user=user, **kwargs)
+    return Task.objects.filter(status=0, user=user, **kwargs)
 
 
 def get_completed_tasks_for_user(user: AbstractUser, **kwargs):
-    return Task.objects.filter(status=1, project__user=user, **kwargs)
+    return Task.objects.filter(status=1, user=user, **kwargs)
 
 
 def get_removed_tasks_for_user(user: AbstractUser, **kwargs):
-    return Task.all_objects.filter(is_removed=True, project__user=user, **kwargs)
+    return Task.all_objects.filter(is_removed=True, user=user, **kwargs)
 
 
 def get_all_non_removed_tasks_for_user(user: AbstractUser, **kwargs):
-    return Task.objects.select_related('project__user', 'priority').prefetch_related('sub_tasks').filter(
-        project__user=user, **kwargs).distinct()
+    return Task.objects.select_related('project', 'priority').prefetch_related('sub_tasks').filter(
+        user=user, **kwargs).distinct()
 
 
 def get_all_tasks_for_user(user: AbstractUser, **kwargs):
-    return Task.all_objects.filter(project__user=user, **kwargs)
+    return Task.all_objects.filter(user=user, **kwargs)
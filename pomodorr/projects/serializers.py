@@ -1,24 +1,24 @@
 from datetime import timedelta
 
+from django.conf import settings
+from rest_flex_fields.serializers import FlexFieldsSerializerMixin
 from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 
 from pomodorr.projects.exceptions import ProjectException, PriorityException, TaskException, SubTaskException
 from pomodorr.projects.models import Project, Priority, Task, SubTask
-from pomodorr.projects.selectors.priority_selector import get_priorities_for_user, get_all_priorities
-from pomodorr.projects.selectors.project_selector import get_all_active_projects, get_active_projects_for_user
-from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks, get_all_non_removed_tasks_for_user
-from pomodorr.projects.services.project_service import is_project_name_available
-from pomodorr.projects.services.sub_task_service import is_sub_task_name_available
-from pomodorr.projects.services.task_service import (
-    complete_task, reactivate_task, pin_to_project, is_task_name_available
-)
+from pomodorr.projects.selectors.priority_selector import get_all_priorities
+from pomodorr.projects.selectors.project_selector import get_all_active_projects
+from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks
+from pomodorr.projects.services.project_service import reorder_project
+from pomodorr.projects.services.task_service import complete_task, reactivate_task, pin_to_project, reorder_task
+from pomodorr.tools.serializers import UniqueConstraintErrorsMixin, UserScopedPrimaryKeyRelatedField
 from pomodorr.tools.utils import has_changed
 from pomodorr.tools.validators import duration_validator, today_validator
 from pomodorr.users.selectors import get_active_standard_users
 
 
-class PrioritySerializer(serializers.ModelSerializer):
+class PrioritySerializer(FlexFieldsSerializerMixin, UniqueConstraintErrorsMixin, serializers.ModelSerializer):
     priority_level = serializers.IntegerField(required=True, min_value=1)
     user = serializers.PrimaryKeyRelatedField(write_only=True, default=serializers.CurrentUserDefault(),
                                               queryset=get_active_standard_users())
@@ -27,78 +27,71 @@ class PrioritySerializer(serializers.ModelSerializer):
         model = Priority
         fields = ('id', 'name', 'priority_level', 'color', 'user')
 
-    def validate(self, data):
-        self.check_priority_name_uniqueness(data=data)
-        return data
-
-    def check_priority_name_uniqueness(self, data):
-        user = self.context['request'].user
-        name = data.get('name') or None
+    unique_constraint_errors = {
+        'unique_user_priority': ('name', PriorityException, PriorityException.priority_duplicated)
+    }
 
-        if name is not None and get_priorities_for_user(user=user, name=name).exists():
-            raise serializers.ValidationError(
-                {'name': PriorityException.messages[PriorityException.priority_duplicated]},
-                code=PriorityException.priority_duplicated)
-        return data
 
-
-class ProjectSerializer(ModelSerializer):
+class ProjectSerializer(FlexFieldsSerializerMixin, UniqueConstraintErrorsMixin, ModelSerializer):
     user = serializers.PrimaryKeyRelatedField(write_only=True, default=serializers.CurrentUserDefault(),
                                               queryset=get_active_standard_users())
-    priority = serializers.PrimaryKeyRelatedField(required=False, allow_null=True,
-                                                  queryset=get_all_priorities())
+    priority = UserScopedPrimaryKeyRelatedField(
+        required=False, allow_null=True,
+        queryset=get_all_priorities(),
+        does_not_exist_error=(ProjectException, ProjectException.priority_does_not_exist)
+    )
     user_defined_ordering = serializers.IntegerField(min_value=1)
 
     class Meta:
         model = Project
         fields = ('id', 'name', 'priority', 'user_defined_ordering', 'user')
 
-    def validate_priority(self, value):
-        user = self.context['request'].user
-
-        if not get_priorities_for_user(user=user).filter(id=value.id).exists():
-            raise serializers.ValidationError(ProjectException.messages[ProjectException.priority_does_not_exist],
-                                              code=ProjectException.priority_does_not_exist)
-        return value
+    unique_constraint_errors = {
+        'unique_user_project': ('name', ProjectException, ProjectException.project_duplicated)
+    }
 
-    def validate(self, data):
-        #  Temporary solution for https://github.com/encode/django-rest-framework/issues/7100
-        self.check_project_name_uniqueness(data=data)
+    def to_representation(self, instance):
+        data = super(ProjectSerializer, self).to_representation(instance=instance)
+        if 'priority' in data:
+            data['priority'] = PrioritySerializer(instance=instance.priority).data
         return data
 
-    def check_project_name_uniqueness(self, data):
+
+class ProjectReorderSerializer(serializers.Serializer):
+    previous = serializers.PrimaryKeyRelatedField(required=True, allow_null=True,
+                                                  queryset=get_all_active_projects())
+
+    def validate_previous(self, value):
         user = self.context['request'].user
-        name = data.get('name') or None
 
-        if user is not None and name is not None and not is_project_name_available(
-            user=user, name=name, excluded=self.instance):
-            raise serializers.ValidationError(
-                {'name': ProjectException.messages[ProjectException.project_duplicated]},
-                code=ProjectException.project_duplicated)
+        if value is not None and value.user_id != user.id:
+            raise serializers.ValidationError(ProjectException.messages[ProjectException.project_does_not_exist],
+                                              code=ProjectException.project_does_not_exist)
+        return value
+
+    def update(self, instance, validated_data):
+        return reorder_project(project=instance, previous=validated_data['previous'])
 
     def to_representation(self, instance):
-        data = super(ProjectSerializer, self).to_representation(instance=instance)
-        data['priority'] = PrioritySerializer(instance=instance.priority).data
-        return data
+        return ProjectSerializer(instance=instance, context=self.context).data
 
 
-class SubTaskSerializer(serializers.ModelSerializer):
-    task = serializers.PrimaryKeyRelatedField(
+class SubTaskSerializer(FlexFieldsSerializerMixin, UniqueConstraintErrorsMixin, serializers.ModelSerializer):
+    task = UserScopedPrimaryKeyRelatedField(
         required=True,
-        queryset=get_all_non_removed_tasks()
+        queryset=get_all_non_removed_tasks(),
+        does_not_exist_error=(SubTaskException, SubTaskException.task_does_not_exist)
     )
 
     class Meta:
         model = SubTask
         fields = ('id', 'name', 'task', 'is_completed')
 
-    def validate_task(self, value):
-        user = self.context['request'].user
-
-        if value and not get_all_non_removed_tasks_for_user(user=user, id=value.id).exists():
-            raise serializers.ValidationError(SubTaskException.messages[SubTaskException.task_does_not_exist],
-                                              code=SubTaskException.task_does_not_exist)
+    unique_constraint_errors = {
+        'unique_sub_task': ('name', SubTaskException, SubTaskException.sub_task_duplicated)
+    }
 
+    def validate_task(self, value):
         if value and value.status == Task.status_completed:
             raise serializers.ValidationError(SubTaskException.messages[SubTaskException.task_already_completed],
                                               code=SubTaskException.task_already_completed)
@@ -109,30 +102,17 @@ class SubTaskSerializer(serializers.ModelSerializer):
 
         return value
 
-    def validate(self, data):
-        self.check_sub_task_name_uniqueness(data=data)
-        return data
-
-    def check_sub_task_name_uniqueness(self, data):
-        name = data.get('name') or None
-        task = data.get('task') or None
-        user = self.context['request'].user
-
-        if name is not None and task is not None and user is not None and \
-            not is_sub_task_name_available(task=task, name=name, excluded=self.instance):
-            raise serializers.ValidationError(
-                {'name': [SubTaskException.messages[SubTaskException.sub_task_duplicated]]},
-                code=SubTaskException.sub_task_duplicated)
-
 
-class TaskSerializer(serializers.ModelSerializer):
-    project = serializers.PrimaryKeyRelatedField(
+class TaskSerializer(FlexFieldsSerializerMixin, UniqueConstraintErrorsMixin, serializers.ModelSerializer):
+    project = UserScopedPrimaryKeyRelatedField(
         required=True,
-        queryset=get_all_active_projects()
+        queryset=get_all_active_projects().select_related('priority'),
+        does_not_exist_error=(TaskException, TaskException.project_does_not_exist)
     )
-    priority = serializers.PrimaryKeyRelatedField(
+    priority = UserScopedPrimaryKeyRelatedField(
         required=False, allow_empty=True, allow_null=True,
-        queryset=get_all_priorities()
+        queryset=get_all_priorities(),
+        does_not_exist_error=(TaskException, TaskException.priority_does_not_exist)
     )
     user_defined_ordering = serializers.IntegerField(min_value=1)
     pomodoro_length = serializers.DurationField(required=False, allow_null=True, min_value=timedelta(minutes=5),
@@ -150,21 +130,9 @@ class TaskSerializer(serializers.ModelSerializer):
             'id', 'name', 'status', 'project', 'priority', 'user_defined_ordering', 'pomodoro_number',
             'pomodoro_length', 'break_length', 'due_date', 'reminder_date', 'repeat_duration', 'note', 'sub_tasks')
 
-    def validate_project(self, value):
-        user = self.context['request'].user
-
-        if not get_active_projects_for_user(user=user, id=value.id).exists():
-            raise serializers.ValidationError(TaskException.messages[TaskException.project_does_not_exist],
-                                              code=TaskException.project_does_not_exist)
-        return value
-
-    def validate_priority(self, value):
-        user = self.context['request'].user
-
-        if value and not get_priorities_for_user(user=user).filter(id=value.id).exists():
-            raise serializers.ValidationError(TaskException.messages[TaskException.priority_does_not_exist],
-                                              code=TaskException.priority_does_not_exist)
-        return value
+    unique_constraint_errors = {
+        'unique_project_task': ('name', TaskException, TaskException.task_duplicated)
+    }
 
     def validate_status(self, value):
         if not self.instance and value and value == self.Meta.model.status_completed:
@@ -172,6 +140,12 @@ class TaskSerializer(serializers.ModelSerializer):
                                               code=TaskException.wrong_status)
         return value
 
+    def create(self, validated_data):
+        instance = super(TaskSerializer, self).create(validated_data)
+        #  A freshly created task has no sub tasks, there is no need to query them for the representation
+        instance._prefetched_objects_cache = {'sub_tasks': instance.sub_tasks.none()}
+        return instance
+
     def update(self, instance, validated_data):
         status = validated_data.pop('status') if 'status' in validated_data else None
         project = validated_data.pop('project') if 'project' in validated_data else None
@@ -187,23 +161,57 @@ class TaskSerializer(serializers.ModelSerializer):
 
         return super(TaskSerializer, self).update(instance, validated_data)
 
-    def validate(self, data):
-        # Temporary solution for https://github.com/encode/django-rest-framework/issues/7100
-        self.check_task_name_uniqueness(data=data)
+    def to_representation(self, instance):
+        data = super(TaskSerializer, self).to_representation(instance=instance)
+        #  The fields might have been narrowed down with the "fields" or "omit" query parameters
+        if 'status' in data:
+            data['status'] = instance.get_status_display()
+        if 'priority' in data:
+            data['priority'] = PrioritySerializer(instance=instance.priority).data
+        if 'project' in data:
+            data['project'] = ProjectSerializer(instance=instance.project).data
         return data
 
-    def check_task_name_uniqueness(self, data):
-        name = data.get('name') or None
-        project = data.get('project') or None
 
-        if name is not None and project is not None and not is_task_name_available(
-            project=project, name=name, excluded=self.instance):
-            raise serializers.ValidationError({'name': TaskException.messages[TaskException.task_duplicated]},
-                                              code=TaskException.task_duplicated)
+class TaskReorderSerializer(serializers.Serializer):
+    previous = serializers.PrimaryKeyRelatedField(required=True, allow_null=True,
+                                                  queryset=get_all_non_removed_tasks())
+
+    def validate_previous(self, value):
+        if value is not None and value.project_id != self.instance.project_id:
+            raise serializers.ValidationError(TaskException.messages[TaskException.task_does_not_exist],
+                                              code=TaskException.task_does_not_exist)
+        return value
+
+    def update(self, instance, validated_data):
+        return reorder_task(task=instance, previous=validated_data['previous'])
 
     def to_representation(self, instance):
-        data = super(TaskSerializer, self).to_representation(instance=instance)
-        data['status'] = instance.get_status_display()
-        data['priority'] = PrioritySerializer(instance=instance.priority).data
-        data['project'] = ProjectSerializer(instance=instance.project).data
-        return data
+        return TaskSerializer(instance=instance, context=self.context).data
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=settings.SEARCH_PHRASE_MIN_LENGTH, max_length=128)
+
+
+class ProjectSearchResultSerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+
+
+class TaskSearchResultSerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    project = serializers.UUIDField(source='project_id', read_only=True)
+
+
+class SubTaskSearchResultSerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    task = serializers.UUIDField(source='task_id', read_only=True)
+
+
+class SearchResultSerializer(serializers.Serializer):
+    projects = ProjectSearchResultSerializer(many=True, read_only=True)
+    tasks = TaskSearchResultSerializer(many=True, read_only=True)
+    sub_tasks = SubTaskSearchResultSerializer(many=True, read_only=True)
@@ -0,0 +1,92 @@
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, QuerySet
+
+from pomodorr.tools.routers import pin_owners_to_primary
+
+
+def get_ordering_key_between(previous_key: Optional[int], next_key: Optional[int]) -> Optional[int]:
+    lower_key = previous_key if previous_key is not None else 0
+
+    if next_key is None:
+        return lower_key + settings.USER_DEFINED_ORDERING_GAP
+
+    if next_key - lower_key > 1:
+        return (lower_key + next_key) // 2
+    return None
+
+
+def get_next_sibling_key(siblings: QuerySet, previous=None) -> Optional[int]:
+    ordered_siblings = siblings.order_by('user_defined_ordering', 'created_at')
+
+    if previous is not None:
+        ordered_siblings = ordered_siblings.filter(
+            Q(user_defined_ordering__gt=previous.user_defined_ordering) |
+            Q(user_defined_ordering=previous.user_defined_ordering, created_at__gt=previous.created_at)
+        )
+    return ordered_siblings.values_list('user_defined_ordering', flat=True).first()
+
+
+def place_after(instance, siblings: QuerySet, previous=None) -> bool:
+    """
+    Moves the instance right after the previous sibling, or in front of all the siblings if there is no previous one.
+    Usually only the moved row gets updated, its new key is the midpoint between the keys of its new neighbours.
+    When there is no free key left between them, the whole set of siblings gets rebalanced immediately.
+
+    :return: bool telling whether the gap around the new key got exhausted and the siblings should be rebalanced
+    """
+    if previous is not None and previous.pk == instance.pk:
+        return False
+
+    siblings = siblings.exclude(pk=instance.pk)
+    previous_key = previous.user_defined_ordering if previous is not None else None
+    next_key = get_next_sibling_key(siblings=siblings, previous=previous)
+    new_key = get_ordering_key_between(previous_key=previous_key, next_key=next_key)
+
+    if new_key is None:
+        rebalance_user_defined_ordering(queryset=siblings, instance=instance, previous=previous)
+        return False
+
+    siblings.model.all_objects.filter(pk=instance.pk).update(user_defined_ordering=new_key)
+    instance.user_defined_ordering = new_key
+
+    lower_key = previous_key if previous_key is not None else 0
+    return new_key - lower_key <= 1 or (next_key is not None and next_key - new_key <= 1)
+
+
+def rebalance_user_defined_ordering(queryset: QuerySet, instance=None, previous=None) -> int:
+    """
+    Spreads the user_defined_ordering keys of the queryset evenly, keeping their current order.
+    If the instance is given, it is put right after the previous object (or first when previous is None).
+
+    :return: int number of rebalanced objects
+    """
+    model = queryset.model
+    gap = settings.USER_DEFINED_ORDERING_GAP
+
+    with transaction.atomic():
+        ordered_rows = list(queryset.select_for_update().order_by(
+            'user_defined_ordering', 'created_at').values_list('id', 'user_id'))
+        ordered_ids = [object_id for object_id, user_id in ordered_rows]
+
+        if instance is not None:
+            if instance.pk in ordered_ids:
+                ordered_ids.remove(instance.pk)
+            position = ordered_ids.index(previous.pk) + 1 if previous is not None else 0
+            ordered_ids.insert(position, instance.pk)
+
+        rebalanced_objects = [
+            model(id=object_id, user_defined_ordering=(index + 1) * gap) for index, object_id in enumerate(ordered_ids)
+        ]
+        model.all_objects.bulk_update(rebalanced_objects, fields=['user_defined_ordering'],
+                                      batch_size=settings.USER_DEFINED_ORDERING_BATCH_SIZE)
+
+    user_ids = {user_id for object_id, user_id in ordered_rows}
+    if instance is not None:
+        instance.user_defined_ordering = (ordered_ids.index(instance.pk) + 1) * gap
+        user_ids.add(instance.user_id)
+    #  The bulk update gives the router no instance to tell the owners by, when rebalanced by the background job
+    pin_owners_to_primary(user_ids=user_ids)
+    return len(rebalanced_objects)
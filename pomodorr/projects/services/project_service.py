@@ -1,10 +1,18 @@
-from django.contrib.auth.models import AbstractUser
+from typing import Optional
 
+from django.db import transaction
+
+from pomodorr.projects.models import Project
 from pomodorr.projects.selectors.project_selector import get_active_projects_for_user
+from pomodorr.projects.services.ordering_service import place_after
+from pomodorr.projects.tasks import rebalance_projects_ordering
+
 
+def reorder_project(project: Project, previous: Optional[Project] = None) -> Project:
+    with transaction.atomic():
+        gap_exhausted = place_after(instance=project, siblings=get_active_projects_for_user(user=project.user_id),
+                                    previous=previous)
 
-def is_project_name_available(user: AbstractUser, name: str, excluded=None) -> bool:
-    query = get_active_projects_for_user(user=user, name=name)
-    if excluded is not None:
-        return not query.exclude(id=excluded.id).exists()
-    return not query.exists()
+    if gap_exhausted:
+        transaction.on_commit(lambda: rebalance_projects_ordering.delay(user_id=str(project.user_id)))
+    return project
@@ -0,0 +1,172 @@
+from datetime import datetime, timedelta
+from typing import Callable, Tuple
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from pomodorr.frames.models import DateFrame, DateFrameArchive, DateFrameSummary
+from pomodorr.imports.models import ImportJob
+from pomodorr.projects.models import Project, SubTask, Task
+from pomodorr.projects.selectors.project_selector import get_all_removed_projects
+from pomodorr.projects.selectors.task_selector import get_removed_tasks
+from pomodorr.projects.services.search_service import (
+    get_search_index_owners, invalidate_search_index, invalidate_search_indexes
+)
+from pomodorr.tools.routers import pin_owners_to_primary
+
+
+def get_write_db(queryset: QuerySet) -> str:
+    #  QuerySet.db routes the querysets which aren't written through as reads, possibly to a replica
+    return queryset._db or router.db_for_write(queryset.model)
+
+
+def get_chunk_delete_sql(queryset: QuerySet, batch_size: int) -> Tuple[str, tuple]:
+    """
+    Compiles the DELETE ... WHERE id IN (SELECT ... LIMIT) statement which deletes the next chunk of the queryset.
+    """
+    connection = connections[get_write_db(queryset=queryset)]
+    quote_name = connection.ops.quote_name
+    opts = queryset.model._meta
+
+    chunk_query = queryset.order_by().values('pk')[:batch_size].query
+    chunk_sql, params = chunk_query.get_compiler(connection=connection).as_sql()
+    sql = f'DELETE FROM {quote_name(opts.db_table)} WHERE {quote_name(opts.pk.column)} IN ({chunk_sql})'
+    return sql, params
+
+
+def purge_rows(queryset: QuerySet, batch_size: int = None) -> int:
+    """
+    Deletes the rows of the queryset in chunks, each one with a single DELETE ... WHERE id IN (SELECT ... LIMIT)
+    statement. Neither the rows nor their dependencies are loaded, so the dependent rows have to be purged first.
+    """
+    batch_size = batch_size or settings.PURGE_BATCH_SIZE
+    sql, params = get_chunk_delete_sql(queryset=queryset, batch_size=batch_size)
+    deleted = 0
+
+    with connections[get_write_db(queryset=queryset)].cursor() as cursor:
+        while True:
+            cursor.execute(sql, params)
+            deleted += cursor.rowcount
+            if cursor.rowcount < batch_size:
+                return deleted
+
+
+def purge_tasks(tasks: QuerySet, batch_size: int = None) -> int:
+    #  The date frames, their summaries and the sub tasks go first, the tasks are deleted once nothing refers to them
+    task_ids = tasks.order_by().values('id')
+    deleted = sum(
+        purge_rows(queryset=queryset, batch_size=batch_size) for queryset in (
+            DateFrame._base_manager.filter(task_id__in=task_ids),
+            DateFrameSummary._base_manager.filter(task_id__in=task_ids),
+            SubTask._base_manager.filter(task_id__in=task_ids)
+        )
+    )
+    return deleted + purge_rows(queryset=tasks, batch_size=batch_size)
+
+
+def purge_projects(projects: QuerySet, batch_size: int = None) -> int:
+    deleted = purge_tasks(tasks=Task.all_objects.filter(project_id__in=projects.order_by().values('id')),
+                          batch_size=batch_size)
+    return deleted + purge_rows(queryset=projects, batch_size=batch_size)
+
+
+def purge_queryset(queryset: QuerySet, batch_size: int = None) -> int:
+    """
+    Hard deletes the projects or the tasks of the queryset along with everything depending on them, bottom up.
+    The deletion bypasses the signals and gives the router no instance, so the search indexes of their owners get
+    invalidated afterwards and the owners get pinned to the primary database.
+    """
+    user_ids = get_search_index_owners(queryset=queryset)
+
+    if queryset.model is Project:
+        deleted = purge_projects(projects=queryset, batch_size=batch_size)
+    else:
+        deleted = purge_tasks(tasks=queryset, batch_size=batch_size)
+
+    invalidate_search_indexes(user_ids=user_ids)
+    pin_owners_to_primary(user_ids=user_ids)
+    return deleted
+
+
+def schedule_projects_purge(projects: QuerySet) -> None:
+    """
+    Hides the projects right away by removing them softly, the hard deletion of their dependency tree is left to
+    the background job.
+    """
+    from pomodorr.projects.tasks import hard_delete_projects
+
+    project_ids = [str(project_id) for project_id in projects.values_list('id', flat=True)]
+    projects.delete()
+    transaction.on_commit(lambda: hard_delete_projects.delay(project_ids=project_ids))
+
+
+def delete_user_files(user_id) -> None:
+    #  The deletion collector only removes the rows, the archived date frames and the imported files stay in storage
+    for model in (DateFrameArchive, ImportJob):
+        file_storage = model._meta.get_field('file').storage
+        for file_name in model._base_manager.filter(user_id=user_id).exclude(file='').values_list('file', flat=True):
+            file_storage.delete(file_name)
+
+
+def purge_user_data(user_id, batch_size: int = None) -> int:
+    """
+    Deletes the user's date frames, summaries, sub tasks, tasks and projects in chunks, using the denormalized owners
+    of the rows, along with the user's files. The remaining rows of the user are few, so the user itself can be
+    deleted by Django afterwards.
+    """
+    delete_user_files(user_id=user_id)
+    deleted = sum(
+        purge_rows(queryset=queryset, batch_size=batch_size) for queryset in (
+            DateFrame._base_manager.filter(user_id=user_id),
+            DateFrameSummary._base_manager.filter(user_id=user_id),
+            SubTask._base_manager.filter(user_id=user_id),
+            Task._base_manager.filter(user_id=user_id),
+            Project._base_manager.filter(user_id=user_id)
+        )
+    )
+    invalidate_search_index(user_id=user_id)
+    return deleted
+
+
+def get_removal_cutoff() -> datetime:
+    return timezone.now() - timedelta(days=settings.REMOVED_ITEMS_RETENTION_DAYS)
+
+
+def purge_removed_queryset(queryset: QuerySet, batch_size: int = None,
+                           on_progress: Callable[[str, int], None] = None) -> int:
+    """
+    Hard deletes the removed items of the queryset batch by batch, oldest removals first, so that a single run never
+    holds the locks of the whole backlog. Returns the number of purged items, their dependencies aren't counted.
+    """
+    batch_size = batch_size or settings.REMOVED_ITEMS_PURGE_BATCH_SIZE
+    model = queryset.model
+    purged = 0
+
+    while True:
+        item_ids = list(queryset.order_by('removed_at').values_list('id', flat=True)[:batch_size])
+        if not item_ids:
+            return purged
+
+        #  The removal is checked again at the deletion, so the items restored in the meantime are kept
+        purge_queryset(queryset=queryset.filter(id__in=item_ids))
+        purged += len(item_ids)
+        if on_progress is not None:
+            on_progress(model._meta.verbose_name_plural, purged)
+
+
+def purge_removed_items(cutoff: datetime = None, batch_size: int = None,
+                        on_progress: Callable[[str, int], None] = None) -> Tuple[int, int]:
+    """
+    Purges the projects and the tasks which have been removed softly before the cutoff, the end of the retention
+    period by default. Returns the numbers of purged projects and tasks.
+    """
+    cutoff = cutoff if cutoff is not None else get_removal_cutoff()
+
+    #  The removed projects go first, as they take their removed tasks along
+    purged_projects = purge_removed_queryset(queryset=get_all_removed_projects(removed_at__lt=cutoff),
+                                             batch_size=batch_size, on_progress=on_progress)
+    purged_tasks = purge_removed_queryset(queryset=get_removed_tasks(removed_at__lt=cutoff),
+                                          batch_size=batch_size, on_progress=on_progress)
+    return purged_projects, purged_tasks
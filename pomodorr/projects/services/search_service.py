@@ -0,0 +1,138 @@
+import threading
+import uuid
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Set
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import QuerySet
+
+from pomodorr.projects.selectors.project_selector import get_active_projects_for_user
+from pomodorr.projects.selectors.search_selector import (
+    search_projects_for_user, search_tasks_for_user, search_sub_tasks_for_user
+)
+from pomodorr.projects.selectors.sub_task_selector import get_all_sub_tasks_for_user
+from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks
+
+SEARCH_INDEX_VERSION_CACHE_KEY = 'projects_search_index_version_{user_id}'
+
+PROJECT_RESULT_FIELDS = ('id', 'name')
+TASK_RESULT_FIELDS = ('id', 'name', 'project_id')
+SUB_TASK_RESULT_FIELDS = ('id', 'name', 'task_id')
+
+_search_indexes: OrderedDict = OrderedDict()
+_search_indexes_lock = threading.Lock()
+
+
+def get_trigrams(text: str) -> Set[str]:
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+class InvertedIndex:
+    """
+    Maps trigrams of the indexed texts to the documents containing them, so that a case insensitive substring search
+    only needs to check the documents sharing all the trigrams with the searched phrase.
+    """
+
+    def __init__(self) -> None:
+        self._postings = defaultdict(set)
+        self._documents = {}
+
+    def add(self, key, text: str, payload: dict) -> None:
+        normalized_text = text.upper()
+        self._documents[key] = (normalized_text, payload)
+
+        for trigram in get_trigrams(normalized_text):
+            self._postings[trigram].add(key)
+
+    def search(self, phrase: str, limit: int = None) -> List[dict]:
+        normalized_phrase = phrase.upper()
+        posting_lists = sorted((self._postings.get(trigram, set()) for trigram in get_trigrams(normalized_phrase)),
+                               key=len)
+        candidates = set.intersection(*posting_lists) if posting_lists else self._documents.keys()
+
+        matching_payloads = sorted(
+            (self._documents[key][1] for key in candidates if normalized_phrase in self._documents[key][0]),
+            key=lambda payload: payload['name'])
+        return matching_payloads[:limit]
+
+
+def build_search_index(user: AbstractUser) -> Dict[str, InvertedIndex]:
+    search_index = {'projects': InvertedIndex(), 'tasks': InvertedIndex(), 'sub_tasks': InvertedIndex()}
+
+    for project in get_active_projects_for_user(user=user).values(*PROJECT_RESULT_FIELDS):
+        search_index['projects'].add(key=project['id'], text=project['name'], payload=project)
+
+    for task in get_all_non_removed_tasks(user=user).values(*TASK_RESULT_FIELDS, 'note'):
+        note = task.pop('note')
+        search_index['tasks'].add(key=task['id'], text=f'{task["name"]}\n{note}', payload=task)
+
+    for sub_task in get_all_sub_tasks_for_user(user=user).values(*SUB_TASK_RESULT_FIELDS):
+        search_index['sub_tasks'].add(key=sub_task['id'], text=sub_task['name'], payload=sub_task)
+
+    return search_index
+
+
+def get_search_index_for_user(user: AbstractUser) -> Dict[str, InvertedIndex]:
+    version = cache.get(SEARCH_INDEX_VERSION_CACHE_KEY.format(user_id=user.id))
+
+    with _search_indexes_lock:
+        cached_index = _search_indexes.get(user.id)
+        if cached_index is not None and cached_index[0] == version:
+            _search_indexes.move_to_end(user.id)
+            return cached_index[1]
+
+    search_index = build_search_index(user=user)
+
+    with _search_indexes_lock:
+        _search_indexes[user.id] = (version, search_index)
+        _search_indexes.move_to_end(user.id)
+        while len(_search_indexes) > settings.SEARCH_INDEX_MAX_USERS:
+            _search_indexes.popitem(last=False)
+
+    return search_index
+
+
+def is_search_index_used() -> bool:
+    #  PostgreSQL serves the searches with trigram indexes, the in-process index only backs the other databases
+    return connection.vendor != 'postgresql'
+
+
+def invalidate_search_index(user_id) -> None:
+    if not is_search_index_used():
+        return
+    cache.set(SEARCH_INDEX_VERSION_CACHE_KEY.format(user_id=user_id), uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_search_indexes(user_ids: Iterable) -> None:
+    for user_id in user_ids:
+        invalidate_search_index(user_id=user_id)
+
+
+def get_search_index_owners(queryset: QuerySet) -> Set:
+    #  The bulk writes skip the signal handlers, so they have to find out whose search indexes they invalidate
+    return set(queryset.order_by().values_list('user_id', flat=True).distinct())
+
+
+def search_for_user(user: AbstractUser, phrase: str) -> Dict[str, List[dict]]:
+    """
+    Searches the user's projects, tasks (including their notes) and sub tasks containing the phrase.
+    PostgreSQL serves the lookups with trigram indexes, other databases fall back to the in-process inverted index.
+    """
+    limit = settings.SEARCH_RESULTS_LIMIT
+
+    if not is_search_index_used():
+        return {
+            'projects': list(search_projects_for_user(user=user, phrase=phrase).order_by('name').values(
+                *PROJECT_RESULT_FIELDS)[:limit]),
+            'tasks': list(search_tasks_for_user(user=user, phrase=phrase).order_by('name').values(
+                *TASK_RESULT_FIELDS)[:limit]),
+            'sub_tasks': list(search_sub_tasks_for_user(user=user, phrase=phrase).order_by('name').values(
+                *SUB_TASK_RESULT_FIELDS)[:limit])
+        }
+
+    search_index = get_search_index_for_user(user=user)
+    return {category: inverted_index.search(phrase=phrase, limit=limit)
+            for category, inverted_index in search_index.items()}
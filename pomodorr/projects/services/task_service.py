@@ -3,53 +3,100 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
 from django.utils import timezone
 
+from pomodorr.frames.models import DateFrame, DateFrameSummary
 from pomodorr.frames.services.date_frame_service import force_finish_date_frame
 from pomodorr.projects.exceptions import TaskException
-from pomodorr.projects.models import Task, Project
-from pomodorr.projects.selectors.task_selector import get_active_tasks_for_user
+from pomodorr.projects.models import Project, SubTask, Task
+from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks
+from pomodorr.projects.services.ordering_service import place_after
+from pomodorr.projects.services.search_service import invalidate_search_index
+from pomodorr.projects.tasks import rebalance_tasks_ordering
+from pomodorr.tools.utils import get_violated_unique_constraint
+from pomodorr.user_settings.services import get_timer_settings_for_user
+
+
+def save_task(task: Task) -> Task:
+    try:
+        with transaction.atomic(savepoint=False):
+            task.save()
+    except IntegrityError as error:
+        if get_violated_unique_constraint(error=error, model=Task) != 'unique_project_task':
+            raise
+        raise ValidationError({'name': [TaskException.messages[TaskException.task_duplicated]]},
+                              code=TaskException.task_duplicated)
+    return task
 
 
-def is_task_name_available(project: Project, name: str, excluded=None) -> bool:
-    query = get_active_tasks_for_user(user=project.user, project=project, name=name)
-    if excluded is not None:
-        return not query.exclude(id=excluded.id).exists()
-    return not query.exists()
+def get_task_timer_settings(task: Task) -> dict:
+    """
+    Merges the timer lengths overridden by the task with the owner's settings. The settings are read from the cache,
+    so that resolving them usually doesn't need to walk the task -> user -> settings relations.
+    """
+    timer_settings = {'pomodoro_length': task.pomodoro_length, 'break_length': task.break_length}
+    if None not in timer_settings.values():
+        return timer_settings
 
+    user_timer_settings = get_timer_settings_for_user(user_id=task.user_id)
 
-def pin_to_project(task: Task, project: Project, db_save: bool = True) -> Optional[Task]:
-    if is_task_name_available(project=project, name=task.name):
-        pinned_task = perform_pin(task=task, project=project, db_save=db_save)
-        return pinned_task
-    else:
-        raise ValidationError({'name': [TaskException.messages[TaskException.task_duplicated]]},
-                              code=TaskException.task_duplicated)
+    if timer_settings['pomodoro_length'] is None:
+        timer_settings['pomodoro_length'] = user_timer_settings['pomodoro_length']
+    if timer_settings['break_length'] is None:
+        timer_settings['break_length'] = user_timer_settings['short_break_length']
+    return timer_settings
 
 
-def perform_pin(task: Task, project: Project, db_save: bool = True) -> Task:
+def pin_to_project(task: Task, project: Project, db_save: bool = True) -> Optional[Task]:
     pinned_task = task
     pinned_task.project = project
 
     if db_save:
-        pinned_task.save()
+        save_task(task=pinned_task)
 
     return pinned_task
 
 
+def change_tasks_owner(tasks: QuerySet, user_id, previous_user_id) -> None:
+    """
+    Hands the tasks over to the new owner along with the rows depending on them, with a single UPDATE per table.
+    """
+    task_ids = tasks.order_by().values('id')
+    for queryset in (tasks, SubTask.objects.filter(task_id__in=task_ids),
+                     DateFrame._base_manager.filter(task_id__in=task_ids),
+                     DateFrameSummary._base_manager.filter(task_id__in=task_ids)):
+        queryset.update(user_id=user_id)
+
+    invalidate_search_index(user_id=previous_user_id)
+
+
+def reorder_task(task: Task, previous: Optional[Task] = None) -> Task:
+    with transaction.atomic():
+        gap_exhausted = place_after(instance=task, siblings=get_all_non_removed_tasks(project_id=task.project_id),
+                                    previous=previous)
+
+    if gap_exhausted:
+        transaction.on_commit(lambda: rebalance_tasks_ordering.delay(project_id=str(task.project_id)))
+    return task
+
+
 def complete_task(task: Task, db_save=True) -> Task:
     check_task_already_completed(task=task)
-    force_finish_date_frame(task_id=task.id)
-
-    if task.repeat_duration is not None:
-        archived_task = archive_task(task=task)
-        create_next_task(task=archived_task)
-        return archived_task
-    else:
-        task.status = Task.status_completed
-        if db_save:
-            task.save()
-        return task
+
+    with transaction.atomic():
+        force_finish_date_frame(task_id=task.id)
+
+        if task.repeat_duration is not None:
+            archived_task = archive_task(task=task)
+            create_next_task(task=archived_task)
+            return archived_task
+        else:
+            task.status = Task.status_completed
+            if db_save:
+                task.save()
+            return task
 
 
 def create_next_task(task: Task) -> Task:
@@ -71,9 +118,6 @@ def archive_task(task: Task) -> Task:
 
 def reactivate_task(task: Task, db_save=True) -> Task:
     check_task_already_active(task=task)
-    if not is_task_name_available(project=task.project, name=task.name):
-        raise ValidationError([TaskException.messages[TaskException.task_duplicated]],
-                              code=TaskException.task_duplicated)
 
     if task.due_date is None:
         task.due_date = get_next_due_date(due_date=task.due_date, duration=task.repeat_duration)
@@ -81,7 +125,7 @@ def reactivate_task(task: Task, db_save=True) -> Task:
     task.status = Task.status_active
 
     if db_save:
-        task.save()
+        save_task(task=task)
     return task
 
 
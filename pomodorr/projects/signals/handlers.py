@@ -1,6 +1,8 @@
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 
+from pomodorr.projects.services.search_service import invalidate_search_index
+
 
 def task_completed_notify_channel(sender, task, **kwargs):
     channel_layer = get_channel_layer()
@@ -12,3 +14,7 @@ def task_completed_notify_channel(sender, task, **kwargs):
             'type': 'frame.notify_frame_terminated'
         }
     )
+
+
+def search_indexed_object_changed(sender, instance, **kwargs):
+    invalidate_search_index(user_id=instance.user_id)
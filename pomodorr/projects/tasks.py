@@ -0,0 +1,43 @@
+import logging
+from typing import List, Tuple
+
+from django.conf import settings
+
+from config import celery_app
+from pomodorr.projects.selectors.project_selector import (
+    get_active_projects_for_user, get_all_removed_projects, hard_delete_on_queryset
+)
+from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks
+from pomodorr.projects.services.ordering_service import rebalance_user_defined_ordering
+from pomodorr.projects.services.purge_service import purge_removed_items
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name='pomodorr.projects.rebalance_projects_ordering')
+def rebalance_projects_ordering(user_id: str) -> int:
+    return rebalance_user_defined_ordering(queryset=get_active_projects_for_user(user=user_id))
+
+
+@celery_app.task(name='pomodorr.projects.rebalance_tasks_ordering')
+def rebalance_tasks_ordering(project_id: str) -> int:
+    return rebalance_user_defined_ordering(queryset=get_all_non_removed_tasks(project_id=project_id))
+
+
+@celery_app.task(name='pomodorr.projects.hard_delete_projects', time_limit=settings.PURGE_TASK_TIME_LIMIT,
+                 soft_time_limit=settings.PURGE_TASK_TIME_LIMIT - 60)
+def hard_delete_projects(project_ids: List[str]) -> int:
+    #  The projects restored in the meantime are kept
+    return hard_delete_on_queryset(queryset=get_all_removed_projects(id__in=project_ids))
+
+
+def log_purge_progress(items_name: str, purged: int) -> None:
+    logger.info('Purged %s removed %s so far', purged, items_name)
+
+
+@celery_app.task(name='pomodorr.projects.purge_expired_removed_items', time_limit=settings.PURGE_TASK_TIME_LIMIT,
+                 soft_time_limit=settings.PURGE_TASK_TIME_LIMIT - 60)
+def purge_expired_removed_items() -> Tuple[int, int]:
+    purged_projects, purged_tasks = purge_removed_items(on_progress=log_purge_progress)
+    logger.info('Purged %s removed projects and %s removed tasks', purged_projects, purged_tasks)
+    return purged_projects, purged_tasks
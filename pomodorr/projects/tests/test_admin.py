@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 
 from pomodorr.projects.selectors.project_selector import (
     get_all_projects, get_all_active_projects, get_all_removed_projects
 )
+from pomodorr.projects.tasks import hard_delete_projects
 
 pytestmark = pytest.mark.django_db
 
@@ -22,8 +25,12 @@ def test_hard_delete(request_mock, project_admin_view, project_create_batch):
 
     assert all_projects.count() == 6
 
-    project_admin_view.hard_delete(request=request_mock, queryset=all_projects)
+    with patch('pomodorr.projects.services.purge_service.transaction.on_commit',
+               side_effect=lambda callback: callback()), \
+            patch('pomodorr.projects.tasks.hard_delete_projects.delay', side_effect=hard_delete_projects) as delay_mock:
+        project_admin_view.hard_delete(request=request_mock, queryset=all_projects)
 
+    delay_mock.assert_called_once()
     assert all_projects.count() == 0
 
 
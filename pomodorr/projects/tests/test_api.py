@@ -8,7 +8,7 @@ from pytest_lazyfixture import lazy_fixture
 from rest_framework import status
 from rest_framework.test import force_authenticate
 
-from pomodorr.projects.api import ProjectViewSet, PriorityViewSet, TaskViewSet, SubTaskViewSet
+from pomodorr.projects.api import ProjectViewSet, PriorityViewSet, TaskViewSet, SubTaskViewSet, SearchViewSet
 from pomodorr.projects.exceptions import PriorityException, TaskException, ProjectException, SubTaskException
 from pomodorr.projects.selectors.priority_selector import get_priorities_for_user
 from pomodorr.projects.selectors.project_selector import get_active_projects_for_user
@@ -19,6 +19,14 @@ from pomodorr.tools.utils import get_time_delta
 pytestmark = pytest.mark.django_db
 
 
+def get_listed_ids(view_class, url, user, request_factory) -> list:
+    #  The ids in the default ordering of the list endpoint, without any ordering parameters
+    view = view_class.as_view({'get': 'list'})
+    request = request_factory.get(url)
+    force_authenticate(request=request, user=user)
+    return [str(listed['id']) for listed in view(request).data['results']]
+
+
 class TestPriorityViewSet:
     view_class = PriorityViewSet
     base_url = 'api/priorities/'
@@ -244,6 +252,7 @@ class TestProjectViewSet:
     view_class = ProjectViewSet
     base_url = 'api/projects/'
     detail_url = 'api/projects/{pk}/'
+    reorder_url = 'api/projects/{pk}/reorder/'
 
     def test_create_project_with_valid_data(self, project_data, active_user, request_factory):
         url = self.base_url
@@ -469,11 +478,49 @@ class TestProjectViewSet:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_reorder_project_after_previous_project(self, project_create_batch, active_user, request_factory):
+        moved_project, previous_project = project_create_batch[0], project_create_batch[3]
+        url = self.reorder_url.format(pk=moved_project.pk)
+        view = self.view_class.as_view({'post': 'reorder'})
+        request = request_factory.post(url, {'previous': str(previous_project.pk)}, format='json')
+        force_authenticate(request=request, user=active_user)
+        response = view(request, pk=moved_project.pk)
+
+        assert response.status_code == status.HTTP_200_OK
+        ordered_ids = get_listed_ids(view_class=self.view_class, url=self.base_url, user=active_user,
+                                     request_factory=request_factory)
+        assert ordered_ids.index(str(moved_project.pk)) == ordered_ids.index(str(previous_project.pk)) + 1
+
+    def test_reorder_project_to_the_top(self, project_create_batch, active_user, request_factory):
+        moved_project = project_create_batch[-1]
+        url = self.reorder_url.format(pk=moved_project.pk)
+        view = self.view_class.as_view({'post': 'reorder'})
+        request = request_factory.post(url, {'previous': None}, format='json')
+        force_authenticate(request=request, user=active_user)
+        response = view(request, pk=moved_project.pk)
+
+        assert response.status_code == status.HTTP_200_OK
+        ordered_ids = get_listed_ids(view_class=self.view_class, url=self.base_url, user=active_user,
+                                     request_factory=request_factory)
+        assert ordered_ids[0] == str(moved_project.pk)
+
+    def test_reorder_project_after_someone_elses_project(self, project_instance, project_instance_for_random_user,
+                                                         active_user, request_factory):
+        url = self.reorder_url.format(pk=project_instance.pk)
+        view = self.view_class.as_view({'post': 'reorder'})
+        request = request_factory.post(url, {'previous': str(project_instance_for_random_user.pk)}, format='json')
+        force_authenticate(request=request, user=active_user)
+        response = view(request, pk=project_instance.pk)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['previous'][0] == ProjectException.messages[ProjectException.project_does_not_exist]
+
 
 class TestTaskViewSet:
     view_class = TaskViewSet
     base_url = 'api/tasks/'
     detail_url = 'api/tasks/{pk}/'
+    reorder_url = 'api/tasks/{pk}/reorder/'
 
     def test_create_task_with_valid_data(self, task_data, project_instance, active_user, request_factory):
         task_data['project'] = project_instance.id
@@ -572,6 +619,25 @@ class TestTaskViewSet:
                 user=active_user).filter(**filter_lookup).values_list('id', flat=True)))
         assert response_result_ids == default_filtered_orm_fetched_tasks
 
+    @pytest.mark.parametrize(
+        'query_params, expected_fields',
+        [
+            ({'fields': 'id,name,status'}, {'id', 'name', 'status'}),
+            ({'omit': 'sub_tasks,project,note'}, {'id', 'name', 'status', 'priority', 'user_defined_ordering',
+                                                  'pomodoro_number', 'pomodoro_length', 'break_length', 'due_date',
+                                                  'reminder_date', 'repeat_duration'})
+        ]
+    )
+    def test_get_task_list_with_sparse_fields(self, query_params, expected_fields, task_instance_create_batch,
+                                              active_user, request_factory):
+        view = self.view_class.as_view({'get': 'list'})
+        request = request_factory.get(self.base_url, query_params)
+        force_authenticate(request=request, user=active_user)
+        response = view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(set(task.keys()) == expected_fields for task in response.data['results'])
+
     def test_get_task_list_for_project(self, project_instance, task_instance_create_batch,
                                        task_instance_in_second_project, active_user, request_factory):
         query_lookup = {'project__id': project_instance.id}
@@ -601,8 +667,8 @@ class TestTaskViewSet:
 
     @pytest.mark.parametrize(
         'ordering',
-        ['created_at', '-created_at', 'priority', '-priority', 'user_defined_ordering', '-user_defined_ordering',
-         'name', '-name'])
+        ['created_at', '-created_at', 'priority__priority_level', '-priority__priority_level', 'user_defined_ordering',
+         '-user_defined_ordering', 'name', '-name'])
     def test_get_task_list_ordered_by_valid_fields(self, ordering, task_instance_create_batch, active_user,
                                                    request_factory):
         view = self.view_class.as_view({'get': 'list'})
@@ -749,6 +815,39 @@ class TestTaskViewSet:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_reorder_task_after_previous_task(self, task_instance_create_batch, active_user, request_factory):
+        moved_task, previous_task = task_instance_create_batch[0], task_instance_create_batch[3]
+        url = self.reorder_url.format(pk=moved_task.pk)
+        view = self.view_class.as_view({'post': 'reorder'})
+        request = request_factory.post(url, {'previous': str(previous_task.pk)}, format='json')
+        force_authenticate(request=request, user=active_user)
+        response = view(request, pk=moved_task.pk)
+
+        assert response.status_code == status.HTTP_200_OK
+        ordered_ids = get_listed_ids(view_class=self.view_class, url=self.base_url, user=active_user,
+                                     request_factory=request_factory)
+        assert ordered_ids.index(str(moved_task.pk)) == ordered_ids.index(str(previous_task.pk)) + 1
+
+    def test_reorder_task_after_task_from_another_project(self, task_instance, task_instance_in_second_project,
+                                                          active_user, request_factory):
+        url = self.reorder_url.format(pk=task_instance.pk)
+        view = self.view_class.as_view({'post': 'reorder'})
+        request = request_factory.post(url, {'previous': str(task_instance_in_second_project.pk)}, format='json')
+        force_authenticate(request=request, user=active_user)
+        response = view(request, pk=task_instance.pk)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['previous'][0] == TaskException.messages[TaskException.task_does_not_exist]
+
+    def test_reorder_someone_elses_task(self, task_instance_for_random_project, active_user, request_factory):
+        url = self.reorder_url.format(pk=task_instance_for_random_project.pk)
+        view = self.view_class.as_view({'post': 'reorder'})
+        request = request_factory.post(url, {'previous': None}, format='json')
+        force_authenticate(request=request, user=active_user)
+        response = view(request, pk=task_instance_for_random_project.pk)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 class TestSubTaskViewSet:
     view_class = SubTaskViewSet
@@ -1016,3 +1115,39 @@ class TestSubTaskViewSet:
         response = view(request, task_pk=sub_task_for_random_task.task.pk, pk=sub_task_for_random_task.pk)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestSearchViewSet:
+    view_class = SearchViewSet
+    base_url = 'api/search/'
+
+    def test_search(self, project_instance, task_instance, sub_task_instance, task_instance_for_random_project,
+                    active_user, request_factory):
+        view = self.view_class.as_view({'get': 'list'})
+        request = request_factory.get(self.base_url, {'q': sub_task_instance.name})
+        force_authenticate(request=request, user=active_user)
+        response = view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['sub_tasks'] == [
+            {'id': str(sub_task_instance.id), 'name': sub_task_instance.name, 'task': str(task_instance.id)}]
+
+    def test_search_does_not_return_someone_elses_objects(self, task_instance_for_random_project, active_user,
+                                                          request_factory):
+        view = self.view_class.as_view({'get': 'list'})
+        request = request_factory.get(self.base_url, {'q': task_instance_for_random_project.name})
+        force_authenticate(request=request, user=active_user)
+        response = view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['tasks'] == []
+
+    @pytest.mark.parametrize('phrase', ['', 'ab'])
+    def test_search_with_too_short_phrase(self, phrase, active_user, request_factory):
+        view = self.view_class.as_view({'get': 'list'})
+        request = request_factory.get(self.base_url, {'q': phrase})
+        force_authenticate(request=request, user=active_user)
+        response = view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'q' in response.data
@@ -0,0 +1,40 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from pomodorr.frames.models import DateFrame
+from pomodorr.projects.models import Task
+from pomodorr.tools.explain import explain_selectors, has_sequential_scan
+
+pytestmark = pytest.mark.django_db
+
+
+class TestExplainSelectorsCommand:
+    def test_explain_selectors_reports_every_selector(self, date_frame_instance):
+        output = StringIO()
+
+        call_command('explain_selectors', stdout=output)
+
+        assert 'pomodorr.projects.selectors.task_selector.get_active_tasks_for_user' in output.getvalue()
+        assert 'pomodorr.frames.selectors.date_frame_selector.get_all_date_frames_for_user' in output.getvalue()
+        assert 'failed:' not in output.getvalue()
+
+    def test_explain_selectors_rolls_seeded_data_back(self):
+        output = StringIO()
+
+        call_command('explain_selectors', '--seed-users=2', '--projects=2', '--tasks=2', '--date-frames=2',
+                     '--only-scans', stdout=output)
+
+        assert 'get_active_tasks_for_user' not in output.getvalue()
+        assert Task.all_objects.exists() is False
+        assert DateFrame.objects.exists() is False
+
+
+def test_explain_selectors_uses_composite_indexes(date_frame_instance):
+    plans = {selector_name.rsplit('.', 1)[1]: plan for selector_name, sql, plan in explain_selectors()}
+
+    assert 'date_frame_user_created_idx' in plans['get_all_date_frames_for_user']
+    assert 'date_frame_task_created_idx' in plans['get_all_date_frames_for_task']
+    assert 'task_user_status_created_idx' in plans['get_active_tasks_for_user']
+    assert has_sequential_scan(plan=plans['get_active_tasks_for_user']) is False
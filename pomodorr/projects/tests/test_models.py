@@ -51,6 +51,7 @@ class TestProjectModel:
         assert project_instance.id is not None
         assert project_instance not in project_model.objects.all()
         assert project_instance in project_model.all_objects.filter()
+        assert project_model.all_objects.get(id=project_instance.id).removed_at is not None
 
     def test_project_hard_delete(self, project_model, project_instance):
         project_instance.delete(soft=False)
@@ -105,6 +106,7 @@ class TestTaskModel:
         assert task is not None
         assert task.priority == priority_instance
         assert task.project == project_instance
+        assert task.user_id == project_instance.user_id
 
     @pytest.mark.parametrize(
         'invalid_field_key, invalid_field_value, expected_exception',
@@ -141,6 +143,7 @@ class TestTaskModel:
         assert task_instance.id is not None
         assert task_instance not in task_model.objects.all()
         assert task_instance in task_model.all_objects.filter()
+        assert task_model.all_objects.get(id=task_instance.id).removed_at is not None
 
     def test_task_hard_delete(self, task_model, task_instance):
         task_instance.delete(soft=False)
@@ -149,6 +152,26 @@ class TestTaskModel:
         assert task_instance not in task_model.objects.all()
         assert task_instance not in task_model.all_objects.all()
 
+    def test_task_moved_to_project_of_another_user_changes_owner(self, task_model, sub_task_instance,
+                                                                 date_frame_instance, project_instance_for_random_user):
+        task = task_model.objects.get(id=sub_task_instance.task_id)
+        task.project = project_instance_for_random_user
+        task.save()
+
+        new_owner_id = project_instance_for_random_user.user_id
+        assert task_model.objects.get(id=task.id).user_id == new_owner_id
+        assert type(sub_task_instance).objects.get(id=sub_task_instance.id).user_id == new_owner_id
+        assert type(date_frame_instance).objects.get(id=date_frame_instance.id).user_id == new_owner_id
+
+    def test_project_handed_over_changes_owner_of_tasks(self, project_model, task_instance, sub_task_instance,
+                                                        project_instance_for_random_user):
+        project = project_model.objects.get(id=task_instance.project_id)
+        project.user_id = project_instance_for_random_user.user_id
+        project.save()
+
+        assert type(task_instance).objects.get(id=task_instance.id).user_id == project.user_id
+        assert type(sub_task_instance).objects.get(id=sub_task_instance.id).user_id == project.user_id
+
     def test_normalized_pomodoro_length_for_task_with_pomodoro_length(self, task_instance):
         assert task_instance.normalized_pomodoro_length == timedelta(minutes=50)
 
@@ -168,6 +191,7 @@ class TestSubTask:
 
         assert sub_task is not None
         assert sub_task.task == task_instance
+        assert sub_task.user_id == task_instance.user_id
 
     @pytest.mark.parametrize(
         'invalid_field_key, invalid_field_value, expected_exception',
@@ -46,7 +46,7 @@ class TestPriorityViewSetQueries:
         initial_priorities_count = active_user.priorities.count()
 
         client.force_authenticate(user=active_user)
-        with django_assert_num_queries(2):
+        with django_assert_num_queries(1):
             client.post(self.base_url, data=priority_data)
         assert initial_priorities_count < active_user.priorities.count()
 
@@ -55,7 +55,7 @@ class TestPriorityViewSetQueries:
         priority_data['color'] = factory.Faker('color').generate()
 
         client.force_authenticate(user=active_user)
-        with django_assert_num_queries(3):
+        with django_assert_num_queries(2):
             client.put(self.detail_url.format(pk=priority_instance.pk), data=priority_data)
 
 
@@ -69,6 +69,13 @@ class TestProjectViewSetQueries:
         with django_assert_num_queries(1):
             client.get(self.detail_url.format(pk=project_instance.pk))
 
+    def test_project_detail_view_with_sparse_fields(self, client, django_assert_num_queries, active_user,
+                                                    project_instance):
+        client.force_authenticate(user=active_user)
+
+        with django_assert_num_queries(1):
+            client.get(f'{self.detail_url.format(pk=project_instance.pk)}?{urlencode(query={"fields": "id,name"})}')
+
     def test_project_list_view(self, client, django_assert_num_queries, active_user, project_create_batch):
         client.force_authenticate(user=active_user)
         with django_assert_num_queries(2):
@@ -99,7 +106,7 @@ class TestProjectViewSetQueries:
         initial_projects_count = active_user.projects.count()
 
         client.force_authenticate(user=active_user)
-        with django_assert_num_queries(2):
+        with django_assert_num_queries(1):
             client.post(self.base_url, data=project_data)
         assert initial_projects_count < active_user.projects.count()
 
@@ -108,7 +115,7 @@ class TestProjectViewSetQueries:
         project_data['name'] = factory.Faker('name').generate()
 
         client.force_authenticate(user=active_user)
-        with django_assert_num_queries(3):
+        with django_assert_num_queries(2):
             client.put(self.detail_url.format(pk=project_instance.pk), data=project_data)
 
 
@@ -149,13 +156,19 @@ class TestTaskViewSetQueries:
         with django_assert_max_num_queries(3):
             client.get(url)
 
+    def test_task_list_view_with_sparse_fields(self, client, django_assert_num_queries, active_user,
+                                               task_instance_create_batch, sub_task_create_batch):
+        client.force_authenticate(user=active_user)
+        with django_assert_num_queries(2):
+            client.get(f'{self.base_url}?{urlencode(query={"fields": "id,name,status"})}')
+
     def test_task_create_view(self, client, django_assert_num_queries, active_user, project_instance, task_data):
         initial_tasks_count = active_user.projects.aggregate(Count('tasks'))['tasks__count']
         task_data['project'] = str(project_instance.pk)
 
         client.force_authenticate(user=active_user)
 
-        with django_assert_num_queries(6):
+        with django_assert_num_queries(2):
             client.post(self.base_url, data=task_data)
         assert initial_tasks_count < active_user.projects.aggregate(Count('tasks'))['tasks__count']
 
@@ -209,7 +222,7 @@ class TestSubTaskViewSetQueries:
         sub_task_data['task'] = str(task_instance.pk)
 
         client.force_authenticate(user=active_user)
-        with django_assert_num_queries(4):
+        with django_assert_num_queries(2):
             client.post(self.base_url, data=sub_task_data)
 
         assert initial_sub_tasks_count < active_user.projects.aggregate(Count('tasks__sub_tasks', distinct=True))[
@@ -221,5 +234,5 @@ class TestSubTaskViewSetQueries:
         sub_task_data['name'] = factory.Faker('name').generate()
 
         client.force_authenticate(user=active_user)
-        with django_assert_num_queries(5):
+        with django_assert_num_queries(3):
             client.put(self.detail_url.format(pk=sub_task_instance.pk), data=sub_task_data)
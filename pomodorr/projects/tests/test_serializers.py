@@ -3,9 +3,9 @@ from datetime import timedelta
 
 import factory
 import pytest
-from django.core.exceptions import ValidationError
 from django.utils import timezone
 from pytest_lazyfixture import lazy_fixture
+from rest_framework import serializers
 
 from pomodorr.projects.exceptions import TaskException, ProjectException, PriorityException, SubTaskException
 from pomodorr.projects.selectors.task_selector import get_active_tasks
@@ -63,8 +63,11 @@ class TestPrioritySerializer:
         serializer = self.serializer_class(data=priority_data)
         serializer.context['request'] = request_mock
 
-        assert serializer.is_valid() is False
-        assert serializer.errors['name'][0] == PriorityException.messages[PriorityException.priority_duplicated]
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as exc:
+            serializer.save()
+
+        assert exc.value.detail['name'][0] == PriorityException.messages[PriorityException.priority_duplicated]
 
     def test_save_priority_without_context_user(self, priority_data):
         serializer = self.serializer_class(data=priority_data)
@@ -105,8 +108,11 @@ class TestPrioritySerializer:
         serializer = self.serializer_class(instance=priority_instance, data=priority_data)
         serializer.context['request'] = request_mock
 
-        assert serializer.is_valid() is False
-        assert serializer.errors['name'][0] == PriorityException.messages[PriorityException.priority_duplicated]
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as exc:
+            serializer.save()
+
+        assert exc.value.detail['name'][0] == PriorityException.messages[PriorityException.priority_duplicated]
 
     def test_update_priority_without_context_user(self, priority_data, priority_instance):
         serializer = self.serializer_class(instance=priority_instance, data=priority_data)
@@ -167,8 +173,11 @@ class TestProjectSerializer:
         serializer = self.serializer_class(data=project_data)
         serializer.context['request'] = request_mock
 
-        assert serializer.is_valid() is False
-        assert serializer.errors['name'][0] == ProjectException.messages[ProjectException.project_duplicated]
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as exc:
+            serializer.save()
+
+        assert exc.value.detail['name'][0] == ProjectException.messages[ProjectException.project_duplicated]
 
     def test_save_project_without_context_user(self, project_data):
         serializer = self.serializer_class(data=project_data)
@@ -214,8 +223,11 @@ class TestProjectSerializer:
         serializer = self.serializer_class(instance=project_instance, data=project_data)
         serializer.context['request'] = request_mock
 
-        assert serializer.is_valid() is False
-        assert serializer.errors['name'][0] == ProjectException.messages[ProjectException.project_duplicated]
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as exc:
+            serializer.save()
+
+        assert exc.value.detail['name'][0] == ProjectException.messages[ProjectException.project_duplicated]
 
     def test_update_project_without_context_user(self, project_data, project_instance):
         serializer = self.serializer_class(instance=project_instance, data=project_data)
@@ -253,7 +265,6 @@ class TestTaskSerializer:
         'invalid_field_key, invalid_field_value, get_field',
         [
             ('name', factory.Faker('pystr', max_chars=129).generate(), None),
-            ('name', lazy_fixture('repeatable_task_instance'), 'name'),
             ('name', '', None),
             ('user_defined_ordering', random.randint(-999, -1), None),
             ('user_defined_ordering', '', None),
@@ -287,6 +298,20 @@ class TestTaskSerializer:
         assert serializer.is_valid() is False
         assert invalid_field_key in serializer.errors
 
+    def test_save_task_with_unique_constraint_violated(self, task_data, task_instance, project_instance,
+                                                       request_mock):
+        task_data['project'] = project_instance.id
+        task_data['name'] = task_instance.name
+
+        serializer = self.serializer_class(data=task_data)
+        serializer.context['request'] = request_mock
+
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as exc:
+            serializer.save()
+
+        assert exc.value.detail['name'][0] == TaskException.messages[TaskException.task_duplicated]
+
     def test_update_task_with_valid_data(self, task_data, task_instance, priority_instance, project_instance,
                                          request_mock):
         task_data['project'] = project_instance.id
@@ -302,7 +327,6 @@ class TestTaskSerializer:
         'invalid_field_key, invalid_field_value, get_field',
         [
             ('name', factory.Faker('pystr', max_chars=129).generate(), None),
-            ('name', lazy_fixture('repeatable_task_instance'), 'name'),
             ('name', '', None),
             ('user_defined_ordering', random.randint(-999, -1), None),
             ('user_defined_ordering', '', None),
@@ -362,6 +386,20 @@ class TestTaskSerializer:
         assert serializer.is_valid()
         assert all(value in serializer.validated_data for value in task_data)
 
+    def test_update_task_with_unique_constraint_violated(self, task_data, task_instance, repeatable_task_instance,
+                                                         project_instance, request_mock):
+        task_data['project'] = project_instance.id
+        task_data['name'] = repeatable_task_instance.name
+
+        serializer = self.serializer_class(instance=task_instance, data=task_data)
+        serializer.context['request'] = request_mock
+
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as exc:
+            serializer.save()
+
+        assert exc.value.detail['name'][0] == TaskException.messages[TaskException.task_duplicated]
+
     def test_pin_task_to_new_project_with_unique_name_for_new_project(self, task_instance, project_create_batch,
                                                                       request_mock):
         new_project = project_create_batch[0]
@@ -389,10 +427,10 @@ class TestTaskSerializer:
         serializer.context['request'] = request_mock
 
         assert serializer.is_valid()
-        with pytest.raises(ValidationError) as exc:
+        with pytest.raises(serializers.ValidationError) as exc:
             serializer.save()
 
-        assert exc.value.messages[0] == TaskException.messages[TaskException.task_duplicated]
+        assert exc.value.detail['name'][0] == TaskException.messages[TaskException.task_duplicated]
 
     def test_complete_one_time_task(self, task_model, task_instance, request_mock):
         task_data = {
@@ -477,10 +515,10 @@ class TestTaskSerializer:
         serializer.context['request'] = request_mock
 
         assert serializer.is_valid()
-        with pytest.raises(ValidationError) as exc:
+        with pytest.raises(serializers.ValidationError) as exc:
             serializer.save()
 
-        assert exc.value.messages[0] == TaskException.messages[TaskException.task_duplicated]
+        assert exc.value.detail['name'][0] == TaskException.messages[TaskException.task_duplicated]
 
 
 class TestSubTaskSerializer:
@@ -547,8 +585,11 @@ class TestSubTaskSerializer:
         serializer = self.serializer_class(data=sub_task_data)
         serializer.context['request'] = request_mock
 
-        assert serializer.is_valid() is False
-        assert serializer.errors['name'][0] == SubTaskException.messages[SubTaskException.sub_task_duplicated]
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as exc:
+            serializer.save()
+
+        assert exc.value.detail['name'][0] == SubTaskException.messages[SubTaskException.sub_task_duplicated]
 
     def test_save_sub_task_with_completed_task_returns_error(self, sub_task_data, completed_task_instance,
                                                              request_mock):
@@ -604,8 +645,11 @@ class TestSubTaskSerializer:
         serializer = self.serializer_class(instance=sub_task_instance, data=sub_task_data)
         serializer.context['request'] = request_mock
 
-        assert serializer.is_valid() is False
-        assert serializer.errors['name'][0] == SubTaskException.messages[SubTaskException.sub_task_duplicated]
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as exc:
+            serializer.save()
+
+        assert exc.value.detail['name'][0] == SubTaskException.messages[SubTaskException.sub_task_duplicated]
 
     def test_update_sub_task_doesnt_allow_task_change(self, sub_task_data, sub_task_instance, task_instance,
                                                       repeatable_task_instance, request_mock):
@@ -1,59 +1,37 @@
+from datetime import timedelta
+from unittest.mock import patch
+
 import pytest
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from pomodorr.projects.exceptions import TaskException
-from pomodorr.projects.selectors.task_selector import get_active_tasks
-from pomodorr.projects.services.project_service import is_project_name_available
-from pomodorr.projects.services.sub_task_service import is_sub_task_name_available
+from pomodorr.projects.selectors.project_selector import get_active_projects_for_user, undo_delete_on_queryset
+from pomodorr.frames.models import DateFrame, DateFrameArchive
+from pomodorr.imports.models import ImportJob
+from pomodorr.projects.models import Project, SubTask, Task
+from pomodorr.projects.selectors.task_selector import get_active_tasks, get_all_non_removed_tasks
+from pomodorr.projects.services.ordering_service import (
+    get_ordering_key_between, place_after, rebalance_user_defined_ordering
+)
+from pomodorr.projects.services.project_service import reorder_project
+from pomodorr.projects.services.purge_service import (
+    get_write_db, purge_queryset, purge_removed_items, purge_rows, purge_user_data
+)
+from pomodorr.projects.services.search_service import InvertedIndex, get_search_index_for_user, search_for_user
 from pomodorr.projects.services.task_service import (
-    is_task_name_available, pin_to_project, complete_task, reactivate_task
+    pin_to_project, complete_task, reactivate_task, reorder_task, get_task_timer_settings
 )
+from pomodorr.tools.routers import route_request
 
 pytestmark = pytest.mark.django_db
 
 
-class TestProjectService:
-    def test_check_project_name_is_available(self, project_data, active_user):
-        checked_name = project_data['name']
-        is_name_available = is_project_name_available(user=active_user, name=checked_name)
-
-        assert is_name_available is True
-
-    def test_check_project_name_is_not_available(self, project_instance, active_user):
-        checked_name = project_instance.name
-        is_name_available = is_project_name_available(user=active_user, name=checked_name)
-
-        assert is_name_available is False
-
-    def test_test_check_project_name_is_available_with_exclude_id(self, project_instance,
-                                                                  active_user):
-        checked_name = project_instance.name
-        is_name_available = is_project_name_available(user=active_user, name=checked_name,
-                                                      excluded=project_instance)
-
-        assert is_name_available is True
-
-
 class TestTaskService:
-    def test_check_task_name_is_available(self, task_data, project_instance):
-        checked_name = task_data['name']
-        is_name_available = is_task_name_available(project=project_instance, name=checked_name)
-
-        assert is_name_available is True
-
-    def test_check_task_name_is_not_available(self, task_instance, project_instance):
-        checked_name = task_instance.name
-        is_name_available = is_task_name_available(project=project_instance, name=checked_name)
-
-        assert is_name_available is False
-
-    def test_check_task_name_is_available_with_exclude_id(self, task_instance, project_instance):
-        checked_name = task_instance.name
-        is_name_available = is_task_name_available(project=project_instance, name=checked_name, excluded=task_instance)
-
-        assert is_name_available is True
-
     def test_pin_task_to_new_project_with_unique_name_for_new_project(self, second_project_instance,
                                                                       task_instance, date_frame_create_batch):
         updated_task = pin_to_project(task=task_instance, project=second_project_instance)
@@ -139,22 +117,255 @@ class TestTaskService:
         assert exc.value.messages[0] == TaskException.messages[TaskException.task_duplicated]
 
 
-class TestSubTaskService:
-    def test_check_sub_task_name_is_available(self, sub_task_data, task_instance):
-        checked_name = sub_task_data['name']
-        is_name_available = is_sub_task_name_available(task=task_instance, name=checked_name)
+class TestOrderingService:
+    @pytest.mark.parametrize(
+        'previous_key, next_key, expected_key',
+        [
+            (None, None, settings.USER_DEFINED_ORDERING_GAP),
+            (None, 10, 5),
+            (10, None, 10 + settings.USER_DEFINED_ORDERING_GAP),
+            (10, 20, 15),
+            (10, 12, 11),
+            (10, 11, None),
+            (10, 10, None),
+            (None, 1, None)
+        ]
+    )
+    def test_get_ordering_key_between(self, previous_key, next_key, expected_key):
+        assert get_ordering_key_between(previous_key=previous_key, next_key=next_key) == expected_key
+
+    def test_place_after_updates_only_moved_object(self, task_instance_create_batch, django_assert_num_queries):
+        gap = settings.USER_DEFINED_ORDERING_GAP
+        for index, task in enumerate(task_instance_create_batch):
+            task.user_defined_ordering = (index + 1) * gap
+            task.save()
+        moved_task, previous_task = task_instance_create_batch[0], task_instance_create_batch[2]
+        siblings = get_all_non_removed_tasks(project=moved_task.project)
+
+        with django_assert_num_queries(2):
+            gap_exhausted = place_after(instance=moved_task, siblings=siblings, previous=previous_task)
+
+        moved_task.refresh_from_db()
+        assert gap_exhausted is False
+        assert moved_task.user_defined_ordering == 3 * gap + gap // 2
+        assert [task.user_defined_ordering for task in task_instance_create_batch[1:]] == [
+            task.user_defined_ordering for task in siblings.exclude(id=moved_task.id).order_by('user_defined_ordering')]
+
+    def test_place_after_rebalances_siblings_when_there_is_no_gap(self, task_instance_create_batch):
+        for task in task_instance_create_batch:
+            task.user_defined_ordering = 1
+            task.save()
+        moved_task, previous_task = task_instance_create_batch[-1], task_instance_create_batch[0]
+        siblings = get_all_non_removed_tasks(project=moved_task.project)
+
+        place_after(instance=moved_task, siblings=siblings, previous=previous_task)
+
+        ordered_tasks = list(siblings.order_by('user_defined_ordering', 'created_at'))
+        assert ordered_tasks.index(moved_task) == ordered_tasks.index(previous_task) + 1
+        assert len({task.user_defined_ordering for task in ordered_tasks}) == len(ordered_tasks)
+
+    def test_rebalance_user_defined_ordering_keeps_order(self, project_create_batch, active_user):
+        queryset = get_active_projects_for_user(user=active_user)
+        initial_order = list(queryset.order_by('user_defined_ordering', 'created_at'))
+
+        rebalanced_count = rebalance_user_defined_ordering(queryset=queryset)
+
+        assert rebalanced_count == len(initial_order)
+        assert list(queryset.order_by('user_defined_ordering')) == initial_order
+        assert list(queryset.order_by('user_defined_ordering').values_list('user_defined_ordering', flat=True)) == [
+            (index + 1) * settings.USER_DEFINED_ORDERING_GAP for index in range(len(initial_order))]
+
+    def test_reorder_project_to_the_top(self, project_create_batch, active_user):
+        moved_project = project_create_batch[-1]
+
+        reorder_project(project=moved_project)
+
+        assert get_active_projects_for_user(user=active_user).order_by(
+            'user_defined_ordering', 'created_at').first() == moved_project
+
+    def test_reorder_task_after_previous_task(self, task_instance_create_batch):
+        moved_task, previous_task = task_instance_create_batch[1], task_instance_create_batch[4]
+
+        reorder_task(task=moved_task, previous=previous_task)
+
+        ordered_tasks = list(get_all_non_removed_tasks(project=moved_task.project).order_by(
+            'user_defined_ordering', 'created_at'))
+        assert ordered_tasks.index(moved_task) == ordered_tasks.index(previous_task) + 1
+
+
+class TestSearchService:
+    def test_inverted_index_search_is_case_insensitive_substring_search(self):
+        inverted_index = InvertedIndex()
+        inverted_index.add(key=1, text='Write the report', payload={'id': 1, 'name': 'Write the report'})
+        inverted_index.add(key=2, text='Read a book', payload={'id': 2, 'name': 'Read a book'})
+        inverted_index.add(key=3, text='Reporting tool', payload={'id': 3, 'name': 'Reporting tool'})
+
+        assert [payload['id'] for payload in inverted_index.search(phrase='REPORT')] == [3, 1]
+        assert [payload['id'] for payload in inverted_index.search(phrase='a bo')] == [2]
+        assert inverted_index.search(phrase='missing') == []
+
+    def test_search_for_user(self, active_user, project_instance, task_instance, sub_task_instance,
+                             task_instance_for_random_project):
+        results = search_for_user(user=active_user, phrase=task_instance.name)
+
+        assert [task['id'] for task in results['tasks']] == [task_instance.id]
+
+    def test_search_for_user_looks_up_task_notes(self, active_user, task_instance):
+        results = search_for_user(user=active_user, phrase=task_instance.note[:10])
+
+        assert task_instance.id in [task['id'] for task in results['tasks']]
+
+    def test_search_for_user_sees_changes_made_after_the_previous_search(self, active_user, project_instance):
+        assert search_for_user(user=active_user, phrase='Renamed project')['projects'] == []
+
+        project_instance.name = 'Renamed project'
+        project_instance.save()
+
+        assert [project['id'] for project in search_for_user(user=active_user, phrase='Renamed project')[
+            'projects']] == [project_instance.id]
+
+    def test_search_for_user_sees_bulk_removals_and_restorations(self, active_user, task_instance):
+        assert [task['id'] for task in search_for_user(user=active_user, phrase=task_instance.name)['tasks']] == [
+            task_instance.id]
+
+        Task.objects.filter(id=task_instance.id).delete()
+        assert search_for_user(user=active_user, phrase=task_instance.name)['tasks'] == []
+
+        undo_delete_on_queryset(queryset=Task.all_objects.filter(id=task_instance.id))
+        assert [task['id'] for task in search_for_user(user=active_user, phrase=task_instance.name)['tasks']] == [
+            task_instance.id]
+
+    def test_bulk_removal_skips_search_index_owners_without_search_index(self, task_instance,
+                                                                         django_assert_num_queries):
+        #  PostgreSQL searches with trigram indexes, so there is no search index to invalidate
+        with patch('pomodorr.projects.services.search_service.is_search_index_used', return_value=False), \
+                django_assert_num_queries(1):
+            Task.objects.filter(id=task_instance.id).delete()
+
+    def test_reordering_keeps_search_index(self, active_user, project_create_batch):
+        search_index = get_search_index_for_user(user=active_user)
+
+        reorder_project(project=project_create_batch[0], previous=project_create_batch[-1])
+
+        assert get_search_index_for_user(user=active_user) is search_index
+
+
+def test_get_task_timer_settings_uses_task_lengths(task_instance, django_assert_num_queries):
+    task = Task.objects.get(id=task_instance.id)
+
+    with django_assert_num_queries(0):
+        timer_settings = get_task_timer_settings(task=task)
+
+    assert timer_settings == {'pomodoro_length': task.pomodoro_length, 'break_length': task.break_length}
+
+
+def test_get_task_timer_settings_falls_back_to_cached_user_settings(task_instance_without_lengths, active_user,
+                                                                    django_assert_num_queries):
+    get_task_timer_settings(task=Task.objects.get(id=task_instance_without_lengths.id))
+    task = Task.objects.get(id=task_instance_without_lengths.id)
+
+    with django_assert_num_queries(0):
+        timer_settings = get_task_timer_settings(task=task)
+
+    assert timer_settings == {'pomodoro_length': active_user.settings.pomodoro_length,
+                              'break_length': active_user.settings.short_break_length}
+
+
+class TestPurgeService:
+    def test_purge_rows_in_chunks(self, date_frame_create_batch, django_assert_num_queries):
+        #  A single DELETE for each of the chunks, the last one deleting less rows than the chunk size
+        with django_assert_num_queries(3):
+            deleted = purge_rows(queryset=DateFrame.objects.all(), batch_size=2)
+
+        assert deleted == 5
+        assert DateFrame.objects.exists() is False
+
+    def test_purge_rows_issues_chunked_deletes(self, active_user, date_frame_create_batch):
+        with CaptureQueriesContext(connection) as context:
+            purge_rows(queryset=DateFrame.objects.filter(user=active_user), batch_size=2)
+
+        quote_name = connection.ops.quote_name
+        assert len(context.captured_queries) == 3
+        for query in context.captured_queries:
+            assert query['sql'].startswith(
+                f'DELETE FROM {quote_name(DateFrame._meta.db_table)} WHERE {quote_name("id")} IN (SELECT ')
+            assert query['sql'].endswith(' LIMIT 2)')
+
+    @pytest.mark.django_db(transaction=True)
+    def test_purge_rows_writes_to_primary_database(self, settings, request_factory):
+        settings.DATABASE_REPLICAS = ['replica']
+
+        with route_request(request=request_factory.get('/')):
+            assert DateFrame.objects.all().db == 'replica'
+            assert get_write_db(queryset=DateFrame.objects.all()) == DEFAULT_DB_ALIAS
+
+    def test_purge_projects_with_their_dependencies(self, active_user, sub_task_instance, date_frame_create_batch,
+                                                    second_project_instance):
+        project = sub_task_instance.task.project
+
+        deleted = purge_queryset(queryset=Project.all_objects.filter(id=project.id), batch_size=2)
+
+        assert deleted == 1 + 1 + 1 + 5
+        assert Project.all_objects.filter(id=project.id).exists() is False
+        assert Task.all_objects.filter(project=project).exists() is False
+        assert SubTask.objects.exists() is False
+        assert DateFrame.objects.exists() is False
+        assert Project.all_objects.filter(id=second_project_instance.id).exists()
+
+    def test_purge_removed_tasks_only(self, task_instance, completed_task_instance, date_frame_create_batch):
+        Task.all_objects.filter(id=task_instance.id).delete()
+
+        Task.all_objects.filter(is_removed=True).delete(soft=False)
+
+        assert list(Task.all_objects.values_list('id', flat=True)) == [completed_task_instance.id]
+        assert DateFrame.objects.exists() is False
+
+    def test_purge_user_data(self, active_user, sub_task_instance, date_frame_create_batch, date_frame_for_random_task):
+        archive = DateFrameArchive.objects.create(user=active_user, frames_number=1, start=timezone.now(),
+                                                  end=timezone.now(), file=ContentFile(b'', name='frames.jsonl.gz'))
+        import_job = ImportJob.objects.create(user=active_user, file_format=ImportJob.format_csv,
+                                              file=ContentFile(b'', name='history.csv'))
+
+        purge_user_data(user_id=active_user.id, batch_size=2)
+
+        assert archive.file.storage.exists(archive.file.name) is False
+        assert import_job.file.storage.exists(import_job.file.name) is False
+
+        assert Project.all_objects.filter(user=active_user).exists() is False
+        assert Task.all_objects.filter(user=active_user).exists() is False
+        assert list(DateFrame.objects.values_list('id', flat=True)) == [date_frame_for_random_task.id]
+
+    def test_purge_removed_items_past_retention(self, project_instance, task_instance, second_project_instance,
+                                                completed_task_instance, date_frame_create_batch):
+        long_ago = timezone.now() - timedelta(days=settings.REMOVED_ITEMS_RETENTION_DAYS + 1)
+        Project.all_objects.filter(id=second_project_instance.id).delete()
+        Task.all_objects.filter(id=task_instance.id).delete()
+        Project.all_objects.filter(id=second_project_instance.id).update(removed_at=long_ago)
+        Task.all_objects.filter(id=task_instance.id).update(removed_at=long_ago)
+        Task.all_objects.filter(id=completed_task_instance.id).delete()
+        progress = []
 
-        assert is_name_available is True
+        purged = purge_removed_items(batch_size=1, on_progress=lambda name, count: progress.append(count))
 
-    def test_check_sub_task_name_is_not_available(self, task_instance, sub_task_instance):
-        checked_name = sub_task_instance.name
-        is_name_available = is_sub_task_name_available(task=task_instance, name=checked_name)
+        assert purged == (1, 1)
+        assert progress == [1, 1]
+        assert Project.all_objects.filter(id=second_project_instance.id).exists() is False
+        assert Project.objects.filter(id=project_instance.id).exists()
+        assert list(Task.all_objects.filter(project=project_instance).values_list('id', flat=True)) == [
+            completed_task_instance.id]
+        assert DateFrame.objects.exists() is False
 
-        assert is_name_available is False
+    def test_purge_removed_items_keeps_items_restored_meanwhile(self, project_instance, date_frame_create_batch):
+        long_ago = timezone.now() - timedelta(days=settings.REMOVED_ITEMS_RETENTION_DAYS + 1)
+        Project.all_objects.filter(id=project_instance.id).delete()
+        Project.all_objects.filter(id=project_instance.id).update(removed_at=long_ago)
+
+        def restore_and_purge(queryset):
+            undo_delete_on_queryset(queryset=Project.all_objects.filter(id=project_instance.id))
+            return purge_queryset(queryset=queryset)
 
-    def test_check_sub_task_name_is_available_with_exclude_id(self, task_instance, sub_task_instance):
-        checked_name = sub_task_instance.name
-        is_name_available = is_sub_task_name_available(task=task_instance, name=checked_name,
-                                                       excluded=sub_task_instance)
+        with patch('pomodorr.projects.services.purge_service.purge_queryset', side_effect=restore_and_purge):
+            purge_removed_items()
 
-        assert is_name_available is True
+        assert Project.objects.filter(id=project_instance.id).exists()
+        assert DateFrame.objects.count() == 5
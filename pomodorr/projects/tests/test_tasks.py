@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.utils import timezone
+
+from pomodorr.projects.selectors.project_selector import get_active_projects_for_user
+from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks
+from pomodorr.projects.models import Project
+from pomodorr.projects.tasks import (
+    purge_expired_removed_items, rebalance_projects_ordering, rebalance_tasks_ordering
+)
+
+
+@pytest.mark.django_db
+def test_rebalance_projects_ordering(active_user, project_create_batch):
+    rebalance_projects_ordering.apply(kwargs={'user_id': str(active_user.id)})
+
+    keys = get_active_projects_for_user(user=active_user).order_by(
+        'user_defined_ordering').values_list('user_defined_ordering', flat=True)
+    assert all(key % settings.USER_DEFINED_ORDERING_GAP == 0 for key in keys)
+    assert len(set(keys)) == len(keys)
+
+
+@pytest.mark.django_db
+def test_rebalance_tasks_ordering(project_instance, task_instance_create_batch):
+    rebalance_tasks_ordering.apply(kwargs={'project_id': str(project_instance.id)})
+
+    keys = get_all_non_removed_tasks(project=project_instance).order_by(
+        'user_defined_ordering').values_list('user_defined_ordering', flat=True)
+    assert all(key % settings.USER_DEFINED_ORDERING_GAP == 0 for key in keys)
+    assert len(set(keys)) == len(keys)
+
+
+@pytest.mark.django_db
+def test_purge_expired_removed_items(project_instance_removed, project_instance):
+    Project.all_objects.filter(id=project_instance_removed.id).update(
+        removed_at=timezone.now() - timedelta(days=settings.REMOVED_ITEMS_RETENTION_DAYS + 1))
+
+    result = purge_expired_removed_items.apply()
+
+    assert result.get() == (1, 0)
+    assert Project.all_objects.filter(id=project_instance_removed.id).exists() is False
+    assert Project.objects.filter(id=project_instance.id).exists()
@@ -50,3 +50,9 @@ class TestSubTaskUrls:
             'pk': sub_task_instance.pk,
         })
         assert url is not None
+
+
+class TestSearchUrls:
+    def test_list_url(self):
+        url = reverse('api:search-list')
+        assert url is not None
@@ -0,0 +1,132 @@
+import importlib
+import inspect
+import pkgutil
+from datetime import timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.exceptions import EmptyResultSet
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+SEQUENTIAL_SCAN_MARKERS = ('Seq Scan', 'SCAN ')
+
+
+def get_selector_modules() -> List:
+    #  Selectors live either in the "selectors" module or the "selectors" package of the project's apps
+    selector_modules = []
+
+    for app_config in apps.get_app_configs():
+        if not app_config.name.startswith('pomodorr.'):
+            continue
+
+        try:
+            selectors = importlib.import_module(f'{app_config.name}.selectors')
+        except ImportError:
+            continue
+
+        if hasattr(selectors, '__path__'):
+            selector_modules.extend(importlib.import_module(f'{selectors.__name__}.{module_info.name}')
+                                    for module_info in pkgutil.iter_modules(selectors.__path__))
+        else:
+            selector_modules.append(selectors)
+
+    return selector_modules
+
+
+def get_selector_functions() -> List[Callable]:
+    return [
+        function
+        for module in get_selector_modules()
+        for name, function in inspect.getmembers(module, inspect.isfunction)
+        if function.__module__ == module.__name__ and not name.startswith('_')
+    ]
+
+
+def get_sample_arguments() -> Dict:
+    """
+    Picks the objects the selectors get called with. They are reached from a finished date frame, so that all of them
+    are related to each other and the user owns some data in each of the tables.
+    """
+    from pomodorr.frames.models import DateFrame
+    from pomodorr.projects.models import Project, Task
+
+    date_frames = DateFrame.objects.select_related('task__project__user').order_by('end', '-start')
+    date_frame = date_frames.filter(end__isnull=False).first() or date_frames.first()
+    task = date_frame.task if date_frame is not None else Task.all_objects.select_related('project__user').first()
+    project = task.project if task is not None else Project.all_objects.select_related('user').first()
+    user = project.user if project is not None else get_user_model().objects.first()
+
+    return {
+        'user': user,
+        'user_id': getattr(user, 'id', None),
+        'project': project,
+        'project_id': getattr(project, 'id', None),
+        'task': task,
+        'task_id': getattr(task, 'id', None),
+        'date_frame_object': date_frame,
+        'date': timezone.now() - timedelta(hours=1),
+        'phrase': 'a'
+    }
+
+
+def get_selector_arguments(function: Callable, samples: Dict) -> Optional[Dict]:
+    #  Only the required parameters get filled in, None tells that the selector cannot be called with the samples
+    arguments = {}
+
+    for name, parameter in inspect.signature(function).parameters.items():
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD) or \
+                parameter.default is not parameter.empty:
+            continue
+        if samples.get(name) is None:
+            return None
+        arguments[name] = samples[name]
+
+    return arguments
+
+
+def explain_selectors(samples: Dict = None) -> Iterator[Tuple[str, Optional[str], str]]:
+    """
+    Calls every selector with the sample arguments and yields the tuples of (selector name, SQL, EXPLAIN output).
+    The selectors are run inside a transaction which is always rolled back, as some of them modify the data.
+    """
+    samples = samples if samples is not None else get_sample_arguments()
+
+    for function in get_selector_functions():
+        selector_name = f'{function.__module__}.{function.__name__}'
+        arguments = get_selector_arguments(function=function, samples=samples)
+
+        if arguments is None:
+            yield selector_name, None, 'skipped: no sample arguments for the required parameters'
+            continue
+
+        try:
+            with transaction.atomic():
+                result = function(**arguments)
+                explained = (str(result.query), result.explain()) if isinstance(result, QuerySet) else None
+                transaction.set_rollback(True)
+        except EmptyResultSet:
+            yield selector_name, None, 'skipped: the selector returns an empty queryset for the sample arguments'
+            continue
+        except Exception as error:
+            #  A broken selector is a finding of the audit as well, so it shouldn't stop it
+            yield selector_name, None, f'failed: {error!r}'
+            continue
+
+        if explained is None:
+            yield selector_name, None, 'skipped: the selector does not return a queryset'
+        else:
+            yield (selector_name, *explained)
+
+
+def has_sequential_scan(plan: str) -> bool:
+    return any(marker in plan for marker in SEQUENTIAL_SCAN_MARKERS)
+
+
+def analyze_tables() -> None:
+    #  Refreshes the planner statistics, so that the plans of the freshly seeded tables aren't based on stale ones
+    if connection.vendor in ('postgresql', 'sqlite'):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
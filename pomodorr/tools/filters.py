@@ -0,0 +1,81 @@
+from typing import Iterable, List
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from rest_flex_fields.serializers import EXPAND_PARAM, FIELDS_PARAM, OMIT_PARAM
+from rest_framework.filters import BaseFilterBackend
+
+
+def get_select_related_paths(select_related: dict, prefix: str = '') -> List[str]:
+    paths = []
+    for name, nested_select_related in select_related.items():
+        path = f'{prefix}{name}'
+        nested_paths = get_select_related_paths(select_related=nested_select_related, prefix=f'{path}__')
+        paths.extend(nested_paths or [path])
+    return paths
+
+
+def get_projected_queryset(queryset: QuerySet, field_sources: Iterable[str], expanded_sources: Iterable[str] = ()):
+    """
+    Narrows the queryset down to the columns backing the given field sources. Joins and prefetches of the relations
+    which aren't going to be represented are dropped, whereas the expanded relations get joined or prefetched.
+    If any of the sources isn't a model field, the queryset is returned untouched, as it may depend on anything.
+    """
+    model = queryset.model
+    columns = {model._meta.pk.name}
+    relations = set()
+
+    for source in field_sources:
+        try:
+            model_field = model._meta.get_field(source.split('.')[0])
+        except FieldDoesNotExist:
+            return queryset
+
+        if model_field.concrete:
+            columns.add(model_field.name)
+        if model_field.is_relation:
+            relations.add(model_field.name)
+
+    if isinstance(queryset.query.select_related, dict):
+        select_related = [path for path in get_select_related_paths(select_related=queryset.query.select_related)
+                          if path.split('__')[0] in relations]
+    else:
+        select_related = []
+    prefetch_related = [lookup for lookup in queryset._prefetch_related_lookups
+                        if getattr(lookup, 'prefetch_through', lookup).split('__')[0] in relations]
+
+    for source in expanded_sources:
+        model_field = model._meta.get_field(source)
+        if model_field.many_to_one or (model_field.one_to_one and model_field.concrete):
+            select_related.append(source)
+        elif source not in prefetch_related:
+            prefetch_related.append(source)
+
+    queryset = queryset.select_related(None).prefetch_related(None).only(*columns)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    return queryset.prefetch_related(*prefetch_related)
+
+
+class FlexFieldsProjectionFilter(BaseFilterBackend):
+    """
+    Pushes the fields requested through the "fields", "omit" and "expand" query parameters down to the queryset
+    of the GET requests, so that only the represented columns and relations get loaded. Fields needed regardless
+    of the representation by the object permission checks should be listed in the view's required_query_fields.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        flex_fields_requested = any(
+            param in request.query_params for param in (EXPAND_PARAM, FIELDS_PARAM, OMIT_PARAM))
+        if request.method != 'GET' or not flex_fields_requested:
+            return queryset
+
+        serializer = view.get_serializer()
+        serializer.apply_flex_fields()
+
+        field_sources = [field.source for field in serializer.fields.values()]
+        expanded_sources = [serializer.fields[field_name].source for field_name in serializer.expanded_fields]
+        #  The object permissions are checked only against the single objects
+        required_sources = getattr(view, 'required_query_fields', ()) if getattr(view, 'detail', False) else ()
+        return get_projected_queryset(queryset=queryset, field_sources=[*field_sources, *required_sources],
+                                      expanded_sources=expanded_sources)
@@ -0,0 +1,14 @@
+from pomodorr.tools.routers import route_request
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Routes the database reads of the request with the ReplicaRouter.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with route_request(request=request):
+            return self.get_response(request)
@@ -5,7 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 
 class IsObjectOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        return obj.user == request.user
+        return obj.user_id == request.user.id
 
 
 class IsNotAuthenticated(IsAuthenticated):
@@ -17,14 +17,14 @@ class IsNotAuthenticated(IsAuthenticated):
 
 class IsTaskOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        return obj.project.user == request.user
+        return obj.user_id == request.user.id
 
 
 class IsSubTaskOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        return obj.task.project.user == request.user
+        return obj.user_id == request.user.id
 
 
 class IsDateFrameOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        return obj.task.project.user == request.user
+        return obj.user_id == request.user.id
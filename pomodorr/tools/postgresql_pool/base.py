@@ -0,0 +1,90 @@
+import threading
+from typing import Dict, List
+
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgreSQLDatabaseWrapper, Database
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from pomodorr.tools.postgresql_pool.pool import ConnectionPool, PoolTimeout
+
+DEFAULT_POOL_OPTIONS = {
+    'MAX_SIZE': 20,
+    'TIMEOUT': 10,
+    'MAX_IDLE_TIME': 300,
+    'STATS_INTERVAL': 60
+}
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+#  The pools and the connections inherited from the parent process stay referenced, so that the garbage collector
+#  never closes the connections the parent is still using
+_inherited_references: List = []
+
+
+def get_connection_pool(alias: str, connect, options: dict) -> ConnectionPool:
+    with _pools_lock:
+        if alias in _pools and _pools[alias].is_inherited:
+            _inherited_references.append(_pools.pop(alias))
+
+        if alias not in _pools:
+            options = {**DEFAULT_POOL_OPTIONS, **options}
+            _pools[alias] = ConnectionPool(connect=connect, max_size=options['MAX_SIZE'], timeout=options['TIMEOUT'],
+                                           max_idle_time=options['MAX_IDLE_TIME'],
+                                           stats_interval=options['STATS_INTERVAL'])
+        return _pools[alias]
+
+
+class DatabaseWrapper(PostgreSQLDatabaseWrapper):
+    """
+    PostgreSQL backend taking its connections from a process wide pool instead of opening a new one each time.
+    Django keeps a connection per thread, so the ones of the ASGI executor threads are handed back to the pool when
+    Django closes them (at the end of a request, or whenever close_old_connections finds them older than CONN_MAX_AGE)
+    rather than being torn down. The pool is configured with the "POOL" dict of the database settings. Forked processes
+    (the Celery and gunicorn workers) build pools of their own instead of sharing the connections of their parent.
+    """
+
+    def get_new_connection(self, conn_params):
+        pool = get_connection_pool(alias=self.alias, connect=lambda: Database.connect(**conn_params),
+                                   options=self.settings_dict.get('POOL', {}))
+        try:
+            connection = pool.acquire()
+        except PoolTimeout as error:
+            raise Database.OperationalError(str(error)) from error
+
+        #  Same as the parent's, the isolation level must be set before Django switches the connection to autocommit
+        options = self.settings_dict['OPTIONS']
+        try:
+            self.isolation_level = options['isolation_level']
+        except KeyError:
+            self.isolation_level = connection.isolation_level
+        else:
+            if self.isolation_level != connection.isolation_level:
+                connection.set_session(isolation_level=self.isolation_level)
+
+        return connection
+
+    def _close(self):
+        if self.connection is None:
+            return
+
+        pool = _pools.get(self.alias)
+        if pool is None:
+            return super()._close()
+        if pool.is_inherited:
+            #  Closing the connection shared with the parent process would close the parent's one as well
+            _inherited_references.append(self.connection)
+            return
+
+        with self.wrap_database_errors:
+            pool.release(self.connection, reusable=self._reset_pooled_connection())
+
+    def _reset_pooled_connection(self) -> bool:
+        #  A connection goes back to the pool only if the next thread taking it gets it outside of any transaction
+        if self.connection.closed:
+            return False
+
+        try:
+            if self.connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                self.connection.rollback()
+            return self.connection.info.transaction_status == TRANSACTION_STATUS_IDLE
+        except Database.Error:
+            return False
@@ -0,0 +1,131 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections shared by the threads of a single process.
+    At most max_size connections are open at a time, a thread asking for one when all of them are in use waits up to
+    timeout seconds for another thread to release its connection. Connections idle for longer than max_idle_time
+    seconds are closed instead of being handed out, as the server or a proxy in between may have dropped them already.
+    The usage statistics get logged every stats_interval seconds, at most, when a connection is acquired.
+    """
+
+    def __init__(self, connect: Callable, max_size: int, timeout: float = None, max_idle_time: float = None,
+                 stats_interval: float = None) -> None:
+        self._connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle_time = max_idle_time
+        self.stats_interval = stats_interval
+        #  The connections are bound to the process which has opened them, a forked child must not use them
+        self.pid = os.getpid()
+        self._stats_logged_at = time.monotonic()
+
+        self._idle = deque()
+        self._in_use = 0
+        self._condition = threading.Condition()
+
+        self.peak_in_use = 0
+        self.waits = 0
+        self.timeouts = 0
+
+    @property
+    def is_inherited(self) -> bool:
+        return self.pid != os.getpid()
+
+    def _can_acquire(self) -> bool:
+        return bool(self._idle) or self._in_use + len(self._idle) < self.max_size
+
+    def _pop_idle_connection(self):
+        #  The most recently released connections are reused first, so that the surplus ones become stale and get closed
+        while self._idle:
+            connection, released_at = self._idle.pop()
+            if not getattr(connection, 'closed', False) and (
+                    self.max_idle_time is None or time.monotonic() - released_at <= self.max_idle_time):
+                return connection
+            self._close_quietly(connection)
+        return None
+
+    def acquire(self):
+        with self._condition:
+            if not self._can_acquire():
+                self.waits += 1
+                logger.warning('Database connection pool exhausted (%s connections in use), waiting for a connection',
+                               self._in_use)
+                if not self._condition.wait_for(self._can_acquire, timeout=self.timeout):
+                    self.timeouts += 1
+                    raise PoolTimeout(f'No database connection became available within {self.timeout} seconds '
+                                      f'({self._in_use} of {self.max_size} connections in use)')
+
+            self._in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self._in_use)
+            connection = self._pop_idle_connection()
+
+        self._log_stats_if_due()
+        if connection is not None:
+            return connection
+
+        try:
+            return self._connect()
+        except Exception:
+            self._discard()
+            raise
+
+    def release(self, connection, reusable: bool = True) -> None:
+        if not reusable:
+            self._close_quietly(connection)
+            self._discard()
+            return
+
+        with self._condition:
+            self._in_use -= 1
+            self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    def _discard(self) -> None:
+        with self._condition:
+            self._in_use -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close_quietly(connection) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def close_idle(self) -> None:
+        with self._condition:
+            idle_connections, self._idle = self._idle, deque()
+
+        for connection, released_at in idle_connections:
+            self._close_quietly(connection)
+
+    def _log_stats_if_due(self) -> None:
+        if self.stats_interval is None or time.monotonic() - self._stats_logged_at < self.stats_interval:
+            return
+
+        self._stats_logged_at = time.monotonic()
+        logger.info('Database connection pool of process %s: %s', self.pid, self.stats())
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                'max_size': self.max_size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'peak_in_use': self.peak_in_use,
+                'waits': self.waits,
+                'timeouts': self.timeouts
+            }
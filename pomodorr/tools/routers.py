@@ -0,0 +1,124 @@
+import random
+from contextlib import contextmanager
+from typing import Iterable, Optional
+
+from asgiref.local import Local
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject, empty
+
+PRIMARY_PINNED_USER_CACHE_KEY = 'replica_primary_pinned_user_{user_id}'
+
+_routing_state = Local()
+
+
+@contextmanager
+def route_request(request: HttpRequest):
+    """
+    Lets the reads made while handling a request with a safe method go to the read replicas. Requests with other methods
+    read from the primary database from the start, as their validation must not be based on replicated data.
+    The authenticated user of a request which has written to the database gets pinned to the primary one.
+    """
+    _routing_state.request = request
+    _routing_state.pinned = request.method not in ('GET', 'HEAD', 'OPTIONS')
+    _routing_state.written = False
+    _routing_state.user_pinned = None
+    _routing_state.pinned_user_ids = set()
+
+    try:
+        yield
+        user = get_request_user(request=request)
+        if _routing_state.written and user is not None and user.is_authenticated and \
+                user.id not in _routing_state.pinned_user_ids:
+            pin_user_to_primary(user_id=user.id)
+    finally:
+        _routing_state.request = None
+        _routing_state.pinned_user_ids = None
+
+
+def get_request_user(request: HttpRequest):
+    #  The lazily loaded session user is left alone, evaluating it would query the database from inside the router
+    user = request.__dict__.get('user')
+    if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+        return None
+    return user
+
+
+def pin_user_to_primary(user_id) -> None:
+    cache.set(PRIMARY_PINNED_USER_CACHE_KEY.format(user_id=user_id), True, timeout=settings.REPLICA_STICKINESS_TIMEOUT)
+
+
+def pin_owners_to_primary(user_ids: Iterable) -> None:
+    #  The bulk updates made outside of requests give the router no instance to tell the owner of the written rows by
+    if settings.DATABASE_REPLICAS:
+        for user_id in user_ids:
+            pin_user_to_primary(user_id=user_id)
+
+
+def is_user_pinned_to_primary(user_id) -> bool:
+    return cache.get(PRIMARY_PINNED_USER_CACHE_KEY.format(user_id=user_id)) is not None
+
+
+def get_instance_owner_id(instance) -> Optional[int]:
+    if isinstance(instance, get_user_model()):
+        return instance.pk
+    return getattr(instance, 'user_id', None)
+
+
+class ReplicaRouter:
+    """
+    Sends the reads of requests with safe methods to one of the DATABASE_REPLICAS, everything else uses the primary.
+    Writing pins the rest of the request to the primary, and the user who wrote stays pinned to it for
+    REPLICA_STICKINESS_TIMEOUT seconds, so that the following requests of the user don't miss the replication lag.
+    """
+
+    def _reads_from_primary(self) -> bool:
+        request = getattr(_routing_state, 'request', None)
+
+        if request is None or _routing_state.pinned or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return True
+
+        if _routing_state.user_pinned is None:
+            user = get_request_user(request=request)
+            if user is None or not user.is_authenticated:
+                return False
+            _routing_state.user_pinned = is_user_pinned_to_primary(user_id=user.id)
+
+        return _routing_state.user_pinned
+
+    def db_for_read(self, model, **hints):
+        if not settings.DATABASE_REPLICAS or self._reads_from_primary():
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        if not settings.DATABASE_REPLICAS:
+            return DEFAULT_DB_ALIAS
+
+        if getattr(_routing_state, 'request', None) is not None:
+            _routing_state.pinned = True
+            _routing_state.written = True
+
+        #  Writes made outside of requests (e.g. by the consumers or tasks) pin the owners of the written objects
+        owner_id = get_instance_owner_id(hints.get('instance'))
+        pinned_user_ids = getattr(_routing_state, 'pinned_user_ids', None)
+        if owner_id is not None and (pinned_user_ids is None or owner_id not in pinned_user_ids):
+            pin_user_to_primary(user_id=owner_id)
+            if pinned_user_ids is not None:
+                pinned_user_ids.add(owner_id)
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
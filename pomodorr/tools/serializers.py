@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+
+from pomodorr.tools.utils import get_violated_unique_constraint
+
+
+class UniqueConstraintErrorsMixin:
+    """
+    Lets the database unique constraints validate the written objects instead of querying for duplicates beforehand.
+    The violations of constraints listed in unique_constraint_errors are translated into field errors, mapping
+    the constraint name to a tuple of (field name, exception class, exception code).
+    The whole save runs in a single transaction, as the requests aren't wrapped in transactions anymore.
+    """
+    unique_constraint_errors = {}
+
+    def save(self, **kwargs):
+        with self.translate_unique_constraint_errors():
+            return super().save(**kwargs)
+
+    @contextmanager
+    def translate_unique_constraint_errors(self):
+        try:
+            #  No savepoint, the enclosing transaction gets marked for rollback once the write fails
+            with transaction.atomic(savepoint=False):
+                yield
+        except IntegrityError as error:
+            constraint_name = get_violated_unique_constraint(error=error, model=self.Meta.model)
+            if constraint_name not in self.unique_constraint_errors:
+                raise
+
+            field_name, exception_class, code = self.unique_constraint_errors[constraint_name]
+            raise serializers.ValidationError({field_name: [exception_class.messages[code]]}, code=code)
+
+
+class UserScopedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Looks the related object up only among the ones owned by the requesting user, so that a single query both
+    resolves and authorizes it. The user_lookup tells how to reach the owner from the related model, whereas
+    does_not_exist_error is an optional tuple of (exception class, exception code) replacing the default error.
+    """
+
+    def __init__(self, user_lookup: str = 'user', does_not_exist_error: tuple = None, **kwargs):
+        self.user_lookup = user_lookup
+        self.does_not_exist_error = does_not_exist_error
+        super(UserScopedPrimaryKeyRelatedField, self).__init__(**kwargs)
+
+    def get_queryset(self):
+        queryset = super(UserScopedPrimaryKeyRelatedField, self).get_queryset()
+        return queryset.filter(**{self.user_lookup: self.context['request'].user})
+
+    def to_internal_value(self, data):
+        try:
+            return super(UserScopedPrimaryKeyRelatedField, self).to_internal_value(data)
+        except serializers.ValidationError as error:
+            if self.does_not_exist_error is None or error.get_codes() != ['does_not_exist']:
+                raise
+
+            exception_class, code = self.does_not_exist_error
+            raise serializers.ValidationError(exception_class.messages[code], code=code)
@@ -0,0 +1,41 @@
+import pytest
+
+from pomodorr.projects.selectors.task_selector import get_all_non_removed_tasks_for_user
+from pomodorr.tools.filters import get_projected_queryset, get_select_related_paths
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_select_related_paths():
+    select_related = {'project': {'user': {}, 'priority': {}}, 'priority': {}}
+
+    assert get_select_related_paths(select_related=select_related) == [
+        'project__user', 'project__priority', 'priority']
+
+
+def test_get_projected_queryset_drops_not_represented_relations(active_user, task_instance, sub_task_instance,
+                                                                django_assert_num_queries):
+    queryset = get_projected_queryset(queryset=get_all_non_removed_tasks_for_user(user=active_user),
+                                      field_sources=['id', 'name'])
+
+    with django_assert_num_queries(1):
+        task = queryset.get()
+
+    assert task.get_deferred_fields() == {field.attname for field in task._meta.concrete_fields} - {'id', 'name'}
+
+
+def test_get_projected_queryset_keeps_represented_relations(active_user, task_instance, sub_task_instance,
+                                                            django_assert_num_queries):
+    queryset = get_projected_queryset(queryset=get_all_non_removed_tasks_for_user(user=active_user),
+                                      field_sources=['id', 'project', 'sub_tasks'])
+
+    with django_assert_num_queries(2):
+        task = queryset.get()
+        assert task.project.user_id == active_user.id
+        assert list(task.sub_tasks.all()) == [sub_task_instance]
+
+
+def test_get_projected_queryset_with_source_not_being_model_field(active_user, task_instance):
+    queryset = get_all_non_removed_tasks_for_user(user=active_user)
+
+    assert get_projected_queryset(queryset=queryset, field_sources=['id', 'normalized_pomodoro_length']) is queryset
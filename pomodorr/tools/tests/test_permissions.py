@@ -3,7 +3,7 @@ from unittest.mock import Mock
 import pytest
 from django.contrib.auth.models import AnonymousUser
 
-from pomodorr.tools.permissions import IsObjectOwner, IsNotAuthenticated, IsTaskOwner, IsSubTaskOwner
+from pomodorr.tools.permissions import IsObjectOwner, IsNotAuthenticated, IsTaskOwner, IsSubTaskOwner, IsDateFrameOwner
 
 pytestmark = pytest.mark.django_db
 
@@ -15,7 +15,7 @@ class TestIsObjectOwner:
         mock_view = Mock()
 
         mock_request.user = active_user
-        mock_obj.user = active_user
+        mock_obj.user_id = active_user.id
 
         is_object_owner_permission = IsObjectOwner()
         check_permission = is_object_owner_permission.has_object_permission(
@@ -33,7 +33,7 @@ class TestIsObjectOwner:
         obj_owner = Mock()
 
         mock_request.user = active_user
-        mock_obj.user = obj_owner
+        mock_obj.user_id = obj_owner.id
 
         is_object_owner_permission = IsObjectOwner()
         check_permission = is_object_owner_permission.has_object_permission(
@@ -84,7 +84,7 @@ class TestIsTaskOwner:
         mock_view = Mock()
 
         mock_request.user = active_user
-        mock_obj.project.user = active_user
+        mock_obj.user_id = active_user.id
 
         is_object_owner_permission = IsTaskOwner()
         check_permission = is_object_owner_permission.has_object_permission(
@@ -102,7 +102,7 @@ class TestIsTaskOwner:
         obj_owner = Mock()
 
         mock_request.user = active_user
-        mock_obj.project.user = obj_owner
+        mock_obj.user_id = obj_owner.id
 
         is_object_owner_permission = IsObjectOwner()
         check_permission = is_object_owner_permission.has_object_permission(
@@ -121,7 +121,7 @@ class TestIsSubTaskOwner:
         mock_view = Mock()
 
         mock_request.user = active_user
-        mock_obj.task.project.user = active_user
+        mock_obj.user_id = active_user.id
 
         is_object_owner_permission = IsSubTaskOwner()
         check_permission = is_object_owner_permission.has_object_permission(
@@ -139,7 +139,7 @@ class TestIsSubTaskOwner:
         obj_owner = Mock()
 
         mock_request.user = active_user
-        mock_obj.task.project.user = obj_owner
+        mock_obj.user_id = obj_owner.id
 
         is_object_owner_permission = IsSubTaskOwner()
         check_permission = is_object_owner_permission.has_object_permission(
@@ -149,3 +149,40 @@ class TestIsSubTaskOwner:
         )
 
         assert check_permission is False
+
+
+class TestIsDateFrameOwner:
+    def test_is_date_frame_owner_with_owner(self, active_user):
+        mock_request = Mock()
+        mock_obj = Mock()
+        mock_view = Mock()
+
+        mock_request.user = active_user
+        mock_obj.user_id = active_user.id
+
+        is_object_owner_permission = IsDateFrameOwner()
+        check_permission = is_object_owner_permission.has_object_permission(
+            request=mock_request,
+            view=mock_view,
+            obj=mock_obj
+        )
+
+        assert check_permission is True
+
+    def test_is_date_frame_owner_with_different_user(self, active_user):
+        mock_request = Mock()
+        mock_obj = Mock()
+        mock_view = Mock()
+        obj_owner = Mock()
+
+        mock_request.user = active_user
+        mock_obj.user_id = obj_owner.id
+
+        is_object_owner_permission = IsDateFrameOwner()
+        check_permission = is_object_owner_permission.has_object_permission(
+            request=mock_request,
+            view=mock_view,
+            obj=mock_obj
+        )
+
+        assert check_permission is False
@@ -0,0 +1,128 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pomodorr.tools.postgresql_pool.pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+
+    def close(self):
+        self.closed = 1
+
+
+def test_acquire_opens_connections_up_to_max_size():
+    pool = ConnectionPool(connect=FakeConnection, max_size=2, timeout=0)
+
+    first_connection = pool.acquire()
+    second_connection = pool.acquire()
+
+    assert first_connection is not second_connection
+    assert pool.stats()['in_use'] == 2
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    assert pool.stats()['timeouts'] == 1
+
+
+def test_released_connection_gets_reused():
+    pool = ConnectionPool(connect=FakeConnection, max_size=1, timeout=0)
+    connection = pool.acquire()
+
+    pool.release(connection)
+
+    assert pool.acquire() is connection
+    assert pool.stats() == {'max_size': 1, 'in_use': 1, 'idle': 0, 'peak_in_use': 1, 'waits': 0, 'timeouts': 0}
+
+
+def test_not_reusable_connection_gets_closed_and_frees_its_slot():
+    pool = ConnectionPool(connect=FakeConnection, max_size=1, timeout=0)
+    connection = pool.acquire()
+
+    pool.release(connection, reusable=False)
+
+    assert connection.closed
+    assert pool.acquire() is not connection
+
+
+def test_closed_idle_connection_is_not_handed_out():
+    pool = ConnectionPool(connect=FakeConnection, max_size=1, timeout=0)
+    connection = pool.acquire()
+    pool.release(connection)
+    connection.close()
+
+    assert pool.acquire() is not connection
+
+
+@patch('pomodorr.tools.postgresql_pool.pool.time')
+def test_stale_idle_connection_gets_closed(mock_time):
+    pool = ConnectionPool(connect=FakeConnection, max_size=1, timeout=0, max_idle_time=60)
+    mock_time.monotonic.return_value = 0
+    connection = pool.acquire()
+    pool.release(connection)
+    mock_time.monotonic.return_value = 61
+
+    assert pool.acquire() is not connection
+    assert connection.closed
+
+
+def test_failed_connect_frees_its_slot():
+    pool = ConnectionPool(connect=FakeConnection, max_size=1, timeout=0)
+
+    with patch.object(pool, '_connect', side_effect=ConnectionError):
+        with pytest.raises(ConnectionError):
+            pool.acquire()
+
+    assert pool.stats()['in_use'] == 0
+    assert pool.acquire() is not None
+
+
+def test_waiting_thread_gets_released_connection():
+    pool = ConnectionPool(connect=FakeConnection, max_size=1, timeout=5)
+    connection = pool.acquire()
+    acquired_connections = []
+
+    waiting_thread = threading.Thread(target=lambda: acquired_connections.append(pool.acquire()))
+    waiting_thread.start()
+    while not pool.stats()['waits']:
+        pass
+    pool.release(connection)
+    waiting_thread.join()
+
+    assert acquired_connections == [connection]
+    assert pool.stats()['peak_in_use'] == 1
+
+
+def test_close_idle_closes_idle_connections():
+    pool = ConnectionPool(connect=FakeConnection, max_size=2, timeout=0)
+    connection = pool.acquire()
+    pool.release(connection)
+
+    pool.close_idle()
+
+    assert connection.closed
+    assert pool.stats()['idle'] == 0
+
+
+def test_pool_is_inherited_by_forked_process():
+    pool = ConnectionPool(connect=FakeConnection, max_size=1)
+
+    assert not pool.is_inherited
+    with patch('pomodorr.tools.postgresql_pool.pool.os.getpid', return_value=pool.pid + 1):
+        assert pool.is_inherited
+
+
+@patch('pomodorr.tools.postgresql_pool.pool.time')
+def test_stats_get_logged_periodically(mock_time, caplog):
+    mock_time.monotonic.return_value = 0
+    pool = ConnectionPool(connect=FakeConnection, max_size=2, timeout=0, stats_interval=60)
+
+    with caplog.at_level('INFO', logger='pomodorr.tools.postgresql_pool.pool'):
+        pool.release(pool.acquire())
+        mock_time.monotonic.return_value = 61
+        pool.acquire()
+
+    assert [record.getMessage() for record in caplog.records] == [
+        f'Database connection pool of process {pool.pid}: {pool.stats()}']
@@ -0,0 +1,134 @@
+import pytest
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+
+from pomodorr.frames.services.date_frame_service import close_date_frame, delete_obsolete_date_frames
+from pomodorr.projects.models import Project
+from pomodorr.projects.tasks import hard_delete_projects, rebalance_projects_ordering
+from pomodorr.tools.routers import (
+    ReplicaRouter, is_user_pinned_to_primary, pin_owners_to_primary, pin_user_to_primary, route_request
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def replicas(settings):
+    settings.DATABASE_REPLICAS = ['replica']
+    yield settings.DATABASE_REPLICAS
+    cache.clear()
+
+
+@pytest.fixture
+def router() -> ReplicaRouter:
+    return ReplicaRouter()
+
+
+def test_reads_use_primary_without_replicas(router, request_factory):
+    with route_request(request=request_factory.get('/')):
+        assert router.db_for_read(model=None) == DEFAULT_DB_ALIAS
+
+
+def test_reads_outside_of_requests_use_primary(replicas, router):
+    assert router.db_for_read(model=None) == DEFAULT_DB_ALIAS
+
+
+@pytest.mark.django_db(transaction=True)
+def test_safe_request_reads_from_replica(active_user, replicas, router, request_factory):
+    request = request_factory.get('/')
+    request.user = active_user
+
+    with route_request(request=request):
+        assert router.db_for_read(model=None) == 'replica'
+
+
+@pytest.mark.parametrize('method', ['post', 'put', 'delete'])
+def test_unsafe_request_reads_from_primary(replicas, router, request_factory, method):
+    with route_request(request=getattr(request_factory, method)('/')):
+        assert router.db_for_read(model=None) == DEFAULT_DB_ALIAS
+
+
+def test_reads_inside_transaction_use_primary(replicas, router, request_factory):
+    with route_request(request=request_factory.get('/')), transaction.atomic():
+        assert router.db_for_read(model=None) == DEFAULT_DB_ALIAS
+
+
+def test_write_pins_rest_of_request_and_user_to_primary(active_user, replicas, router, request_factory):
+    request = request_factory.get('/')
+    request.user = active_user
+
+    with route_request(request=request):
+        router.db_for_write(model=None)
+
+        assert router.db_for_read(model=None) == DEFAULT_DB_ALIAS
+        assert not is_user_pinned_to_primary(user_id=active_user.id)
+
+    assert is_user_pinned_to_primary(user_id=active_user.id)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_pinned_user_reads_from_primary(active_user, replicas, router, request_factory):
+    pin_user_to_primary(user_id=active_user.id)
+    request = request_factory.get('/')
+    request.user = active_user
+
+    with route_request(request=request):
+        assert router.db_for_read(model=None) == DEFAULT_DB_ALIAS
+
+
+def test_writing_instance_outside_of_requests_pins_its_owner(replicas, router, project_instance):
+    router.db_for_write(model=None, instance=project_instance)
+
+    assert is_user_pinned_to_primary(user_id=project_instance.user_id)
+
+
+def test_closing_date_frame_outside_of_requests_pins_its_owner(replicas, date_frame_in_progress):
+    assert close_date_frame(date_frame=date_frame_in_progress, end=timezone.now())
+
+    assert is_user_pinned_to_primary(user_id=date_frame_in_progress.user_id)
+
+
+def test_rebalancing_ordering_outside_of_requests_pins_the_owners(replicas, project_instance):
+    #  Saving the fixtures has pinned their owner already
+    cache.clear()
+
+    rebalance_projects_ordering.apply(kwargs={'user_id': str(project_instance.user_id)})
+
+    assert is_user_pinned_to_primary(user_id=project_instance.user_id)
+
+
+def test_purging_projects_outside_of_requests_pins_the_owners(replicas, project_instance):
+    Project.all_objects.filter(id=project_instance.id).delete()
+    cache.clear()
+
+    hard_delete_projects.apply(kwargs={'project_ids': [str(project_instance.id)]})
+
+    assert is_user_pinned_to_primary(user_id=project_instance.user_id)
+
+
+def test_deleting_obsolete_date_frames_pins_the_owners(replicas, obsolete_date_frames):
+    cache.clear()
+
+    delete_obsolete_date_frames(sleep=0)
+
+    assert is_user_pinned_to_primary(user_id=obsolete_date_frames[0].user_id)
+
+
+def test_owners_are_not_pinned_without_replicas(active_user):
+    pin_owners_to_primary(user_ids=[active_user.id])
+
+    assert not is_user_pinned_to_primary(user_id=active_user.id)
+
+
+def test_replicas_are_not_migrated(replicas, router):
+    assert router.allow_migrate(db='replica', app_label='projects') is False
+    assert router.allow_migrate(db=DEFAULT_DB_ALIAS, app_label='projects') is None
+
+
+def test_middleware_keeps_pinned_user_on_primary(auth, active_user, replicas, client):
+    pin_user_to_primary(user_id=active_user.id)
+
+    response = client.get('/api/date_frames/')
+
+    assert response.status_code == 200
@@ -0,0 +1,67 @@
+import pytest
+from rest_framework import serializers
+
+from pomodorr.projects.exceptions import ProjectException, TaskException
+from pomodorr.projects.models import Priority, Project
+from pomodorr.projects.selectors.project_selector import get_all_active_projects
+from pomodorr.tools.serializers import UniqueConstraintErrorsMixin, UserScopedPrimaryKeyRelatedField
+
+pytestmark = pytest.mark.django_db
+
+
+class TestUserScopedPrimaryKeyRelatedField:
+    @staticmethod
+    def get_field(request, **kwargs):
+        field = UserScopedPrimaryKeyRelatedField(queryset=get_all_active_projects(), **kwargs)
+        field.bind(field_name='project', parent=serializers.Serializer(context={'request': request}))
+        return field
+
+    def test_resolve_object_owned_by_user(self, request_mock, project_instance, django_assert_num_queries):
+        field = self.get_field(request=request_mock)
+
+        with django_assert_num_queries(1):
+            assert field.to_internal_value(str(project_instance.id)) == project_instance
+
+    def test_resolve_object_owned_by_someone_else(self, request_mock, project_instance_for_random_user):
+        field = self.get_field(request=request_mock)
+
+        with pytest.raises(serializers.ValidationError) as exc:
+            field.to_internal_value(str(project_instance_for_random_user.id))
+
+        assert exc.value.get_codes() == ['does_not_exist']
+
+    def test_resolve_object_owned_by_someone_else_with_custom_error(self, request_mock,
+                                                                    project_instance_for_random_user):
+        field = self.get_field(request=request_mock,
+                               does_not_exist_error=(TaskException, TaskException.project_does_not_exist))
+
+        with pytest.raises(serializers.ValidationError) as exc:
+            field.to_internal_value(str(project_instance_for_random_user.id))
+
+        assert exc.value.detail[0] == TaskException.messages[TaskException.project_does_not_exist]
+        assert exc.value.get_codes() == [TaskException.project_does_not_exist]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_unique_constraint_errors_mixin_rolls_whole_save_back(active_user, project_instance):
+    class ProjectWithPrioritySerializer(UniqueConstraintErrorsMixin, serializers.ModelSerializer):
+        class Meta:
+            model = Project
+            fields = ('name',)
+
+        unique_constraint_errors = {
+            'unique_user_project': ('name', ProjectException, ProjectException.project_duplicated)
+        }
+
+        def create(self, validated_data):
+            priority = Priority.objects.create(name='Rolled back', user=active_user)
+            return super().create({**validated_data, 'user': active_user, 'priority': priority})
+
+    serializer = ProjectWithPrioritySerializer(data={'name': project_instance.name})
+    assert serializer.is_valid()
+
+    with pytest.raises(serializers.ValidationError) as exc:
+        serializer.save()
+
+    assert exc.value.detail['name'][0] == ProjectException.messages[ProjectException.project_duplicated]
+    assert Priority.objects.filter(name='Rolled back').exists() is False
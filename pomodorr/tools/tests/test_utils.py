@@ -2,9 +2,11 @@ from datetime import datetime
 from unittest.mock import patch
 
 import pytest
+from django.db import IntegrityError
 from django.utils import timezone
 
-from pomodorr.tools.utils import get_time_delta, get_default_domain
+from pomodorr.projects.models import Project
+from pomodorr.tools.utils import get_time_delta, get_default_domain, get_violated_unique_constraint
 
 
 @patch('pomodorr.tools.utils.timezone')
@@ -30,3 +32,16 @@ def test_get_default_domain():
     default_domain = get_default_domain()
 
     assert default_domain is not None
+
+
+@pytest.mark.parametrize(
+    'error_message, expected_constraint',
+    [
+        ('duplicate key value violates unique constraint "unique_user_project"', 'unique_user_project'),
+        ('UNIQUE constraint failed: projects_project.name, projects_project.user_id', 'unique_user_project'),
+        ('UNIQUE constraint failed: projects_project.id', None),
+        ('NOT NULL constraint failed: projects_project.user_id', None)
+    ]
+)
+def test_get_violated_unique_constraint(error_message, expected_constraint):
+    assert get_violated_unique_constraint(error=IntegrityError(error_message), model=Project) == expected_constraint
@@ -1,6 +1,9 @@
 from datetime import timedelta, datetime
+from typing import Optional
 
 from django.contrib.sites.models import Site
+from django.db import IntegrityError
+from django.db.models import UniqueConstraint
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.http import urlencode
@@ -28,3 +31,21 @@ def has_changed(instance, key, value, check_value=None) -> bool:
     if check_value is not None:
         return changed and value == check_value
     return changed
+
+
+def get_violated_unique_constraint(error: IntegrityError, model) -> Optional[str]:
+    """
+    Returns the name of the model's unique constraint the error has been raised for.
+    PostgreSQL reports the name of the constraint, whereas SQLite only lists the constrained columns.
+    """
+    message = str(error)
+
+    for constraint in model._meta.constraints:
+        if not isinstance(constraint, UniqueConstraint):
+            continue
+
+        columns = ', '.join(
+            f'{model._meta.db_table}.{model._meta.get_field(field).column}' for field in constraint.fields)
+        if f'"{constraint.name}"' in message or message == f'UNIQUE constraint failed: {columns}':
+            return constraint.name
+    return None
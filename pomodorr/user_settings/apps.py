@@ -1,7 +1,22 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save, post_delete
 from django.utils.translation import gettext_lazy as _
 
 
 class UserSettingsConfig(AppConfig):
     name = "pomodorr.user_settings"
     verbose_name = _("User Settings")
+
+    def ready(self):
+        try:
+            from pomodorr.user_settings.signals.handlers import user_setting_changed
+            user_setting_model = self.get_model('UserSetting', require_ready=True)
+
+            post_save.connect(receiver=user_setting_changed, sender=user_setting_model,
+                              dispatch_uid='pomodorr.user_settings.signals.user_setting_saved')
+
+            post_delete.connect(receiver=user_setting_changed, sender=user_setting_model,
+                                dispatch_uid='pomodorr.user_settings.signals.user_setting_deleted')
+
+        except ImportError:
+            pass  # noqa F401
@@ -0,0 +1,5 @@
+from pomodorr.user_settings.models import UserSetting
+
+
+def get_settings_for_user(user_id, **kwargs):
+    return UserSetting.objects.filter(user_id=user_id, **kwargs)
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from pomodorr.user_settings.models import UserSetting
+from pomodorr.user_settings.selectors import get_settings_for_user
+
+TIMER_SETTINGS_CACHE_KEY = 'user_timer_settings_{user_id}'
+TIMER_SETTINGS_FIELDS = ('pomodoro_length', 'short_break_length', 'long_break_length')
+
+
+def get_timer_settings_for_user(user_id) -> dict:
+    cache_key = TIMER_SETTINGS_CACHE_KEY.format(user_id=user_id)
+    timer_settings = cache.get(cache_key)
+
+    if timer_settings is None:
+        timer_settings = get_settings_for_user(user_id=user_id).values(*TIMER_SETTINGS_FIELDS).first()
+        if timer_settings is None:
+            raise UserSetting.DoesNotExist
+        cache.set(cache_key, timer_settings, timeout=settings.TIMER_SETTINGS_CACHE_TIMEOUT)
+
+    return timer_settings
+
+
+def invalidate_timer_settings(user_id) -> None:
+    cache_key = TIMER_SETTINGS_CACHE_KEY.format(user_id=user_id)
+    cache.delete(cache_key)
+    #  The old settings might get cached again by a concurrent request before the transaction is committed
+    transaction.on_commit(lambda: cache.delete(cache_key))
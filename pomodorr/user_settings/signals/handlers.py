@@ -0,0 +1,5 @@
+from pomodorr.user_settings.services import invalidate_timer_settings
+
+
+def user_setting_changed(sender, instance, **kwargs):
+    invalidate_timer_settings(user_id=instance.user_id)
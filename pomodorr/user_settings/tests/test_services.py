@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+import pytest
+
+from pomodorr.user_settings.models import UserSetting
+from pomodorr.user_settings.services import get_timer_settings_for_user
+from pomodorr.users.serializers import UserDetailSerializer
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_timer_settings_for_user_caches_the_settings(active_user, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        timer_settings = get_timer_settings_for_user(user_id=active_user.id)
+
+    with django_assert_num_queries(0):
+        assert get_timer_settings_for_user(user_id=active_user.id) == timer_settings
+
+    assert timer_settings['pomodoro_length'] == active_user.settings.pomodoro_length
+    assert timer_settings['short_break_length'] == active_user.settings.short_break_length
+
+
+def test_get_timer_settings_for_user_without_settings(admin_user):
+    with pytest.raises(UserSetting.DoesNotExist):
+        get_timer_settings_for_user(user_id=admin_user.id)
+
+
+def test_timer_settings_are_invalidated_after_settings_saved(active_user):
+    get_timer_settings_for_user(user_id=active_user.id)
+
+    active_user.settings.pomodoro_length = timedelta(minutes=42)
+    active_user.settings.save()
+
+    assert get_timer_settings_for_user(user_id=active_user.id)['pomodoro_length'] == timedelta(minutes=42)
+
+
+def test_timer_settings_are_invalidated_after_user_detail_updated(active_user):
+    get_timer_settings_for_user(user_id=active_user.id)
+
+    serializer = UserDetailSerializer(instance=active_user, data={'settings': {'short_break_length': '00:07:00'}},
+                                      partial=True)
+    assert serializer.is_valid(), serializer.errors
+    serializer.save()
+
+    assert get_timer_settings_for_user(user_id=active_user.id)['short_break_length'] == timedelta(minutes=7)
@@ -5,6 +5,7 @@ from django.db import transaction
 
 
 from pomodorr.users.forms import AdminSiteUserUpdateForm, AdminSiteUserCreationForm
+from pomodorr.users.services import schedule_users_purge
 from django.utils.translation import gettext_lazy as _
 
 User = get_user_model()
@@ -58,14 +59,19 @@ class UserAdmin(UserAdmin):
         (_('Important dates'), {'fields': ('last_login', 'date_joined', 'blocked_until')}),
     )
 
-    def is_blocked(self, instance):
-        return instance.is_blocked
-
-    is_blocked.boolean = True
-    is_blocked.admin_order_field = "is_blocked"
-
     def unblock_selected(modeladmin, request, queryset):
         with transaction.atomic():
-            queryset.update(blocked_until=None)
+            queryset.update(blocked_until=None, is_blocked=False)
 
     unblock_selected.short_description = "Unblock selected users"
+
+    def get_deleted_objects(self, objs, request):
+        #  The related objects of the users aren't collected, as they get purged in the background
+        return [str(obj) for obj in objs], {User._meta.verbose_name_plural: len(objs)}, set(), []
+
+    def delete_model(self, request, obj):
+        self.delete_queryset(request=request, queryset=User.objects.filter(id=obj.id))
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            schedule_users_purge(users=queryset)
@@ -2,8 +2,6 @@ from django.apps import AppConfig
 from django.db.models.signals import post_save
 from django.utils.translation import gettext_lazy as _
 
-from pomodorr.users.signals.handlers import create_default_project
-
 
 class UsersConfig(AppConfig):
     name = "pomodorr.users"
@@ -11,14 +9,19 @@ class UsersConfig(AppConfig):
 
     def ready(self):
         try:
-            from pomodorr.users.signals.handlers import create_settings
+            from pomodorr.users.signals.handlers import (
+                onboard_new_user, schedule_avatar_renditions, schedule_unblocking
+            )
             user_model = self.get_model('User', require_ready=True)
 
-            post_save.connect(receiver=create_settings, sender=user_model,
-                              dispatch_uid='pomodorr.users.signals.create_settings')
+            post_save.connect(receiver=onboard_new_user, sender=user_model,
+                              dispatch_uid='pomodorr.users.signals.onboard_new_user')
+
+            post_save.connect(receiver=schedule_unblocking, sender=user_model,
+                              dispatch_uid='pomodorr.users.signals.schedule_unblocking')
 
-            post_save.connect(receiver=create_default_project, sender=user_model,
-                              dispatch_uid='pomodorr.users.signals.create_default_project')
+            post_save.connect(receiver=schedule_avatar_renditions, sender=user_model,
+                              dispatch_uid='pomodorr.users.signals.schedule_avatar_renditions')
 
         except ImportError:
             pass  # noqa F401
@@ -0,0 +1,113 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from pomodorr.users.services import onboard_users
+
+User = get_user_model()
+
+USER_FIELDS = ('email', 'username', 'password', 'first_name', 'last_name')
+
+
+def read_users_data(path: str, file_format: str) -> Iterator[Dict[str, str]]:
+    with open(path, newline='', encoding='utf-8') as users_file:
+        if file_format == 'csv':
+            yield from csv.DictReader(users_file)
+        else:
+            yield from (json.loads(line) for line in users_file if line.strip())
+
+
+def get_batches(iterable, batch_size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    batch = list(islice(iterator, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, batch_size))
+
+
+def hash_passwords(passwords: List[Optional[str]], executor: Optional[ProcessPoolExecutor]) -> List[str]:
+    #  Hashing is CPU bound, so it is spread across the processes of the pool (if there's any)
+    passwords = [password or None for password in passwords]
+    if executor is None:
+        return [make_password(password) for password in passwords]
+    return list(executor.map(make_password, passwords, chunksize=32))
+
+
+def build_users(users_data: List[Dict[str, str]], is_active: bool) -> List:
+    #  Mirrors UserManager.create_user, so that the provisioned users are the same as the registered ones
+    return [
+        User(email=User.objects.normalize_email(user_data['email']),
+             username=User.normalize_username(user_data['username']), password=user_data.get('password'),
+             first_name=user_data.get('first_name') or '', last_name=user_data.get('last_name') or '',
+             is_active=is_active, is_staff=False, is_superuser=False)
+        for user_data in users_data
+    ]
+
+
+def exclude_existing_users(users: List) -> List:
+    #  Users already registered or duplicated within the batch are left alone
+    existing_users = User.objects.filter(email__in=[user.email for user in users]) | User.objects.filter(
+        username__in=[user.username for user in users])
+    taken_values = {value for user in existing_users.values('email', 'username') for value in user.values()}
+    new_users = []
+
+    for user in users:
+        if user.email not in taken_values and user.username not in taken_values:
+            taken_values.update((user.email, user.username))
+            new_users.append(user)
+
+    return new_users
+
+
+class Command(BaseCommand):
+    help = 'Creates users (with their settings, priorities and projects) from a CSV or JSON Lines file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help=f'File with the users, its columns or keys are: {", ".join(USER_FIELDS)}.')
+        parser.add_argument('--format', choices=('csv', 'jsonl'), default=None,
+                            help='Format of the file, guessed from its extension by default.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Number of users inserted at once.')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                            help='Number of processes hashing the passwords, 0 hashes them in the current process.')
+        parser.add_argument('--active', action='store_true', help='Activate the users, so that they can log in.')
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or os.path.splitext(options['path'])[1].lstrip('.').lower()
+        if file_format not in ('csv', 'jsonl'):
+            raise CommandError('Unknown format of the file, pass it with --format.')
+
+        created = skipped = 0
+        executor = ProcessPoolExecutor(max_workers=options['workers']) if options['workers'] else None
+
+        try:
+            for users_data in get_batches(read_users_data(options['path'], file_format), options['batch_size']):
+                missing_data = next((user_data for user_data in users_data
+                                     if not user_data.get('email') or not user_data.get('username')), None)
+                if missing_data is not None:
+                    raise CommandError(f'Every user needs an email and a username: {missing_data}')
+
+                users = exclude_existing_users(users=build_users(users_data=users_data, is_active=options['active']))
+                passwords = hash_passwords([user.password for user in users], executor=executor)
+                for user, password in zip(users, passwords):
+                    user.password = password
+
+                #  bulk_create skips the post_save handlers, so the users get onboarded explicitly
+                with transaction.atomic():
+                    User.objects.bulk_create(users)
+                    onboard_users(users=users)
+
+                created += len(users)
+                skipped += len(users_data) - len(users)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f'Created {created} users, skipped {skipped} already existing ones.'))
@@ -0,0 +1,25 @@
+# Generated by Django 3.0.7 on 2026-10-19 08:25
+
+from django.db import migrations, models
+
+
+def remove_frequent_unblocking_schedule(apps, schema_editor):
+    #  The database scheduler of celery beat keeps the entries which are no longer in the beat_schedule
+    PeriodicTask = apps.get_model('django_celery_beat', 'PeriodicTask')
+    PeriodicTask.objects.filter(name='unblock-ready-to-unblock-users-every-30-seconds').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_auto_20200410_1333'),
+        ('django_celery_beat', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(blocked_until__isnull=False), fields=['blocked_until'], name='user_blocked_until_idx'),
+        ),
+        migrations.RunPython(remove_frequent_unblocking_schedule, migrations.RunPython.noop),
+    ]
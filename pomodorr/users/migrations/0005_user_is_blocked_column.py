@@ -0,0 +1,28 @@
+# Generated by Django 3.0.7 on 2026-10-19 08:26
+
+from django.db import migrations, models
+
+
+def fill_is_blocked(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    User._base_manager.filter(blocked_until__isnull=False).update(is_blocked=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_user_blocked_until_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='is_blocked',
+            field=models.BooleanField(db_index=True, default=False, editable=False, verbose_name='is blocked'),
+        ),
+        migrations.RunPython(fill_is_blocked, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('blocked_until__isnull', False), ('is_blocked', True)), models.Q(('blocked_until__isnull', True), ('is_blocked', False)), _connector='OR'), name='user_is_blocked_matches_blocked_until'),
+        ),
+    ]
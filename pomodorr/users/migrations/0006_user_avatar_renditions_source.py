@@ -0,0 +1,18 @@
+# Generated by Django 3.0.7 on 2026-10-19 08:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_user_is_blocked_column'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='avatar_renditions_source',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='avatar renditions source'),
+        ),
+    ]
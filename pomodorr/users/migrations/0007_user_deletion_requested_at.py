@@ -0,0 +1,18 @@
+# Generated by Django 3.0.7 on 2026-10-19 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_user_avatar_renditions_source'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='deletion_requested_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='deletion requested at'),
+        ),
+    ]
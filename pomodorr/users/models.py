@@ -1,29 +1,27 @@
+import os
 import uuid
+from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
 from django.core.files import storage
 from django.core.validators import FileExtensionValidator
-from django.db import models
-from django.db.models import When, BooleanField, Case
+from django.db import models, transaction
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
+from model_utils import FieldTracker
 
 from pomodorr.tools.utils import get_default_domain
 
 
 class UserManager(BaseUserManager):
 
-    def get_queryset(self):
-        return super(UserManager, self).get_queryset().annotate(is_blocked=Case(
-            When(blocked_until__isnull=False, then=True),
-            default=False, output_field=BooleanField())
-        )
-
     def active_standard_users(self):
         return self.get_queryset().filter(
             is_active=True,
-            blocked_until__isnull=True,
+            is_blocked=False,
             is_superuser=False,
             is_staff=False
         )
@@ -31,18 +29,21 @@ class UserManager(BaseUserManager):
     def non_active_standard_users(self):
         return self.get_queryset().filter(
             is_active=False,
-            blocked_until__isnull=True,
+            is_blocked=False,
             is_superuser=False,
             is_staff=False
         )
 
     def blocked_standard_users(self):
         return self.get_queryset().filter(
-            blocked_until__isnull=False,
+            is_blocked=True,
             is_superuser=False,
             is_staff=False
         )
 
+    def pending_deletion_users(self):
+        return self.get_queryset().filter(is_active=False, deletion_requested_at__isnull=False)
+
     def ready_to_unblock_users(self):
         return self.get_queryset().filter(
             blocked_until__isnull=False,
@@ -55,7 +56,9 @@ class UserManager(BaseUserManager):
         user = self.model(username=username, email=email, is_active=is_active, **extra_fields)
 
         user.set_password(password)
-        user.save(using=self._db)
+        #  The user gets onboarded by a post_save handler, so that the user is never saved without a workspace
+        with transaction.atomic(using=self._db):
+            user.save(using=self._db)
         return user
 
     def create_user(self, email, username=None, password=None, is_active=False, **extra_fields):
@@ -78,25 +81,72 @@ def user_upload_path(instance, filename):
     return "users/{0}/{1}".format(instance.id, storage.get_valid_filename(filename))
 
 
+def avatar_rendition_path(avatar_name: str, size: int, extension: str) -> str:
+    return "{0}_{1}.{2}".format(os.path.splitext(avatar_name)[0], size, extension)
+
+
 class User(AbstractUser):
     ALLOWED_AVATAR_EXTENSIONS = ['jpg', 'jpeg', 'png']
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     email = models.EmailField(_("email address"), unique=True, null=False, blank=False)
     blocked_until = models.DateTimeField(_("blocked until"), null=True, blank=True)
+    #  Kept in sync with blocked_until by save(), the queryset updates of blocked_until have to update it as well
+    is_blocked = models.BooleanField(_("is blocked"), default=False, editable=False, db_index=True)
 
     avatar = models.FileField(_("avatar"), upload_to=user_upload_path, null=True,
                               validators=(FileExtensionValidator(allowed_extensions=ALLOWED_AVATAR_EXTENSIONS),))
+    #  Name of the avatar the current renditions have been generated from, they're pending if it differs from the avatar
+    avatar_renditions_source = models.CharField(_("avatar renditions source"), max_length=255, blank=True,
+                                                editable=False)
+    #  Set while the user waits for the background deletion, which skips the users reactivated in the meantime
+    deletion_requested_at = models.DateTimeField(_("deletion requested at"), null=True, blank=True, editable=False)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
     objects = UserManager()
+    tracker = FieldTracker(fields=['blocked_until', 'avatar'])
 
     class Meta:
         ordering = ('date_joined',)
+        indexes = [
+            models.Index(fields=['blocked_until'], name='user_blocked_until_idx',
+                         condition=Q(blocked_until__isnull=False))
+        ]
+        constraints = [
+            models.CheckConstraint(check=Q(is_blocked=True, blocked_until__isnull=False) |
+                                   Q(is_blocked=False, blocked_until__isnull=True),
+                                   name='user_is_blocked_matches_blocked_until')
+        ]
+
+    def save(self, *args, **kwargs):
+        self.is_blocked = self.blocked_until is not None
+        if self.is_active:
+            self.deletion_requested_at = None
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'blocked_until' in update_fields:
+            update_fields = kwargs['update_fields'] = {*update_fields, 'is_blocked'}
+        if update_fields is not None and 'is_active' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'deletion_requested_at'}
+
+        super(User, self).save(*args, **kwargs)
 
     def get_avatar_url(self):
         if self.avatar:
             return f"{get_default_domain()}{self.avatar.url}"
         return str()
+
+    def get_avatar_rendition_urls(self) -> Optional[dict]:
+        if not self.avatar or self.avatar_renditions_source != self.avatar.name:
+            return None
+
+        domain, avatar_storage = get_default_domain(), self.avatar.storage
+        return {
+            str(size): {
+                extension: f"{domain}{avatar_storage.url(avatar_rendition_path(self.avatar.name, size, extension))}"
+                for extension in settings.AVATAR_RENDITION_FORMATS
+            }
+            for size in settings.AVATAR_RENDITION_SIZES
+        }
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.core.validators import FileExtensionValidator
+from django.db import transaction
 from rest_framework import serializers
 
 from pomodorr.tools.validators import image_size_validator
@@ -13,6 +14,7 @@ class UserDetailSerializer(serializers.ModelSerializer):
         image_size_validator,
         FileExtensionValidator(allowed_extensions=User.ALLOWED_AVATAR_EXTENSIONS)
     ))
+    avatar_renditions = serializers.DictField(source='get_avatar_rendition_urls', read_only=True, allow_null=True)
     settings = UserSettingSerializer(many=False, required=False)
 
     class Meta:
@@ -22,6 +24,7 @@ class UserDetailSerializer(serializers.ModelSerializer):
             'email',
             'username',
             'avatar',
+            'avatar_renditions',
             'settings'
         )
         extra_kwargs = {
@@ -31,16 +34,17 @@ class UserDetailSerializer(serializers.ModelSerializer):
         }
 
     def create(self, validated_data):
-        validated_data.pop('settings')
+        validated_data.pop('settings', None)
         return super(UserDetailSerializer, self).create(validated_data=validated_data)
 
     def update(self, instance, validated_data):
-        settings_data = validated_data.pop('settings') or None
+        settings_data = validated_data.pop('settings', None)
 
-        if settings_data is not None:
-            settings_object = instance.settings
-            for field in settings_data.keys():
-                setattr(settings_object, field, settings_data[field])
-            settings_object.save()
+        with transaction.atomic():
+            if settings_data is not None:
+                settings_object = instance.settings
+                for field in settings_data.keys():
+                    setattr(settings_object, field, settings_data[field])
+                settings_object.save()
 
-        return super(UserDetailSerializer, self).update(instance=instance, validated_data=validated_data)
+            return super(UserDetailSerializer, self).update(instance=instance, validated_data=validated_data)
@@ -0,0 +1,112 @@
+from io import BytesIO
+from typing import Iterable
+
+from PIL import Image
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractUser
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.db import transaction
+from django.utils import timezone
+from pilkit.processors import ResizeToFill, Transpose
+from pilkit.utils import save_image
+
+from pomodorr.projects.models import Priority, Project
+from pomodorr.tools.routers import pin_owners_to_primary
+from pomodorr.user_settings.models import UserSetting
+from pomodorr.users.models import avatar_rendition_path
+
+
+def needs_onboarding(user: AbstractUser) -> bool:
+    return not user.is_staff and not user.is_superuser
+
+
+def onboard_users(users: Iterable[AbstractUser], template: dict = None) -> None:
+    """
+    Creates the default workspace of the users: their settings, priorities and projects, with a single INSERT per
+    table. The template (ONBOARDING_TEMPLATE by default) holds the field values of the settings, the priorities and
+    the projects, which refer to their priorities by name.
+    """
+    template = template if template is not None else settings.ONBOARDING_TEMPLATE
+    users = [user for user in users if needs_onboarding(user=user)]
+    if not users:
+        return
+
+    priorities = {
+        (user.id, priority_template['name']): Priority(user=user, **priority_template)
+        for user in users for priority_template in template.get('priorities', ())
+    }
+    projects = []
+    for user in users:
+        for index, project_template in enumerate(template.get('projects', ())):
+            project_fields = dict(project_template)
+            priority_name = project_fields.pop('priority', None)
+            priority = priorities[(user.id, priority_name)] if priority_name is not None else None
+            projects.append(Project(user=user, priority=priority,
+                                    user_defined_ordering=(index + 1) * settings.USER_DEFINED_ORDERING_GAP,
+                                    **project_fields))
+
+    with transaction.atomic():
+        UserSetting.objects.bulk_create([UserSetting(user=user, **template.get('settings', {})) for user in users])
+        Priority.objects.bulk_create(priorities.values())
+        Project.objects.bulk_create(projects)
+
+
+def onboard_user(user: AbstractUser, template: dict = None) -> None:
+    onboard_users(users=[user], template=template)
+
+
+def delete_avatar_renditions(avatar_storage: Storage, avatar_name: str) -> None:
+    for size in settings.AVATAR_RENDITION_SIZES:
+        for extension in settings.AVATAR_RENDITION_FORMATS:
+            avatar_storage.delete(avatar_rendition_path(avatar_name, size, extension))
+
+
+def generate_avatar_renditions(user: AbstractUser) -> None:
+    """
+    Saves the square renditions of the user's avatar in every size and format, next to the original. They're marked
+    as ready only if the avatar hasn't been replaced in the meantime, the renditions of the previous one get deleted.
+    """
+    if not user.avatar:
+        return
+
+    avatar_name, avatar_storage = user.avatar.name, user.avatar.storage
+    with avatar_storage.open(avatar_name, 'rb') as avatar_file:
+        image = Image.open(avatar_file)
+        image.load()
+
+    image = Transpose().process(image)
+
+    for size in settings.AVATAR_RENDITION_SIZES:
+        rendition = ResizeToFill(width=size, height=size).process(image)
+
+        for extension, image_format in settings.AVATAR_RENDITION_FORMATS.items():
+            rendition_file = save_image(rendition, BytesIO(), image_format,
+                                        options={'quality': settings.AVATAR_RENDITION_QUALITY})
+            rendition_name = avatar_rendition_path(avatar_name, size, extension)
+            avatar_storage.delete(rendition_name)
+            avatar_storage.save(rendition_name, ContentFile(rendition_file.getvalue()))
+
+    marked_as_ready = get_user_model().objects.filter(id=user.id, avatar=avatar_name).update(
+        avatar_renditions_source=avatar_name)
+    if marked_as_ready:
+        pin_owners_to_primary(user_ids=[user.id])
+
+    if not marked_as_ready:
+        delete_avatar_renditions(avatar_storage=avatar_storage, avatar_name=avatar_name)
+    elif user.avatar_renditions_source and user.avatar_renditions_source != avatar_name:
+        delete_avatar_renditions(avatar_storage=avatar_storage, avatar_name=user.avatar_renditions_source)
+
+
+def schedule_users_purge(users) -> None:
+    """
+    Deactivates the users right away and marks them for deletion, deleting them along with all of their data is left
+    to the background jobs.
+    """
+    from pomodorr.users.tasks import hard_delete_user
+
+    user_ids = [str(user_id) for user_id in users.values_list('id', flat=True)]
+    users.update(is_active=False, deletion_requested_at=timezone.now())
+    for user_id in user_ids:
+        transaction.on_commit(lambda user_id=user_id: hard_delete_user.delay(user_id=user_id))
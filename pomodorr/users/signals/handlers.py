@@ -1,13 +1,24 @@
-def create_settings(sender, instance, created, **kwargs):
-    from pomodorr.user_settings.models import UserSetting
+from django.db import transaction
 
-    if created and instance and not instance.is_staff and not instance.is_superuser:
-        UserSetting.objects.create(user=instance)
 
+def onboard_new_user(sender, instance, created, raw=False, **kwargs):
+    from pomodorr.users.services import onboard_user
 
-def create_default_project(sender, instance, created, **kwargs):
-    from pomodorr.projects.models import Project, Priority
+    if created and not raw:
+        onboard_user(user=instance)
 
-    if created and instance and not instance.is_staff and not instance.is_superuser:
-        default_priority = Priority.objects.create(name='Normal', user=instance)
-        Project.objects.create(name='Inbox', priority=default_priority, user=instance)
+
+def schedule_unblocking(sender, instance, **kwargs):
+    from pomodorr.users.tasks import unblock_user
+
+    if instance.blocked_until is not None and instance.tracker.has_changed('blocked_until'):
+        user_id, blocked_until = str(instance.id), instance.blocked_until
+        transaction.on_commit(lambda: unblock_user.apply_async(kwargs={'user_id': user_id}, eta=blocked_until))
+
+
+def schedule_avatar_renditions(sender, instance, **kwargs):
+    from pomodorr.users.tasks import process_avatar
+
+    if instance.avatar and instance.tracker.has_changed('avatar'):
+        user_id = str(instance.id)
+        transaction.on_commit(lambda: process_avatar.delay(user_id=user_id))
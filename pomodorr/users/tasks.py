@@ -1,10 +1,48 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 
 from config import celery_app
+from pomodorr.projects.services.purge_service import purge_user_data
+from pomodorr.tools.routers import pin_owners_to_primary
+from pomodorr.users.services import generate_avatar_renditions
+
+
+@celery_app.task(name='pomodorr.users.unblock_user')
+def unblock_user(user_id: str) -> None:
+    #  Runs at the user's blocked_until, the block might have been extended or lifted in the meantime
+    User = get_user_model()
+
+    if User.objects.ready_to_unblock_users().filter(id=user_id).update(blocked_until=None, is_blocked=False):
+        pin_owners_to_primary(user_ids=[user_id])
 
 
 @celery_app.task(name='pomodorr.users.unblock_users')
 def unblock_users() -> None:
     User = get_user_model()
 
-    User.objects.ready_to_unblock_users().update(blocked_until=None)
+    user_ids = list(User.objects.ready_to_unblock_users().values_list('id', flat=True))
+    User.objects.ready_to_unblock_users().filter(id__in=user_ids).update(blocked_until=None, is_blocked=False)
+    pin_owners_to_primary(user_ids=user_ids)
+
+
+@celery_app.task(name='pomodorr.users.process_avatar')
+def process_avatar(user_id: str) -> None:
+    User = get_user_model()
+
+    user = User.objects.filter(id=user_id).first()
+    if user is not None:
+        generate_avatar_renditions(user=user)
+
+
+@celery_app.task(name='pomodorr.users.hard_delete_user', time_limit=settings.PURGE_TASK_TIME_LIMIT,
+                 soft_time_limit=settings.PURGE_TASK_TIME_LIMIT - 60)
+def hard_delete_user(user_id: str) -> int:
+    #  The bulk of the user's data is purged in chunks, what is left for the deletion collector is small
+    User = get_user_model()
+
+    #  The users reactivated in the meantime are kept
+    if not User.objects.pending_deletion_users().filter(id=user_id).exists():
+        return 0
+
+    deleted = purge_user_data(user_id=user_id)
+    return deleted + User.objects.filter(id=user_id).delete()[0]
@@ -1,4 +1,9 @@
+from unittest.mock import patch
+
 import pytest
+from django.contrib.admin import AdminSite
+
+from pomodorr.users.admin import UserAdmin
 
 pytestmark = pytest.mark.django_db
 
@@ -37,3 +42,16 @@ def test_is_blocked_filter_get_queryset_with_invalid_param(request_mock, is_bloc
     assert query_result.count() == 3  # Only the blocked user should be returned
     assert blocked_user in query_result
     assert all([user in query_result] for user in [admin_user, active_user, blocked_user])
+
+
+def test_user_admin_deletion_is_scheduled(user_model, request_mock, active_user, admin_user):
+    user_admin = UserAdmin(model=user_model, admin_site=AdminSite())
+
+    with patch('pomodorr.users.services.transaction.on_commit', side_effect=lambda callback: callback()), \
+            patch('pomodorr.users.tasks.hard_delete_user.delay') as delay_mock:
+        user_admin.delete_queryset(request=request_mock, queryset=user_model.objects.filter(id=active_user.id))
+
+    active_user.refresh_from_db()
+    assert active_user.is_active is False
+    assert active_user.deletion_requested_at is not None
+    delay_mock.assert_called_once_with(user_id=str(active_user.id))
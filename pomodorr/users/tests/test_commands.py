@@ -0,0 +1,70 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from pomodorr.projects.models import Project
+from pomodorr.user_settings.models import UserSetting
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def users_csv_file(tmpdir):
+    users_file = tmpdir.join('users.csv')
+    users_file.write('email,username,password,first_name\n'
+                     'first@POMODORR.TK,first,Secret123!,First\n'
+                     'second@pomodorr.tk,second,,\n')
+    return str(users_file)
+
+
+@pytest.fixture
+def users_jsonl_file(tmpdir, active_user):
+    users_file = tmpdir.join('users.jsonl')
+    users_file.write('\n'.join(json.dumps(user_data) for user_data in [
+        {'email': 'first@pomodorr.tk', 'username': 'first', 'password': 'Secret123!'},
+        {'email': 'first@pomodorr.tk', 'username': 'duplicated', 'password': 'Secret123!'},
+        {'email': active_user.email, 'username': 'registered', 'password': 'Secret123!'},
+    ]))
+    return str(users_file)
+
+
+class TestProvisionUsersCommand:
+    @pytest.mark.parametrize('workers', ['0', '2'])
+    def test_provision_users_from_csv(self, user_model, users_csv_file, workers):
+        output = StringIO()
+
+        call_command('provision_users', users_csv_file, '--active', f'--workers={workers}', '--batch-size=1',
+                     stdout=output)
+
+        first_user = user_model.objects.get(username='first')
+        second_user = user_model.objects.get(username='second')
+        assert 'Created 2 users' in output.getvalue()
+        assert first_user.email == 'first@pomodorr.tk'
+        assert first_user.first_name == 'First'
+        assert first_user.is_active and not first_user.is_blocked
+        assert first_user.check_password('Secret123!')
+        assert not second_user.has_usable_password()
+
+    def test_provisioned_users_are_onboarded(self, user_model, users_csv_file):
+        call_command('provision_users', users_csv_file, '--workers=0', stdout=StringIO())
+
+        users = user_model.objects.filter(username__in=['first', 'second'])
+        assert UserSetting.objects.filter(user__in=users).count() == 2
+        assert Project.objects.filter(user__in=users, name='Inbox', priority__name='Normal').count() == 2
+
+    def test_provision_users_skips_existing_users(self, user_model, users_jsonl_file):
+        output = StringIO()
+
+        call_command('provision_users', users_jsonl_file, '--workers=0', stdout=output)
+
+        assert 'Created 1 users, skipped 2' in output.getvalue()
+        assert not user_model.objects.filter(username__in=['duplicated', 'registered']).exists()
+
+    def test_provision_users_requires_email_and_username(self, tmpdir):
+        users_file = tmpdir.join('users.txt')
+        users_file.write('{"email": "first@pomodorr.tk"}\n')
+
+        with pytest.raises(CommandError):
+            call_command('provision_users', str(users_file), '--format=jsonl', '--workers=0', stdout=StringIO())
@@ -1,4 +1,10 @@
+from unittest.mock import patch
+
 import pytest
+from django.db import DatabaseError, IntegrityError
+
+from pomodorr.projects.models import Project
+from pomodorr.tools.utils import get_time_delta
 
 pytestmark = pytest.mark.django_db
 
@@ -14,7 +20,15 @@ def test_create_user(user_model, user_data):
     assert not new_user.is_active
 
 
-def test_is_blocked_annotation(user_model, active_user, blocked_user):
+def test_create_user_rolls_back_when_onboarding_fails(user_model, user_data):
+    with patch.object(Project.objects, 'bulk_create', side_effect=DatabaseError):
+        with pytest.raises(DatabaseError):
+            user_model.objects.create_user(**user_data)
+
+    assert not user_model.objects.filter(email=user_data['email']).exists()
+
+
+def test_is_blocked_column(user_model, active_user, blocked_user):
     orm_fetched_blocked_user = user_model.objects.get(id=blocked_user.id)
     orm_fetched_active_user = user_model.objects.get(id=active_user.id)
 
@@ -22,6 +36,18 @@ def test_is_blocked_annotation(user_model, active_user, blocked_user):
     assert orm_fetched_active_user.is_blocked is False
 
 
+def test_saving_blocked_until_updates_is_blocked(user_model, active_user):
+    active_user.blocked_until = get_time_delta({'days': 1})
+    active_user.save(update_fields=['blocked_until'])
+
+    assert user_model.objects.get(id=active_user.id).is_blocked is True
+
+
+def test_is_blocked_has_to_match_blocked_until(user_model, active_user):
+    with pytest.raises(IntegrityError):
+        user_model.objects.filter(id=active_user.id).update(is_blocked=True)
+
+
 def test_get_active_standard_users(user_model, active_user, non_active_user, blocked_user, admin_user):
     orm_fetched_active_users = user_model.objects.active_standard_users()
 
@@ -30,6 +30,6 @@ def test_get_ready_to_unblock_users(user_model, django_assert_num_queries):
 
 
 def test_user_list_view(client, active_user, active_user_batch, django_assert_num_queries):
-    with django_assert_num_queries(2):  # Initial query will contain a subquery executed for the annotated field
+    with django_assert_num_queries(2):
         client.force_authenticate(user=active_user)
         client.get(reverse('api:user-list'))
@@ -13,6 +13,7 @@ def test_user_detail_serializer(user_data, active_user):
     assert serializer.data.get("email") == user_data.get("email")
     assert serializer.data.get("username") == user_data.get("username")
     assert serializer.data.get("avatar") is None
+    assert serializer.data.get("avatar_renditions") is None
 
 
 def test_user_detail_serializer_with_valid_avatar(user_data, active_user):
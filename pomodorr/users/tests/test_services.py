@@ -0,0 +1,116 @@
+from datetime import timedelta
+
+import pytest
+from PIL import Image
+from django.conf import settings
+
+from pomodorr.projects.models import Priority, Project
+from pomodorr.user_settings.models import UserSetting
+from pomodorr.users.models import avatar_rendition_path
+from pomodorr.users.services import generate_avatar_renditions, onboard_users
+from pomodorr.users.tests.factories import prepare_file_bytes_to_upload, prepare_user
+
+pytestmark = pytest.mark.django_db
+
+
+def test_new_user_gets_default_workspace(active_user):
+    project = Project.objects.get(user=active_user)
+
+    assert UserSetting.objects.filter(user=active_user).exists()
+    assert project.name == 'Inbox'
+    assert project.priority.name == 'Normal'
+    assert project.priority.user == active_user
+
+
+def test_admin_does_not_get_workspace(admin_user):
+    assert not UserSetting.objects.filter(user=admin_user).exists()
+    assert not Project.objects.filter(user=admin_user).exists()
+
+
+def test_onboard_users_batches_inserts(user_model, django_assert_num_queries):
+    users = user_model.objects.bulk_create([user_model(username=f'user_{index}', email=f'user_{index}@pomodorr.tk')
+                                            for index in range(5)])
+
+    with django_assert_num_queries(5):  # The inserts are wrapped with a savepoint
+        onboard_users(users=users)
+
+    assert UserSetting.objects.filter(user__in=users).count() == 5
+    assert Priority.objects.filter(user__in=users).count() == 5
+    assert Project.objects.filter(user__in=users, priority__name='Normal').count() == 5
+
+
+def test_onboard_users_with_template(user_model):
+    users = user_model.objects.bulk_create([user_model(username='templated', email='templated@pomodorr.tk')])
+    template = {
+        'settings': {'pomodoro_length': timedelta(minutes=50)},
+        'priorities': [{'name': 'High', 'priority_level': 3}, {'name': 'Low'}],
+        'projects': [{'name': 'Work', 'priority': 'High'}, {'name': 'Home', 'priority': 'Low'}, {'name': 'Someday'}]
+    }
+
+    onboard_users(users=users, template=template)
+
+    assert UserSetting.objects.get(user=users[0]).pomodoro_length == timedelta(minutes=50)
+    assert list(Project.objects.filter(user=users[0]).order_by('user_defined_ordering').values_list(
+        'name', 'priority__name', 'priority__priority_level')) == [('Work', 'High', 3), ('Home', 'Low', 1),
+                                                                   ('Someday', None, None)]
+    #  The keys are spaced the same way the rebalancing spaces them, leaving room in front of the first project
+    assert list(Project.objects.filter(user=users[0]).order_by('user_defined_ordering').values_list(
+        'user_defined_ordering', flat=True)) == [settings.USER_DEFINED_ORDERING_GAP * key for key in (1, 2, 3)]
+
+
+def test_onboard_users_skips_staff(user_model):
+    users = prepare_user(number_of_users=1, is_staff=True)
+
+    onboard_users(users=users)
+
+    assert not Project.objects.filter(user__in=users).exists()
+
+
+class TestAvatarRenditions:
+    @pytest.fixture
+    def user_with_avatar(self, active_user):
+        active_user.avatar = prepare_file_bytes_to_upload(name='avatar.png', ext='png', image_mode='RGBA',
+                                                          size=(300, 200), color=(255, 0, 0, 128))
+        active_user.save()
+        return active_user
+
+    def test_generate_avatar_renditions(self, user_with_avatar, settings):
+        generate_avatar_renditions(user=user_with_avatar)
+
+        user_with_avatar.refresh_from_db()
+        storage = user_with_avatar.avatar.storage
+        assert user_with_avatar.avatar_renditions_source == user_with_avatar.avatar.name
+        for size in settings.AVATAR_RENDITION_SIZES:
+            for extension, image_format in settings.AVATAR_RENDITION_FORMATS.items():
+                with storage.open(avatar_rendition_path(user_with_avatar.avatar.name, size, extension)) as rendition:
+                    image = Image.open(rendition)
+                    assert (image.format, image.size) == (image_format, (size, size))
+
+    def test_avatar_rendition_urls(self, user_with_avatar):
+        assert user_with_avatar.get_avatar_rendition_urls() is None
+
+        generate_avatar_renditions(user=user_with_avatar)
+        user_with_avatar.refresh_from_db()
+
+        assert user_with_avatar.get_avatar_rendition_urls()['40']['webp'].endswith('avatar_40.webp')
+
+    def test_renditions_of_replaced_avatar_are_discarded(self, user_model, user_with_avatar):
+        user_model.objects.filter(id=user_with_avatar.id).update(avatar='users/replaced.png')
+
+        generate_avatar_renditions(user=user_with_avatar)
+
+        assert user_model.objects.get(id=user_with_avatar.id).avatar_renditions_source == ''
+        assert not user_with_avatar.avatar.storage.exists(
+            avatar_rendition_path(user_with_avatar.avatar.name, 40, 'webp'))
+
+    def test_renditions_of_previous_avatar_are_deleted(self, user_with_avatar):
+        generate_avatar_renditions(user=user_with_avatar)
+        user_with_avatar.refresh_from_db()
+        previous_avatar_name = user_with_avatar.avatar.name
+        user_with_avatar.avatar = prepare_file_bytes_to_upload(name='new.jpeg')
+        user_with_avatar.save()
+
+        generate_avatar_renditions(user=user_with_avatar)
+
+        assert not user_with_avatar.avatar.storage.exists(avatar_rendition_path(previous_avatar_name, 40, 'webp'))
+        assert user_with_avatar.avatar.storage.exists(avatar_rendition_path(user_with_avatar.avatar.name, 40, 'webp'))
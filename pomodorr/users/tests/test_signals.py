@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+import pytest
+
+from pomodorr.tools.utils import get_time_delta
+from pomodorr.users.tests.factories import prepare_file_bytes_to_upload
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def unblock_user_mock():
+    with patch('pomodorr.users.signals.handlers.transaction.on_commit', side_effect=lambda callback: callback()), \
+            patch('pomodorr.users.tasks.unblock_user.apply_async') as apply_async_mock:
+        yield apply_async_mock
+
+
+def test_blocking_user_schedules_unblocking(active_user, unblock_user_mock):
+    active_user.blocked_until = get_time_delta({'days': 1})
+    active_user.save()
+
+    unblock_user_mock.assert_called_once_with(kwargs={'user_id': str(active_user.id)}, eta=active_user.blocked_until)
+
+
+def test_saving_blocked_user_does_not_reschedule_unblocking(blocked_user, unblock_user_mock):
+    blocked_user.first_name = 'Changed'
+    blocked_user.save()
+
+    unblock_user_mock.assert_not_called()
+
+
+def test_saving_not_blocked_user_does_not_schedule_unblocking(active_user, unblock_user_mock):
+    active_user.first_name = 'Changed'
+    active_user.save()
+
+    unblock_user_mock.assert_not_called()
+
+
+def test_uploading_avatar_schedules_its_processing(active_user):
+    with patch('pomodorr.users.signals.handlers.transaction.on_commit', side_effect=lambda callback: callback()), \
+            patch('pomodorr.users.tasks.process_avatar.delay') as delay_mock:
+        active_user.avatar = prepare_file_bytes_to_upload()
+        active_user.save()
+        active_user.first_name = 'Changed'
+        active_user.save()
+
+    delay_mock.assert_called_once_with(user_id=str(active_user.id))
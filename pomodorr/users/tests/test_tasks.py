@@ -1,6 +1,8 @@
 import pytest
+from django.utils import timezone
 
-from pomodorr.users.tasks import unblock_users
+from pomodorr.frames.models import DateFrame
+from pomodorr.users.tasks import hard_delete_user, unblock_user, unblock_users
 
 
 @pytest.mark.django_db
@@ -10,3 +12,54 @@ def test_unblock_users(user_model, ready_to_unblock_user):
     unblock_users.apply()
 
     assert user_model.objects.ready_to_unblock_users().exists() is False
+
+
+@pytest.mark.django_db
+def test_unblock_user_unblocks_only_given_user(user_model, ready_to_unblock_user, active_user_batch):
+    other_user = user_model.objects.exclude(id=ready_to_unblock_user.id).first()
+    user_model.objects.filter(id=other_user.id).update(blocked_until=ready_to_unblock_user.blocked_until,
+                                                       is_blocked=True)
+
+    unblock_user.apply(kwargs={'user_id': str(ready_to_unblock_user.id)})
+
+    assert list(user_model.objects.ready_to_unblock_users()) == [other_user]
+
+
+@pytest.mark.django_db
+def test_unblock_user_keeps_extended_block(user_model, blocked_user):
+    unblock_user.apply(kwargs={'user_id': str(blocked_user.id)})
+
+    blocked_user.refresh_from_db()
+    assert blocked_user.blocked_until is not None
+
+
+@pytest.mark.django_db
+def test_hard_delete_user(user_model, active_user, sub_task_instance, date_frame_create_batch,
+                          date_frame_for_random_task):
+    user_model.objects.filter(id=active_user.id).update(is_active=False, deletion_requested_at=timezone.now())
+
+    hard_delete_user.apply(kwargs={'user_id': str(active_user.id)})
+
+    assert user_model.objects.filter(id=active_user.id).exists() is False
+    assert list(DateFrame.objects.values_list('id', flat=True)) == [date_frame_for_random_task.id]
+
+
+@pytest.mark.django_db
+def test_hard_delete_user_keeps_reactivated_user(user_model, active_user, date_frame_create_batch):
+    user_model.objects.filter(id=active_user.id).update(is_active=False, deletion_requested_at=timezone.now())
+    active_user.refresh_from_db()
+    active_user.is_active = True
+    active_user.save(update_fields=['is_active'])
+
+    hard_delete_user.apply(kwargs={'user_id': str(active_user.id)})
+
+    active_user.refresh_from_db()
+    assert active_user.deletion_requested_at is None
+    assert DateFrame.objects.count() == 5
+
+
+@pytest.mark.django_db
+def test_hard_delete_user_keeps_non_active_user_not_marked_for_deletion(user_model, non_active_user):
+    hard_delete_user.apply(kwargs={'user_id': str(non_active_user.id)})
+
+    assert user_model.objects.filter(id=non_active_user.id).exists()